@@ -17,6 +17,12 @@ except Exception:
 
 # Core components
 from .session.session import CatSession
+from .session.transport import TransportConfig
+from .session.retry import RetryPolicy
+from .session.rate_limit import RateLimit, RateLimiter
+from .session.cache import HttpCache
+from .session.replay import ReplayStore
+from .session.async_session import AsyncCatSession
 
 # Explorer components
 from .explorer.explore import (
@@ -27,6 +33,20 @@ from .explorer.explore import (
     ONSNomisCatExplorer,
     ONSGeoExplorer,
 )
+from .explorer.async_explore import (
+    AsyncCkanCatExplorer,
+    AsyncOpenDataSoftCatExplorer,
+    AsyncFrenchGouvCatExplorer,
+    AsyncONSNomisCatExplorer,
+)
+from .explorer.memo import MetadataCache
+from .explorer.snapshot import HarvestSnapshot
+from .explorer.records import PackageRecord, ResourceRecord
+from .explorer.search_index import CatalogueIndex
+from .explorer.catalogue_store import CatalogueStore
+from .explorer.diff import CatalogueDiff, Change, diff_records, hash_index
+from .explorer.federated import FederatedSearch, SearchHit, SourceResult
+from .utils.json_decoder import JsonDecoder, set_json_backend
 
 # Resource loader components
 from .loader.loader import (
@@ -58,6 +78,13 @@ from .errors.errors import (
 __all__ = [
     # Core
     "CatSession",
+    "TransportConfig",
+    "RetryPolicy",
+    "RateLimit",
+    "RateLimiter",
+    "HttpCache",
+    "ReplayStore",
+    "AsyncCatSession",
     # Explorers
     "CkanCatExplorer",
     "DataPressCatExplorer",
@@ -66,6 +93,25 @@ __all__ = [
     "ONSNomisCatExplorer",
     "DataPressCatExplorer",
     "ONSGeoExplorer",
+    "AsyncCkanCatExplorer",
+    "AsyncOpenDataSoftCatExplorer",
+    "AsyncFrenchGouvCatExplorer",
+    "AsyncONSNomisCatExplorer",
+    "MetadataCache",
+    "HarvestSnapshot",
+    "PackageRecord",
+    "ResourceRecord",
+    "CatalogueIndex",
+    "CatalogueStore",
+    "CatalogueDiff",
+    "Change",
+    "diff_records",
+    "hash_index",
+    "FederatedSearch",
+    "SearchHit",
+    "SourceResult",
+    "JsonDecoder",
+    "set_json_backend",
     # Resource Loaders
     "CkanLoader",
     "OpenDataSoftLoader",
@@ -0,0 +1,391 @@
+import asyncio
+
+from typing import Any, Dict, Iterable, List, Optional, Union
+from loguru import logger
+
+from ..config.source_endpoints import (
+    CkanApiPaths,
+    OpenDataSoftApiPaths,
+    FrenchGouvApiPaths,
+    ONSNomisApiPaths,
+)
+from ..errors.errors import CatExplorerError, WrongCatalogueError
+from ..session.async_session import AsyncCatSession, aiohttp
+from ..session.session import CatalogueType
+from .explore import CkanCatExplorer
+
+# Async versions of the explorers
+# They return the same data structures as their sync counterparts
+# Bounded concurrency, retries and rate limits all come from the AsyncCatSession
+
+
+def _check_catalogue_type(
+    cat_session: AsyncCatSession, expected: CatalogueType, explorer_name: str
+) -> None:
+    """Make sure an explorer has been given a session for the right catalogue type."""
+    if not hasattr(cat_session, "catalogue_type"):
+        raise WrongCatalogueError(
+            "AsyncCatSession missing catalogue_type attribute",
+            expected_catalogue=str(expected),
+            received_catalogue="Unknown",
+        )
+
+    if cat_session.catalogue_type != expected:
+        raise WrongCatalogueError(
+            f"Invalid catalogue type. {explorer_name} requires a {expected.value} catalogue session.",
+            expected_catalogue=str(expected),
+            received_catalogue=str(cat_session.catalogue_type),
+        )
+
+
+# FIND THE DATA YOU WANT / NEED / ISOLATE PACKAGES AND RESOURCES
+# For Ckan Catalogues Only
+class AsyncCkanCatExplorer:
+    def __init__(self, cat_session: AsyncCatSession):
+        """
+        Takes in an AsyncCatSession.
+
+        Async version of CkanCatExplorer for harvesting large catalogues.
+
+        # Example usage...
+        import asyncio
+        import HerdingCats as hc
+
+        async def main():
+            async with hc.AsyncCatSession(hc.CkanDataCatalogues.UK_GOV) as session:
+                explore = hc.AsyncCkanCatExplorer(session)
+                packages = await explore.get_package_list()
+                info = await explore.show_package_info_many(list(packages)[:500])
+
+        if __name__ == "__main__":
+            asyncio.run(main())
+        """
+        _check_catalogue_type(cat_session, CatalogueType.CKAN, "AsyncCkanCatExplorer")
+        self.cat_session = cat_session
+
+    async def get_package_count(
+        self,
+        organisation: Optional[str] = None,
+        tags: Optional[Union[str, List[str]]] = None,
+        res_format: Optional[str] = None,
+    ) -> int:
+        """
+        Return the number of packages in the catalogue, counted server side.
+
+        Args:
+            organisation: Only count packages published by this organisation
+            tags: Only count packages with this tag, or all of these tags
+            res_format: Only count packages with a resource in this format
+
+        Returns:
+            package_count: int
+        """
+        filter_query = CkanCatExplorer._build_filter_query(organisation, tags, res_format)
+        params = {"rows": 0}
+        if filter_query:
+            params["fq"] = filter_query
+
+        try:
+            data = await self.cat_session.get_json(
+                CkanApiPaths.PACKAGE_SEARCH, params=params
+            )
+            return int(data["result"]["count"])
+        except (aiohttp.ClientError, asyncio.TimeoutError, KeyError, TypeError, ValueError) as e:
+            if filter_query:
+                raise CatExplorerError(f"Failed to get package count: {str(e)}")
+            logger.warning(
+                f"package_search count failed, falling back to package_list: {e}"
+            )
+
+        try:
+            data = await self.cat_session.get_json(CkanApiPaths.PACKAGE_LIST)
+            return len(data["result"])
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Failed to get package count: {e}")
+            raise CatExplorerError(f"Failed to get package count: {str(e)}")
+
+    async def get_package_list(self) -> dict:
+        """
+        Explore all packages that are available to query as a dictionary.
+
+        Returns:
+            Dictionary following a {"package_name": "package_name"} structure
+        """
+        try:
+            data = await self.cat_session.get_json(CkanApiPaths.PACKAGE_LIST)
+            return {item: item for item in data["result"]}
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise CatExplorerError(f"Failed to search datasets: {str(e)}")
+
+    async def package_search(self, search_query: str, num_rows: int) -> dict:
+        """
+        Returns all available data for a particular search query.
+
+        Args:
+            search_query: str
+            num_rows: int
+
+        Returns:
+            dict: The package_search result with "count" and "results" keys
+        """
+        params = {"q": search_query, "rows": num_rows} if search_query else None
+        try:
+            data = await self.cat_session.get_json(
+                CkanApiPaths.PACKAGE_SEARCH, params=params
+            )
+            logger.success(f"Showing results for query: {search_query}")
+            return data["result"]
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise CatExplorerError(f"Failed to search datasets: {str(e)}")
+
+    async def show_package_info(
+        self, package_name: Union[str, dict, Any], api_key=None
+    ) -> List[Dict]:
+        """
+        Return package metadata including resource information and download links.
+
+        Args:
+            package_name: Union[str, dict, Any]
+
+        Returns:
+            List[Dict]: One dictionary per resource, same as CkanCatExplorer.show_package_info
+        """
+        if package_name is None:
+            raise ValueError("package name cannot be none")
+
+        headers = {"Authorization": api_key} if api_key else None
+        try:
+            data = await self.cat_session.get_json(
+                CkanApiPaths.PACKAGE_INFO, params={"id": package_name}, headers=headers
+            )
+            return CkanCatExplorer._extract_resource_data(data["result"])
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise CatExplorerError(f"Failed to search datasets: {str(e)}")
+
+    async def show_package_info_many(
+        self, package_names: Iterable[str], api_key=None
+    ) -> Dict[str, List[Dict]]:
+        """
+        Fetch package metadata for many packages concurrently.
+
+        Concurrency is bounded by the session's max_concurrency.
+        Packages that fail are logged and left out of the results.
+
+        Args:
+            package_names: Iterable of package names or ids
+
+        Returns:
+            Dict[str, List[Dict]]: package name -> show_package_info result
+        """
+        names = list(package_names)
+        results = await asyncio.gather(
+            *(self.show_package_info(name, api_key) for name in names),
+            return_exceptions=True,
+        )
+
+        packages = {}
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error fetching package {name}: {str(result)}")
+                continue
+            packages[name] = result
+
+        logger.success(f"Finished fetching {len(packages)} of {len(names)} packages")
+        return packages
+
+
+# FIND THE DATA YOU WANT / NEED / ISOLATE PACKAGES AND RESOURCES
+# For Open Datasoft Catalogues Only
+class AsyncOpenDataSoftCatExplorer:
+    def __init__(self, cat_session: AsyncCatSession):
+        """
+        Takes in an AsyncCatSession.
+
+        Async version of OpenDataSoftCatExplorer.
+        """
+        _check_catalogue_type(
+            cat_session, CatalogueType.OPENDATA_SOFT, "AsyncOpenDataSoftCatExplorer"
+        )
+        self.cat_session = cat_session
+
+    async def fetch_all_datasets(self, limit: int = 100) -> dict | None:
+        """
+        Fetch every dataset in the catalogue as a {title: dataset_id} dictionary.
+
+        The first page gives the total count, the remaining pages are fetched concurrently.
+        """
+        for path in (
+            OpenDataSoftApiPaths.SHOW_DATASETS,
+            OpenDataSoftApiPaths.SHOW_DATASETS_2,
+        ):
+            try:
+                first_page = await self.cat_session.get_json(
+                    path, params={"offset": 0, "limit": limit}
+                )
+                total_count = first_page.get("total_count", 0)
+                pages = [first_page] + list(
+                    await asyncio.gather(
+                        *(
+                            self.cat_session.get_json(
+                                path, params={"offset": offset, "limit": limit}
+                            )
+                            for offset in range(limit, total_count, limit)
+                        )
+                    )
+                )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning(f"Failed to fetch datasets from {path}: {e}")
+                continue
+
+            dataset_dict = {}
+            for page in pages:
+                for dataset_info in page.get("datasets", []):
+                    dataset = dataset_info.get("dataset", {})
+                    title = dataset.get("metas", {}).get("default", {}).get("title")
+                    if title and "dataset_id" in dataset:
+                        dataset_dict[title] = dataset["dataset_id"]
+
+            if dataset_dict:
+                logger.success(f"Total Datasets Found: {total_count}")
+                return dataset_dict
+
+        logger.warning("No datasets were retrieved.")
+        return None
+
+    async def show_dataset_info(self, dataset_id: str) -> dict:
+        """Return the metadata for a dataset."""
+        last_error = None
+        for path in (
+            OpenDataSoftApiPaths.SHOW_DATASET_INFO.format(dataset_id),
+            OpenDataSoftApiPaths.SHOW_DATASET_INFO_2.format(dataset_id),
+        ):
+            try:
+                return await self.cat_session.get_json(path)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                last_error = e
+        raise CatExplorerError(
+            f"Failed to fetch dataset: {str(last_error)}. Are you sure this dataset exists? Check again."
+        )
+
+    async def show_dataset_export_options(self, dataset_id: str) -> List[Dict]:
+        """Return the export formats and download links for a dataset."""
+        last_error = None
+        for path in (
+            OpenDataSoftApiPaths.SHOW_DATASET_EXPORTS.format(dataset_id),
+            OpenDataSoftApiPaths.SHOW_DATASET_EXPORTS_2.format(dataset_id),
+        ):
+            try:
+                data = await self.cat_session.get_json(path)
+                return [
+                    {"format": link["rel"], "download_url": link["href"]}
+                    for link in data["links"]
+                    if link["rel"] != "self"
+                ]
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                last_error = e
+        raise CatExplorerError(
+            f"Failed to fetch dataset: {str(last_error)}. Are you sure this dataset exists? Check again."
+        )
+
+
+# FIND THE DATA YOU WANT / NEED / ISOLATE PACKAGES AND RESOURCES
+# For French Gouv data catalogue Only
+class AsyncFrenchGouvCatExplorer:
+    def __init__(self, cat_session: AsyncCatSession):
+        """
+        Takes in an AsyncCatSession.
+
+        Async version of FrenchGouvCatExplorer.
+        """
+        _check_catalogue_type(
+            cat_session, CatalogueType.GOUV_FR, "AsyncFrenchGouvCatExplorer"
+        )
+        self.cat_session = cat_session
+
+    async def search_datasets(self, query: str) -> list[dict]:
+        """Fetch a list of datasets using a search query."""
+        try:
+            data = await self.cat_session.get_json(
+                FrenchGouvApiPaths.SEARCH_DATASETS, params={"q": query}
+            )
+            results = data.get("data", data.get("results", data.get("datasets", [])))
+            logger.success(f"Found {len(results)} datasets for query '{query}'")
+            return results
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Error searching datasets with query '{query}': {str(e)}")
+            return []
+
+    async def get_dataset_meta(self, identifier: str) -> dict:
+        """
+        Fetch the metadata for a dataset using either its ID or slug.
+
+        Returns:
+            dict: Dataset details or empty dict if not found
+        """
+        try:
+            return await self.cat_session.get_json(
+                FrenchGouvApiPaths.SHOW_DATASETS_BY_ID.format(identifier)
+            )
+        except aiohttp.ClientResponseError as e:
+            if e.status == 404:
+                logger.warning(f"Dataset not found: {identifier}")
+            else:
+                logger.error(
+                    f"Failed to fetch dataset {identifier} with status code {e.status}"
+                )
+            return {}
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Error fetching dataset {identifier}: {str(e)}")
+            return {}
+
+    async def get_multiple_datasets_meta(self, identifiers: Iterable[str]) -> dict:
+        """
+        Fetch many datasets concurrently.
+
+        Returns:
+            dict: Dictionary mapping identifiers to their dataset details
+        """
+        identifiers = list(identifiers)
+        datasets = await asyncio.gather(
+            *(self.get_dataset_meta(identifier) for identifier in identifiers)
+        )
+        results = {
+            identifier: dataset
+            for identifier, dataset in zip(identifiers, datasets)
+            if dataset
+        }
+        logger.success(f"Finished fetching {len(results)} datasets")
+        return results
+
+
+# FIND THE DATA YOU WANT / NEED / ISOLATE PACKAGES AND RESOURCES
+# For ONS Nomis data catalogue Only
+class AsyncONSNomisCatExplorer:
+    def __init__(self, cat_session: AsyncCatSession):
+        """
+        Takes in an AsyncCatSession.
+
+        Async version of ONSNomisCatExplorer.
+        """
+        _check_catalogue_type(
+            cat_session, CatalogueType.ONS_NOMIS, "AsyncONSNomisCatExplorer"
+        )
+        self.cat_session = cat_session
+
+    async def get_dataset_info(self, dataset_id: str) -> dict:
+        """Get the metadata for a specific dataset"""
+        try:
+            return await self.cat_session.get_json(
+                ONSNomisApiPaths.SHOW_DATASET_INFO.format(dataset_id)
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise CatExplorerError(f"Failed to search datasets: {str(e)}")
+
+    async def get_codelist_meta_info(self, codelist_id: str) -> dict:
+        """Get the metadata for a specific codelist"""
+        try:
+            return await self.cat_session.get_json(
+                ONSNomisApiPaths.SHOW_CODELIST_DETAILS.format(codelist_id)
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise CatExplorerError(f"Failed to search datasets: {str(e)}")
@@ -0,0 +1,475 @@
+from __future__ import annotations
+
+import os
+import re
+import shutil
+
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Optional, Tuple, Union
+from loguru import logger
+
+from ..errors.errors import CatExplorerError
+from ..session.session import CatSession, CatalogueType
+from ..utils.lazy_imports import LazyModule
+from .diff import ADDED, MODIFIED, REMOVED, Change
+from .explore import (
+    CkanCatExplorer,
+    DataPressCatExplorer,
+    ONSNomisCatExplorer,
+    OpenDataSoftCatExplorer,
+)
+
+pd = LazyModule("pandas")
+pl = LazyModule("polars")
+pa = LazyModule("pyarrow")
+pq = LazyModule("pyarrow.parquet", "pyarrow")
+duckdb = LazyModule("duckdb")
+
+# One row per resource. Datasets without resources are a single row with empty resource fields
+SNAPSHOT_COLUMNS = (
+    "catalogue_type",
+    "package_id",
+    "package_name",
+    "title",
+    "description",
+    "organisation",
+    "tags",
+    "metadata_modified",
+    "resource_id",
+    "resource_name",
+    "resource_format",
+    "resource_url",
+)
+
+# Columns compared when diffing snapshots
+_HASHED_COLUMNS = ", ".join(column for column in SNAPSHOT_COLUMNS if column != "package_id")
+
+_PARTITION_FILE = "part-0.parquet"
+_UNSAFE = re.compile(r"[^\w.-]+")
+
+
+def _schema() -> "pa.Schema":
+    return pa.schema(
+        [
+            (column, pa.list_(pa.string()) if column == "tags" else pa.string())
+            for column in SNAPSHOT_COLUMNS
+        ]
+    )
+
+
+def _row(
+    catalogue_type: CatalogueType, resource: Optional[Dict[str, Any]] = None, **package: Any
+) -> Dict[str, Any]:
+    resource = resource or {}
+    return {
+        "catalogue_type": catalogue_type.value,
+        **package,
+        "resource_id": resource.get("id"),
+        "resource_name": resource.get("name"),
+        "resource_format": resource.get("format"),
+        "resource_url": resource.get("url"),
+    }
+
+
+class CatalogueStore:
+    """
+    Local Parquet snapshots of catalogue metadata, queryable with DuckDB.
+
+    Each snapshot holds one row per resource for every package in a catalogue. Snapshots are
+    partitioned by source (the session's domain) and harvest date:
+
+        root/source=<domain>/harvest_date=<YYYY-MM-DD>/part-0.parquet
+
+    Taking a second snapshot of a source on the same day replaces the first. Older days are
+    kept, so changes to a catalogue can be tracked over time.
+
+    connect() returns a DuckDB connection with two views over every snapshot in the store:
+    catalogue_snapshots, holding every harvest, and catalogue, holding the latest harvest of
+    each source. Only the Parquet files are read, so discovery queries across many portals run
+    locally without touching the network.
+
+    Supports CKAN, OpenDataSoft, DataPress and ONS Nomis sessions. Rows from any other source
+    can be written with write().
+
+    Args:
+        root: Directory the snapshots are written to
+
+    # Example usage...
+    import HerdingCats as hc
+
+    def main():
+        store = hc.CatalogueStore("catalogue_snapshots")
+
+        with hc.CatSession(hc.CkanDataCatalogues.LONDON_DATA_STORE) as session:
+            store.snapshot(session)
+        with hc.CatSession(hc.OpenDataSoftDataCatalogues.UK_POWER_NETWORKS_DNO) as session:
+            store.snapshot(session)
+
+        df = store.query(
+            "SELECT source, title, resource_url FROM catalogue "
+            "WHERE resource_format = 'CSV' AND title ILIKE '%energy%'"
+        )
+        print(df)
+
+    if __name__ == "__main__":
+        main()
+    """
+
+    def __init__(self, root: Union[str, Path]) -> None:
+        self.root = Path(root).expanduser()
+
+    # ----------------------------
+    # Write snapshots
+    # ----------------------------
+    def snapshot(
+        self,
+        session: CatSession,
+        harvest_date: Optional[date] = None,
+        page_size: int = 1000,
+        max_workers: int = 1,
+    ) -> Path:
+        """
+        Harvest a catalogue's package and resource metadata and write it as a snapshot.
+
+        Args:
+            session: Session for the catalogue to snapshot
+            harvest_date: Partition to write to, defaults to today
+            page_size: Packages per request, for CKAN catalogues
+            max_workers: Pages requested in parallel, for CKAN catalogues
+
+        Returns:
+            Path: The Parquet file written
+        """
+        match session.catalogue_type:
+            case CatalogueType.CKAN:
+                explorer = CkanCatExplorer(session)
+                rows = self._ckan_rows(
+                    explorer.harvest_package_records(page_size, max_workers)
+                )
+            case CatalogueType.OPENDATA_SOFT:
+                explorer = OpenDataSoftCatExplorer(session)
+                rows = self._opendatasoft_rows(explorer.iter_datasets())
+            case CatalogueType.DATA_PRESS:
+                explorer = DataPressCatExplorer(session)
+                rows = self._datapress_rows(explorer.get_all_datasets_metadata())
+            case CatalogueType.ONS_NOMIS:
+                explorer = ONSNomisCatExplorer(session)
+                rows = self._nomis_rows(explorer.get_all_datasets())
+            case _:
+                raise ValueError(
+                    f"Snapshots are not supported for {session.catalogue_type} catalogues"
+                )
+
+        return self.write(session.domain, rows, harvest_date)
+
+    def write(
+        self,
+        source: str,
+        rows: Iterable[Dict[str, Any]],
+        harvest_date: Optional[date] = None,
+    ) -> Path:
+        """
+        Write rows as the snapshot of a source, replacing any snapshot from the same day.
+
+        Rows are dictionaries keyed by the names in SNAPSHOT_COLUMNS. Missing keys are
+        written as nulls and extra keys are ignored.
+
+        Args:
+            source: Name of the catalogue, used as the source partition
+            rows: One dictionary per resource
+            harvest_date: Partition to write to, defaults to today
+
+        Returns:
+            Path: The Parquet file written
+        """
+        harvest_date = harvest_date or date.today()
+        partition = self._partition(source, harvest_date)
+        partition.mkdir(parents=True, exist_ok=True)
+
+        columns: Dict[str, List[Any]] = {column: [] for column in SNAPSHOT_COLUMNS}
+        for row in rows:
+            for column, values in columns.items():
+                values.append(row.get(column))
+        table = pa.Table.from_pydict(columns, schema=_schema())
+
+        target = partition / _PARTITION_FILE
+        temporary = partition / f".{_PARTITION_FILE}.tmp"
+        pq.write_table(table, temporary, compression="zstd")
+        os.replace(temporary, target)
+        logger.success(
+            f"Wrote snapshot of {source} with {table.num_rows} rows to {target}"
+        )
+        return target
+
+    def delete(self, source: str, harvest_date: Optional[date] = None) -> None:
+        """Delete one snapshot of a source, or every snapshot of it if no date is given."""
+        if harvest_date is None:
+            shutil.rmtree(self.root / f"source={self._safe(source)}", ignore_errors=True)
+        else:
+            shutil.rmtree(self._partition(source, harvest_date), ignore_errors=True)
+
+    def snapshots(self) -> List[Tuple[str, date]]:
+        """
+        List the snapshots in the store.
+
+        Returns:
+            List[Tuple[str, date]]: (source, harvest date) pairs, oldest first per source
+        """
+        found = []
+        for path in self._files():
+            source = path.parent.parent.name.split("=", 1)[1]
+            harvested = date.fromisoformat(path.parent.name.split("=", 1)[1])
+            found.append((source, harvested))
+        return sorted(found)
+
+    # ----------------------------
+    # Query snapshots
+    # ----------------------------
+    def connect(self, database: str = ":memory:") -> "duckdb.DuckDBPyConnection":
+        """
+        Open a DuckDB connection with views over the snapshots.
+
+        catalogue_snapshots holds every snapshot, with source and harvest_date columns.
+        catalogue holds only the latest snapshot of each source.
+
+        Args:
+            database: DuckDB database to open, in memory by default
+
+        Returns:
+            duckdb.DuckDBPyConnection
+        """
+        if not any(self._files()):
+            raise CatExplorerError(f"No catalogue snapshots found in {self.root}")
+
+        # Views can't take prepared parameters, so the path is quoted into the SQL
+        pattern = str(self.root.resolve() / "source=*" / "harvest_date=*" / "*.parquet")
+        pattern = pattern.replace("'", "''")
+        con = duckdb.connect(database)
+        con.execute(
+            "CREATE OR REPLACE VIEW catalogue_snapshots AS SELECT * FROM read_parquet("
+            f"'{pattern}', hive_partitioning = true, union_by_name = true)"
+        )
+        con.execute(
+            "CREATE OR REPLACE VIEW catalogue AS "
+            "SELECT * FROM catalogue_snapshots "
+            "QUALIFY harvest_date = max(harvest_date) OVER (PARTITION BY source)"
+        )
+        return con
+
+    def query(
+        self, sql: str, df_type: Literal["pandas", "polars"] = "polars"
+    ) -> Union["pd.DataFrame", "pl.DataFrame"]:
+        """
+        Run a SQL query against the catalogue and catalogue_snapshots views.
+
+        Args:
+            sql: DuckDB SQL
+            df_type: Type of dataframe returned
+
+        Returns:
+            The result as a pandas or polars DataFrame
+        """
+        with self.connect() as con:
+            result = con.sql(sql)
+            match df_type:
+                case "polars":
+                    return result.pl()
+                case "pandas":
+                    return result.df()
+                case _:
+                    raise ValueError(f"Unsupported df_type: {df_type}")
+
+    def diff(
+        self,
+        source: str,
+        old_date: Optional[date] = None,
+        new_date: Optional[date] = None,
+        level: Literal["package", "resource"] = "package",
+        batch_size: int = 1000,
+    ) -> Iterator[Change]:
+        """
+        Compare two snapshots of a source, yielding what was added, removed or modified.
+
+        Every row is hashed in DuckDB and only the keys whose hashes differ are returned, a
+        batch at a time, so even catalogues with millions of resources are diffed without
+        loading them into Python.
+
+        Args:
+            source: Source to compare, as passed to write() or the session's domain
+            old_date: Earlier snapshot, defaults to the second most recent
+            new_date: Later snapshot, defaults to the most recent
+            level: Compare whole packages, or individual resources
+            batch_size: Rows fetched from DuckDB at a time
+
+        Returns:
+            Iterator[Change]: Keyed by package id, or (package id, resource id) for resources.
+            Each record holds the package name and, for resources, the format and url
+
+        # Example usage...
+        import HerdingCats as hc
+
+        def main():
+            store = hc.CatalogueStore("catalogue_snapshots")
+            with hc.CatSession(hc.CkanDataCatalogues.LONDON_DATA_STORE) as session:
+                store.snapshot(session)
+
+                changes = store.diff(session.domain, level="resource")
+                for change in changes:
+                    if change.kind != "removed":
+                        print(change.record["resource_url"])
+
+        if __name__ == "__main__":
+            main()
+        """
+        dates = [d for s, d in self.snapshots() if s == self._safe(source)]
+        new_date = new_date or (dates[-1] if dates else None)
+        earlier = [d for d in dates if new_date and d < new_date]
+        old_date = old_date or (earlier[-1] if earlier else None)
+        if old_date is None or new_date is None:
+            raise CatExplorerError(f"Need two snapshots of {source} to diff")
+
+        paths = []
+        for harvest_date in (old_date, new_date):
+            path = self._partition(source, harvest_date) / _PARTITION_FILE
+            if not path.exists():
+                raise CatExplorerError(f"No snapshot of {source} for {harvest_date}")
+            paths.append(str(path.resolve()))
+
+        package_key = "coalesce(package_id, package_name)"
+        if level == "package":
+            keyed = (
+                f"SELECT {package_key} AS key, any_value(package_name) AS package_name, "
+                f"hash(list(hash({_HASHED_COLUMNS}) ORDER BY hash({_HASHED_COLUMNS}))) AS digest "
+                "FROM read_parquet(?) GROUP BY ALL"
+            )
+            fields = ("package_name",)
+        elif level == "resource":
+            keyed = (
+                f"SELECT [{package_key}, coalesce(resource_id, resource_url, '')] AS key, "
+                "package_name, resource_format, resource_url, "
+                f"hash({_HASHED_COLUMNS}) AS digest FROM read_parquet(?)"
+            )
+            fields = ("package_name", "resource_format", "resource_url")
+        else:
+            raise ValueError(f"Unsupported level: {level}")
+
+        selected = ", ".join(
+            f"CASE WHEN new.key IS NULL THEN old.{field} ELSE new.{field} END"
+            for field in fields
+        )
+        sql = (
+            f"WITH old AS ({keyed}), new AS ({keyed}) "
+            "SELECT CASE WHEN old.key IS NULL THEN ? WHEN new.key IS NULL THEN ? ELSE ? END, "
+            f"coalesce(new.key, old.key), {selected} "
+            "FROM old FULL OUTER JOIN new ON old.key = new.key "
+            "WHERE old.digest IS DISTINCT FROM new.digest"
+        )
+
+        with duckdb.connect() as con:
+            cursor = con.execute(sql, [*paths, ADDED, REMOVED, MODIFIED])
+            while batch := cursor.fetchmany(batch_size):
+                for kind, key, *values in batch:
+                    yield Change(
+                        kind,
+                        tuple(key) if level == "resource" else key,
+                        dict(zip(fields, values)),
+                    )
+
+    # ----------------------------
+    # Paths
+    # ----------------------------
+    @staticmethod
+    def _safe(source: str) -> str:
+        return _UNSAFE.sub("_", source)
+
+    def _partition(self, source: str, harvest_date: date) -> Path:
+        return (
+            self.root
+            / f"source={self._safe(source)}"
+            / f"harvest_date={harvest_date.isoformat()}"
+        )
+
+    def _files(self) -> Iterator[Path]:
+        return self.root.glob(f"source=*/harvest_date=*/{_PARTITION_FILE}")
+
+    # ----------------------------
+    # Per catalogue rows
+    # ----------------------------
+    @staticmethod
+    def _ckan_rows(records) -> Iterator[Dict[str, Any]]:
+        for record in records:
+            package = {
+                "package_id": record.id,
+                "package_name": record.name,
+                "title": record.title,
+                "description": record.notes,
+                "organisation": record.organisation,
+                "tags": list(record.tags),
+                "metadata_modified": record.metadata_modified,
+            }
+            resources = [
+                {
+                    "id": resource.id,
+                    "name": resource.name,
+                    "format": resource.format,
+                    "url": resource.url,
+                }
+                for resource in record.resources
+            ] or [None]
+            for resource in resources:
+                yield _row(CatalogueType.CKAN, resource, **package)
+
+    @staticmethod
+    def _opendatasoft_rows(datasets: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        # OpenDataSoft datasets are tables with exports rather than lists of files
+        for dataset in datasets:
+            metas = (dataset.get("metas") or {}).get("default") or {}
+            keywords = metas.get("keyword") or []
+            yield _row(
+                CatalogueType.OPENDATA_SOFT,
+                package_id=dataset.get("dataset_id"),
+                package_name=dataset.get("dataset_id"),
+                title=metas.get("title"),
+                description=metas.get("description"),
+                organisation=metas.get("publisher"),
+                tags=[keywords] if isinstance(keywords, str) else list(keywords),
+                metadata_modified=metas.get("modified"),
+            )
+
+    @staticmethod
+    def _datapress_rows(datasets: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        for dataset in datasets:
+            package = {
+                "package_id": dataset.get("id"),
+                "package_name": dataset.get("slug") or dataset.get("id"),
+                "title": dataset.get("title"),
+                "description": dataset.get("description"),
+                "organisation": dataset.get("publisher"),
+                "tags": None,
+                "metadata_modified": dataset.get("updatedAt"),
+            }
+            resources = dataset.get("resources") or {}
+            if isinstance(resources, dict):
+                resources = [{"id": key, **value} for key, value in resources.items()]
+            resources = [
+                {
+                    "id": resource.get("id"),
+                    "name": resource.get("title"),
+                    "format": (resource.get("format") or "").upper() or None,
+                    "url": resource.get("url"),
+                }
+                for resource in resources
+            ] or [None]
+            for resource in resources:
+                yield _row(CatalogueType.DATA_PRESS, resource, **package)
+
+    @staticmethod
+    def _nomis_rows(datasets: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        for dataset in datasets:
+            yield _row(
+                CatalogueType.ONS_NOMIS,
+                package_id=dataset.get("id"),
+                package_name=dataset.get("id"),
+                title=dataset.get("name"),
+            )
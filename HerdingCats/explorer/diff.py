@@ -0,0 +1,222 @@
+import hashlib
+import json
+
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+ADDED = "added"
+REMOVED = "removed"
+MODIFIED = "modified"
+
+# A field name, or a function returning the key of a record
+KeyFunc = Union[str, Callable[[Any], Hashable]]
+
+
+def record_hash(record: Any) -> str:
+    """
+    Hash a record so it can be compared with a later version of itself.
+
+    Records are serialised as JSON with sorted keys, so the hash is the same whatever
+    order the catalogue returned the fields in, and the same from one run to the next.
+    """
+    encoded = json.dumps(record, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _combined_hash(hashes: List[str]) -> str:
+    # Sorted so the rows sharing a key can come back in any order
+    if len(hashes) == 1:
+        return hashes[0]
+    digest = hashlib.blake2b(digest_size=16)
+    for row_hash in sorted(hashes):
+        digest.update(row_hash.encode("ascii"))
+    return digest.hexdigest()
+
+
+class Change:
+    """
+    A dataset or resource that was added, removed or modified between two snapshots.
+
+    Args:
+        kind: "added", "removed" or "modified"
+        key: Key identifying the record
+        record: The record as it is now, if available. A list of rows when several
+        records share the key
+    """
+
+    __slots__ = ("kind", "key", "record")
+
+    def __init__(self, kind: str, key: Hashable, record: Any = None) -> None:
+        self.kind = kind
+        self.key = key
+        self.record = record
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Change):
+            return NotImplemented
+        return (self.kind, self.key, self.record) == (other.kind, other.key, other.record)
+
+    def __repr__(self) -> str:
+        return f"Change(kind={self.kind!r}, key={self.key!r})"
+
+
+class CatalogueDiff:
+    """
+    The keys added, removed and modified between two snapshots.
+
+    Build one from a stream of changes with CatalogueDiff.from_changes, when the sets are
+    more convenient than the stream.
+    """
+
+    __slots__ = ("added", "removed", "modified")
+
+    def __init__(
+        self,
+        added: Optional[Set[Hashable]] = None,
+        removed: Optional[Set[Hashable]] = None,
+        modified: Optional[Set[Hashable]] = None,
+    ) -> None:
+        self.added = added or set()
+        self.removed = removed or set()
+        self.modified = modified or set()
+
+    @classmethod
+    def from_changes(cls, changes: Iterable[Change]) -> "CatalogueDiff":
+        diff = cls()
+        for change in changes:
+            getattr(diff, change.kind).add(change.key)
+        return diff
+
+    @property
+    def changed(self) -> Set[Hashable]:
+        """Keys that need fetching again: added or modified."""
+        return self.added | self.modified
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.removed) + len(self.modified)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __repr__(self) -> str:
+        return (
+            f"CatalogueDiff(added={len(self.added)}, removed={len(self.removed)}, "
+            f"modified={len(self.modified)})"
+        )
+
+
+def _keyed(records: Any, key: Optional[KeyFunc]) -> Iterator[Tuple[Hashable, Any]]:
+    if isinstance(records, Mapping):
+        yield from records.items()
+        return
+    if key is None:
+        raise ValueError("key is required when records are not a mapping")
+    get_key = (lambda record: record[key]) if isinstance(key, str) else key
+    for record in records:
+        yield get_key(record), record
+
+
+def _grouped(records: Any, key: Optional[KeyFunc]) -> Iterator[Tuple[Hashable, List[Any]]]:
+    # Adjacent records sharing a key, such as the resource rows of one package
+    rows: List[Any] = []
+    current: Hashable = None
+    for record_key, record in _keyed(records, key):
+        if rows and record_key != current:
+            yield current, rows
+            rows = []
+        current = record_key
+        rows.append(record)
+    if rows:
+        yield current, rows
+
+
+def hash_index(records: Any, key: Optional[KeyFunc] = None) -> Dict[Hashable, str]:
+    """
+    Map each record's key to its hash.
+
+    The index is all diff_records needs of the old snapshot, so it can be saved in place
+    of the records themselves. When several records share a key, e.g. the resource rows
+    of a package keyed by package name, their hashes are combined into one, so a change
+    to any of them changes the key's hash.
+
+    Args:
+        records: A mapping of key to record, or an iterable of records
+        key: Field name or function giving each record's key, if records is not a mapping
+
+    Returns:
+        Dict: Key to the hash of every record with that key
+    """
+    hashes: Dict[Hashable, List[str]] = {}
+    for record_key, record in _keyed(records, key):
+        hashes.setdefault(record_key, []).append(record_hash(record))
+    return {record_key: _combined_hash(row_hashes) for record_key, row_hashes in hashes.items()}
+
+
+def diff_records(
+    old: Any,
+    new: Any,
+    key: Optional[KeyFunc] = None,
+    old_hashes: bool = False,
+) -> Iterator[Change]:
+    """
+    Compare two snapshots of catalogue metadata by hashing their records.
+
+    Only a hash per record of the old snapshot is held in memory. The new snapshot is
+    streamed: added and modified records are yielded as they are read, and removed
+    records once it is exhausted. That lets a loader start fetching changes while the
+    new snapshot is still being harvested.
+
+    Works on the dictionaries returned by get_package_list or fetch_all_datasets, on
+    harvest rows, or on any iterable of records with a key field. Records sharing a key
+    are compared together, as in hash_index, so a package's harvest rows are reported as
+    one change when any of its resources changes. In the new snapshot those records
+    must be adjacent, as harvest rows are, so each key can be compared once its last
+    record is read.
+
+    Args:
+        old: Earlier snapshot, as a mapping of key to record or an iterable of records
+        new: Later snapshot, in the same form
+        key: Field name or function giving each record's key, if the snapshots are not mappings
+        old_hashes: True if old is already a key to hash mapping from hash_index
+
+    Returns:
+        Iterator[Change]: Added and modified records, then removed ones
+
+    Raises:
+        ValueError: If records sharing a key are not adjacent in the new snapshot
+
+    # Example usage...
+    import HerdingCats as hc
+
+    def main():
+        with hc.CatSession(hc.OpenDataSoftDataCatalogues.UK_POWER_NETWORKS_DNO) as session:
+            explore = hc.OpenDataSoftCatExplorer(session)
+            before = hc.hash_index(explore.iter_datasets(), key="dataset_id")
+
+            # ... later
+            for change in hc.diff_records(
+                before, explore.iter_datasets(), key="dataset_id", old_hashes=True
+            ):
+                print(change.kind, change.key)
+
+    if __name__ == "__main__":
+        main()
+    """
+    remaining = dict(old) if old_hashes else hash_index(old, key)
+    seen: Set[Hashable] = set()
+
+    for record_key, rows in _grouped(new, key):
+        if record_key in seen:
+            raise ValueError(
+                f"Records with key {record_key!r} are not adjacent in the new snapshot"
+            )
+        seen.add(record_key)
+        record = rows[0] if len(rows) == 1 else rows
+        previous = remaining.pop(record_key, None)
+        if previous is None:
+            yield Change(ADDED, record_key, record)
+        elif previous != _combined_hash([record_hash(row) for row in rows]):
+            yield Change(MODIFIED, record_key, record)
+
+    for record_key in remaining:
+        yield Change(REMOVED, record_key)
@@ -1,9 +1,19 @@
-import requests
-import pandas as pd
-import polars as pl
-import duckdb
+from __future__ import annotations
 
-from typing import Any, Dict, Optional, Union, Literal, List, Tuple
+import io
+import itertools
+import json
+import os
+import requests
+import shutil
+import tempfile
+import threading
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Generator, Iterable, Iterator, Optional, Set, Union, Literal, List, Tuple
 from loguru import logger
 from urllib.parse import urlencode
 
@@ -19,6 +29,41 @@ from ..config.source_endpoints import (
 )
 from ..errors.errors import CatExplorerError, WrongCatalogueError
 from ..session.session import CatSession, CatalogueType
+from ..utils.json_decoder import decode_response, get_json_decoder
+from ..utils.lazy_imports import LazyModule
+from .memo import MetadataCache, memoize
+from .records import PackageRecord, ResourceRecord
+from .search_index import CatalogueIndex
+from .snapshot import HarvestSnapshot
+
+# Only imported when a DataFrame or DuckDB method is called
+pd = LazyModule("pandas")
+pl = LazyModule("polars")
+duckdb = LazyModule("duckdb")
+pa = LazyModule("pyarrow")
+pacsv = LazyModule("pyarrow.csv", "pyarrow")
+pq = LazyModule("pyarrow.parquet", "pyarrow")
+
+
+# OpenDataSoft base path that answered for each base url, shared by every explorer in this process
+# Portals serve the catalog API under BASE_PATH, BASE_PATH_2 or both
+_ODS_BASE_PATHS: Dict[str, str] = {}
+_ODS_BASE_PATHS_LOCK = threading.Lock()
+# Held while a base path file is rewritten, so concurrent saves don't drop each other's entries
+_ODS_BASE_PATH_FILE_LOCK = threading.Lock()
+
+# Bytes copied at a time when spooling a catalogue export to disk
+_EXPORT_CHUNK_SIZE = 1024 * 1024
+
+
+def _schema(name: str) -> Optional[Any]:
+    """msgspec schema from schemas.py, None when typed decoding is unavailable."""
+    if not get_json_decoder().typed:
+        return None
+    from . import schemas
+
+    return getattr(schemas, name)
+
 
 # At the moment we have a lot of duplicate code between the explorers
 # TODO: Find a better way to do this
@@ -29,7 +74,9 @@ from ..session.session import CatSession, CatalogueType
 # FIND THE DATA YOU WANT / NEED / ISOLATE PACKAGES AND RESOURCES
 # For Ckan Catalogues Only
 class CkanCatExplorer:
-    def __init__(self, cat_session: CatSession):
+    def __init__(
+        self, cat_session: CatSession, cache: Optional[MetadataCache] = None
+    ):
         """
         Takes in a CatSession.
 
@@ -39,6 +86,7 @@ class CkanCatExplorer:
 
         Args:
             CkanCatSession
+            cache: Optional MetadataCache used to memoize show_package_info
 
         Returns:
             CkanCatExplorer
@@ -69,6 +117,7 @@ class CkanCatExplorer:
             )
 
         self.cat_session = cat_session
+        self.cache = cache
 
     # ----------------------------
     # Check CKAN site health
@@ -101,7 +150,7 @@ class CkanCatExplorer:
             response = self.cat_session.session.get(url)
 
             if response.status_code == 200:
-                data = response.json()
+                data = decode_response(response)
                 if data:
                     logger.success("Health Check Passed: CKAN is running and available")
                 else:
@@ -119,12 +168,26 @@ class CkanCatExplorer:
     # ----------------------------
     # Basic Available package lists + metadata
     # ----------------------------
-    def get_package_count(self) -> int:
+    def get_package_count(
+        self,
+        organisation: Optional[str] = None,
+        tags: Optional[Union[str, List[str]]] = None,
+        res_format: Optional[str] = None,
+    ) -> int:
         """
         A quick way to see how 'big' a data catalogue is.
 
         E.g how many datasets (packages) there are.
 
+        The count is computed server side with package_search?rows=0, so no package list is downloaded.
+        If package_search is unavailable the full package_list is downloaded and counted instead,
+        which only works without filters.
+
+        Args:
+            organisation: Only count packages published by this organisation (its name, not title)
+            tags: Only count packages with this tag, or all of these tags
+            res_format: Only count packages with a resource in this format, e.g. "CSV"
+
         Returns:
             package_count: int
 
@@ -135,18 +198,38 @@ class CkanCatExplorer:
             with hc.CatSession(hc.CkanDataCatalogues.LONDON_DATA_STORE) as session:
                 explore = CkanCatExplorer(session)
                 package_count = explore.get_package_count()
-                print(package_count)
+                csv_count = explore.get_package_count(organisation="transport-for-london", res_format="CSV")
+                print(package_count, csv_count)
 
         if __name__ == "__main__":
             main()
         """
 
-        url: str = self.cat_session.base_url + CkanApiPaths.PACKAGE_LIST
+        filter_query = self._build_filter_query(organisation, tags, res_format)
+        params = {"rows": 0}
+        if filter_query:
+            params["fq"] = filter_query
+
+        url: str = self.cat_session.base_url + CkanApiPaths.PACKAGE_SEARCH
+
+        try:
+            response = self.cat_session.session.get(url, params=params)
+            response.raise_for_status()
+            return int(decode_response(response)["result"]["count"])
+        except (requests.RequestException, KeyError, TypeError, ValueError) as e:
+            if filter_query:
+                logger.error(f"Failed to get package count: {e}")
+                raise CatExplorerError(f"Failed to get package count: {str(e)}")
+            logger.warning(
+                f"package_search count failed, falling back to package_list: {e}"
+            )
+
+        url = self.cat_session.base_url + CkanApiPaths.PACKAGE_LIST
 
         try:
             response = self.cat_session.session.get(url)
             response.raise_for_status()
-            package_count = response.json()
+            package_count = decode_response(response)
             return len(package_count["result"])
         except requests.RequestException as e:
             logger.error(f"Failed to get package count: {e}")
@@ -192,7 +275,7 @@ class CkanCatExplorer:
         try:
             response = self.cat_session.session.get(url)
             response.raise_for_status()
-            data = response.json()
+            data = decode_response(response, _schema("CkanPackageList"))
             list_prep = data["result"]
             package_list = {item: item for item in list_prep}
             return package_list
@@ -254,7 +337,7 @@ class CkanCatExplorer:
         try:
             response = self.cat_session.session.get(url)
             response.raise_for_status()
-            data = response.json()
+            data = decode_response(response)
             package_list: dict = data["result"]
 
             match df_type.lower():
@@ -305,7 +388,7 @@ class CkanCatExplorer:
             response = self.cat_session.session.get(url)
             response.raise_for_status()
 
-            data = response.json()
+            data = decode_response(response)
 
             organisations: list = data["result"]
             length: int = len(organisations)
@@ -316,20 +399,13 @@ class CkanCatExplorer:
                 f"Primary organisation search method failed - attempting secondary method that fetches 'maintainers' only - this may still be useful but not as accurate: {e}"
             )
             try:
-                # Secondary method using package endpoint
-                package_url: str = (
-                    self.cat_session.base_url
-                    + CkanApiPaths.CURRENT_PACKAGE_LIST_WITH_RESOURCES
-                )
-                package_response = self.cat_session.session.get(package_url)
-                package_response.raise_for_status()
-                data = package_response.json()
-
+                # Secondary method using package endpoint, paged so large catalogues are not truncated
                 # Convert list of maintainers to a dictionary
                 maintainers: list = list(
                     set(
                         entry.get("maintainer", "N/A")
-                        for entry in data["result"]
+                        for page in self._harvest_pages()
+                        for entry in page
                         if entry.get("maintainer")
                     )
                 )
@@ -343,6 +419,7 @@ class CkanCatExplorer:
     # ----------------------------
     # Show metadata using a package name
     # ----------------------------
+    @memoize
     def show_package_info(
         self, package_name: Union[str, dict, Any], api_key=None
     ) -> List[Dict]:
@@ -390,7 +467,7 @@ class CkanCatExplorer:
 
             response = self.cat_session.session.get(url, headers=headers)
             response.raise_for_status()
-            data = response.json()
+            data = decode_response(response)
             result_data = data["result"]
             return self._extract_resource_data(result_data)
 
@@ -446,7 +523,7 @@ class CkanCatExplorer:
 
             response = self.cat_session.session.get(url, headers=headers)
             response.raise_for_status()
-            data = response.json()
+            data = decode_response(response)
             result_data = data["result"]
             results = self._extract_resource_data(result_data)
 
@@ -459,6 +536,87 @@ class CkanCatExplorer:
         except requests.RequestException as e:
             raise CatExplorerError(f"Failed to search datasets: {str(e)}")
 
+    def show_package_info_bulk(
+        self,
+        package_names: Iterable[str],
+        max_workers: int = 8,
+        api_key=None,
+    ) -> Iterator[Tuple[str, Optional[List[Dict]], Optional[CatExplorerError]]]:
+        """
+        Fetch package metadata for many packages using a pool of threads.
+
+        Results are yielded as soon as each request finishes, so they arrive in completion order,
+        not input order. A failed package yields its error instead of stopping the batch.
+
+        At most max_workers requests are in flight and the same number are queued, so package_names
+        can be a generator over a very large catalogue without being read into memory.
+        Requests go through the session, so its rate limit, retries and caches still apply.
+        Keep max_workers at or below the session's TransportConfig.pool_maxsize (10 by default).
+
+        Args:
+            package_names: Package names or ids
+            max_workers: Number of requests run at the same time
+            api_key: Optional API key sent with every request
+
+        Returns:
+            Iterator of (package_name, package_info, error) tuples.
+            package_info is None when error is set, and the other way round.
+
+        # Example usage...
+        import HerdingCats as hc
+
+        def main():
+            with hc.CatSession(hc.CkanDataCatalogues.UK_GOV) as session:
+                explore = hc.CkanCatExplorer(session)
+                packages = explore.get_package_list()
+                for name, info, error in explore.show_package_info_bulk(packages, max_workers=8):
+                    if error:
+                        print(f"{name} failed: {error}")
+                    else:
+                        print(name, len(info))
+
+        if __name__ == "__main__":
+            main()
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        def fetch(name: str) -> Tuple[str, Optional[List[Dict]], Optional[CatExplorerError]]:
+            try:
+                return name, self.show_package_info(name, api_key=api_key), None
+            except CatExplorerError as e:
+                return name, None, e
+            except Exception as e:
+                return name, None, CatExplorerError(
+                    f"Failed to show package {name}: {str(e)}"
+                )
+
+        names = iter(package_names)
+        failed = 0
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = {
+                executor.submit(fetch, name)
+                for name in itertools.islice(names, max_workers * 2)
+            }
+            try:
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        result = future.result()
+                        if result[2] is not None:
+                            failed += 1
+                            logger.warning(f"Failed to show package {result[0]}: {result[2]}")
+                        next_name = next(names, None)
+                        if next_name is not None:
+                            pending.add(executor.submit(fetch, next_name))
+                        yield result
+            finally:
+                for future in pending:
+                    future.cancel()
+
+        if failed:
+            logger.warning(f"{failed} packages could not be fetched")
+
     # ----------------------------
     # Search Packages and store in DataFrames / or keep as Dicts.
     # Unpack data or keep it packed (e.g. don't split out resources into own columns)
@@ -501,7 +659,7 @@ class CkanCatExplorer:
         try:
             response = self.cat_session.session.get(url)
             response.raise_for_status()
-            data = response.json()
+            data = decode_response(response)
             logger.success(f"Showing results for query: {search_query}")
             return data["result"]
         except requests.RequestException as e:
@@ -552,7 +710,7 @@ class CkanCatExplorer:
         try:
             response = self.cat_session.session.get(url)
             response.raise_for_status()
-            data = response.json()
+            data = decode_response(response)
 
             # CKAN package_search returns: {"success": true, "result": {"count": X, "results": [...packages...]}}
             # Standard CKAN API uses "results" (plural) for the package list
@@ -664,7 +822,7 @@ class CkanCatExplorer:
         try:
             response = self.cat_session.session.get(url)
             response.raise_for_status()
-            data = response.json()
+            data = decode_response(response)
 
             # CKAN package_search returns: {"success": true, "result": {"count": X, "results": [...packages...]}}
             # Standard CKAN API uses "results" (plural) for the package list
@@ -691,16 +849,12 @@ class CkanCatExplorer:
 
             logger.success(f"Showing results for query: {search_query}")
 
-            extracted_data = self._extract_condensed_package_data(
+            table = self._build_condensed_table(
                 result_data,
                 ["name", "notes_markdown", "num_resources"],
                 ["name", "created", "format", "url"],
             )
-
-            if df_type.lower() == "polars":
-                return pl.DataFrame(extracted_data)
-            else:  # pandas
-                return pd.DataFrame(extracted_data)
+            return self._table_to_dataframe(table, df_type)
 
         except requests.RequestException as e:
             raise CatExplorerError(f"Failed to search datasets: {str(e)}")
@@ -792,7 +946,7 @@ class CkanCatExplorer:
         try:
             response = self.cat_session.session.get(url)
             response.raise_for_status()
-            data = response.json()
+            data = decode_response(response)
 
             # CKAN package_search returns: {"success": true, "result": {"count": X, "results": [...packages...]}}
             # Standard CKAN API uses "results" (plural) for the package list
@@ -819,25 +973,349 @@ class CkanCatExplorer:
 
             logger.success(f"Showing results for query: {search_query}")
 
-            extracted_data = self._extract_condensed_package_data(
+            table = self._build_unpacked_table(
                 result_data,
                 ["name", "notes_markdown"],
                 ["name", "created", "format", "url"],
             )
-
-            if df_type.lower() == "polars":
-                return self._create_polars_dataframe(extracted_data)
-            else:  # pandas
-                return self._create_pandas_dataframe(extracted_data)
+            return self._table_to_dataframe(table, df_type)
 
         except requests.RequestException as e:
             raise CatExplorerError(f"Failed to search datasets: {str(e)}")
 
+    def iter_package_search(
+        self,
+        search_query: Optional[str] = None,
+        rows: int = 100,
+        organisation: Optional[str] = None,
+        tags: Optional[Union[str, List[str]]] = None,
+        res_format: Optional[str] = None,
+        modified_since: Optional[Union[str, datetime]] = None,
+        cursor: bool = False,
+        prefetch: bool = True,
+        condense: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over every package matching a search, one page at a time.
+
+        Pages are requested with start/rows, or with cursor=True by walking metadata_modified
+        in ascending order. Cursor paging keeps working on catalogues that cap start and does
+        not skip or repeat packages when the catalogue changes mid walk.
+
+        While the caller works through one page the next page is fetched in a background thread,
+        so at most two pages are held in memory however many packages match.
+
+        Args:
+            search_query: Free text query. None matches every package
+            rows: Packages requested per page
+            organisation: Only return packages published by this organisation
+            tags: Only return packages with this tag, or all of these tags
+            res_format: Only return packages with a resource in this format, e.g. "CSV"
+            modified_since: Only return packages modified at or after this time
+            cursor: Page on metadata_modified instead of start offsets
+            prefetch: Fetch the next page while the current one is being consumed
+            condense: Yield the condensed view used by package_search_condense
+
+        Returns:
+            Iterator[Dict]: Packages in the order the catalogue returns them
+
+        # Example usage...
+        import HerdingCats as hc
+
+        def main():
+            with hc.CatSession(hc.CkanDataCatalogues.UK_GOV) as session:
+                explore = hc.CkanCatExplorer(session)
+                for package in explore.iter_package_search("police", rows=500, cursor=True):
+                    print(package["name"])
+
+        if __name__ =="__main__":
+            main()
+        """
+        if rows < 1:
+            raise ValueError("rows must be at least 1")
+
+        filter_query = self._build_filter_query(organisation, tags, res_format)
+        params: Dict[str, Any] = {"rows": rows}
+        if search_query:
+            params["q"] = search_query
+
+        if cursor:
+            pages = self._cursor_search_pages(params, filter_query, modified_since)
+        else:
+            if modified_since is not None:
+                term = f"metadata_modified:[{self._solr_timestamp(modified_since)} TO *]"
+                filter_query = f"{filter_query} AND {term}" if filter_query else term
+            if filter_query:
+                params["fq"] = filter_query
+            pages = self._offset_search_pages(params)
+
+        if prefetch:
+            pages = self._prefetch(pages)
+
+        for page in pages:
+            if condense:
+                page = self._extract_condensed_package_data(
+                    page,
+                    ["name", "notes_markdown"],
+                    ["name", "created", "format", "url"],
+                )
+            yield from page
+
+    # ----------------------------
+    # Harvest the whole catalogue
+    # Page through current_package_list_with_resources instead of one request per package
+    # ----------------------------
+    def harvest_package_resources(
+        self, page_size: int = 1000, max_workers: int = 1
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Harvest every package in the catalogue and yield one flattened row per resource.
+
+        Pages through current_package_list_with_resources with limit/offset, so a catalogue of
+        80,000 packages takes 80 requests at the default page size. With max_workers > 1 the
+        next pages are requested in parallel while the current one is yielded. Rows keep the
+        catalogue's order either way.
+
+        Each row holds the fields returned by show_package_info plus package_id, title, tags,
+        organisation, metadata_modified and resource_id. Packages without resources yield a single row with
+        the resource fields set to None, so every package appears in the harvest.
+
+        Args:
+            page_size: Packages requested per page. Many portals cap this at 1000
+            max_workers: Number of pages requested at the same time
+
+        Returns:
+            Iterator[Dict]: One row per package resource
+
+        # Example usage...
+        import HerdingCats as hc
+
+        def main():
+            with hc.CatSession(hc.CkanDataCatalogues.UK_GOV) as session:
+                explore = hc.CkanCatExplorer(session)
+                rows = list(explore.harvest_package_resources(page_size=1000, max_workers=4))
+                print(len(rows))
+
+        if __name__ == "__main__":
+            main()
+        """
+        for page in self._harvest_pages(page_size, max_workers):
+            for package in page:
+                yield from self._extract_harvest_rows(package)
+
+    def harvest_package_records(
+        self, page_size: int = 1000, max_workers: int = 1
+    ) -> Iterator[PackageRecord]:
+        """
+        Harvest every package in the catalogue as compact PackageRecords.
+
+        Pages the same way as harvest_package_resources, but yields one PackageRecord per package
+        with its resources as ResourceRecords. Both use __slots__, so a catalogue with a million
+        resources can be held in memory comfortably.
+
+        Args:
+            page_size: Packages requested per page. Many portals cap this at 1000
+            max_workers: Number of pages requested at the same time
+
+        Returns:
+            Iterator[PackageRecord]
+
+        # Example usage...
+        import HerdingCats as hc
+
+        def main():
+            with hc.CatSession(hc.CkanDataCatalogues.UK_GOV) as session:
+                explore = hc.CkanCatExplorer(session)
+                packages = list(explore.harvest_package_records(max_workers=4))
+                csv = [r for p in packages for r in p.resources if r.format == "CSV"]
+                print(len(packages), len(csv))
+
+        if __name__ == "__main__":
+            main()
+        """
+        for page in self._harvest_pages(page_size, max_workers):
+            for package in page:
+                yield PackageRecord.from_ckan(package)
+
+    def build_search_index(
+        self,
+        index: Optional[CatalogueIndex] = None,
+        page_size: int = 1000,
+        max_workers: int = 1,
+    ) -> CatalogueIndex:
+        """
+        Harvest the catalogue into a local full-text search index.
+
+        Packages are indexed by title, name, notes, tags and resource formats.
+        Searching the index needs no network access, see CatalogueIndex.search.
+
+        Args:
+            index: Existing index to add to. A new one is created if not given
+            page_size: Packages requested per page
+            max_workers: Number of pages requested at the same time
+
+        Returns:
+            CatalogueIndex
+
+        # Example usage...
+        import HerdingCats as hc
+
+        def main():
+            with hc.CatSession(hc.CkanDataCatalogues.UK_GOV) as session:
+                explore = hc.CkanCatExplorer(session)
+                index = explore.build_search_index(max_workers=4)
+            print(index.search("air quality", limit=5))
+
+        if __name__ == "__main__":
+            main()
+        """
+        index = index if index is not None else CatalogueIndex()
+        for record in self.harvest_package_records(page_size, max_workers):
+            index.add_record(record)
+        logger.success(f"Indexed {len(index)} packages")
+        return index
+
+    def harvest_incremental(
+        self,
+        snapshot: HarvestSnapshot,
+        page_size: int = 1000,
+        detect_deletions: bool = True,
+    ) -> Tuple[Dict[str, List[Dict[str, Any]]], Set[str]]:
+        """
+        Bring a local snapshot of the catalogue up to date and return what changed.
+
+        The first harvest into an empty snapshot pages through the whole catalogue.
+        After that only packages with metadata_modified at or after the snapshot's watermark
+        are requested from package_search, so a nightly run fetches the few packages that
+        changed rather than the whole catalogue. Deleted packages are found by comparing
+        the snapshot with package_list, which only returns names.
+
+        The snapshot is updated in place. Call snapshot.save() to keep it.
+
+        Args:
+            snapshot: The HarvestSnapshot to update
+            page_size: Packages requested per page
+            detect_deletions: Check package_list for packages removed from the catalogue
+
+        Returns:
+            Tuple of new or changed packages (resource rows keyed by package name)
+            and the names of deleted packages
+
+        # Example usage...
+        import HerdingCats as hc
+
+        def main():
+            snapshot = hc.HarvestSnapshot.load("uk_gov.json")
+            with hc.CatSession(hc.CkanDataCatalogues.UK_GOV) as session:
+                explore = hc.CkanCatExplorer(session)
+                changed, deleted = explore.harvest_incremental(snapshot)
+                print(f"{len(changed)} changed, {len(deleted)} deleted")
+            snapshot.save()
+
+        if __name__ == "__main__":
+            main()
+        """
+        changed: Dict[str, List[Dict[str, Any]]] = {}
+        deleted: Set[str] = set()
+
+        if snapshot.watermark is None:
+            for page in self._harvest_pages(page_size):
+                for package in page:
+                    changed[package["name"]] = self._extract_harvest_rows(package)
+            deleted = set(snapshot.packages) - set(changed)
+        else:
+            for package in self.iter_package_search(
+                rows=page_size, modified_since=snapshot.watermark, cursor=True
+            ):
+                # The range includes the watermark itself, so skip what we already have
+                if package.get("metadata_modified") == snapshot.modified(package["name"]):
+                    continue
+                changed[package["name"]] = self._extract_harvest_rows(package)
+
+            if detect_deletions:
+                current = self.get_package_list()
+                deleted = {name for name in snapshot.packages if name not in current}
+
+        snapshot.merge(changed, deleted)
+        logger.success(
+            f"Harvest found {len(changed)} new or changed and {len(deleted)} deleted packages"
+        )
+        return changed, deleted
+
+    def _harvest_pages(
+        self, page_size: int = 1000, max_workers: int = 1
+    ) -> Generator[List[Dict], None, None]:
+        """
+        Yield pages of current_package_list_with_resources in offset order.
+
+        Each page's offset follows on from the rows actually returned, and the end of the
+        catalogue is an empty page. Portals that cap limit below page_size return short
+        pages, so after a short page the next page is requested at that size before
+        carrying on. Up to max_workers requests past the end may be made in parallel.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        url = self.cat_session.base_url + CkanApiPaths.CURRENT_PACKAGE_LIST_WITH_RESOURCES
+
+        def fetch(offset: int, limit: int) -> List[Dict]:
+            try:
+                response = self.cat_session.session.get(
+                    url, params={"limit": limit, "offset": offset}
+                )
+                response.raise_for_status()
+                return decode_response(response, _schema("CkanHarvestPage"))["result"]
+            except (requests.RequestException, KeyError, TypeError, ValueError) as e:
+                raise CatExplorerError(
+                    f"Failed to harvest packages at offset {offset}: {str(e)}"
+                )
+
+        offset = 0
+        limit = page_size
+        offsets = itertools.count(0, limit)
+        shortened = False
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque(
+                executor.submit(fetch, next(offsets), limit) for _ in range(max_workers)
+            )
+            try:
+                while pending:
+                    page = pending.popleft().result()
+                    if not page:
+                        return
+                    if shortened:
+                        logger.warning(
+                            f"Portal returns at most {limit} packages per page, "
+                            f"not the {page_size} requested"
+                        )
+                        shortened = False
+                    yield page
+                    offset += len(page)
+
+                    if len(page) < limit:
+                        # Either the last page or a capped limit. Requests already in flight
+                        # assumed full pages, so drop them and ask for the next page alone
+                        for future in pending:
+                            future.cancel()
+                        limit = len(page)
+                        offsets = itertools.count(offset, limit)
+                        pending = deque([executor.submit(fetch, next(offsets), limit)])
+                        shortened = True
+                        continue
+
+                    while len(pending) < max_workers:
+                        pending.append(executor.submit(fetch, next(offsets), limit))
+            finally:
+                for future in pending:
+                    future.cancel()
+
     # ----------------------------
     # Extract information in preperation for Data Loader Class
     # TODO: Maybe we should move this to the data loader class itself???
     # ----------------------------
-    def extract_resource_url(self, package_info: List[Dict]) -> List[str]:
+    def extract_resource_url(self, package_info: List[Dict]) -> List[ResourceRecord]:
         """
         Extracts the download inmformation for resources in a package.
 
@@ -847,7 +1325,8 @@ class CkanCatExplorer:
             package_info: List[Dict]
 
         Returns:
-            List[resource_name, resource_created, format, url]
+            List[ResourceRecord]. Each record can still be indexed like the
+            [resource_name, resource_created, format, url] lists returned previously
 
         # Example:
         import HerdingCats as hc
@@ -874,7 +1353,16 @@ class CkanCatExplorer:
                 logger.success(
                     f"Found URL for resource '{resource_name}'. Format is: {format}"
                 )
-                results.append([resource_name, created, format, url])
+                results.append(
+                    ResourceRecord(
+                        resource_name,
+                        created,
+                        format,
+                        url,
+                        last_modified=item.get("resource_last_modified"),
+                        package=item.get("name"),
+                    )
+                )
             else:
                 logger.warning(
                     f"Resource '{resource_name}' found in package, but no URL available"
@@ -886,6 +1374,143 @@ class CkanCatExplorer:
     # Flatten nested data structures
     # Extract specific fields from a package
     # ----------------------------
+    @staticmethod
+    def _build_filter_query(
+        organisation: Optional[str] = None,
+        tags: Optional[Union[str, List[str]]] = None,
+        res_format: Optional[str] = None,
+    ) -> str:
+        """
+        Build a package_search filter query (fq) from simple filters.
+
+        Args:
+            organisation: Organisation name
+            tags: A tag or list of tags, all of which must match
+            res_format: Resource format, e.g. "CSV"
+
+        Returns:
+            str: The fq string, empty if no filters were given
+        """
+        if isinstance(tags, str):
+            tags = [tags]
+
+        terms = []
+        if organisation:
+            terms.append(f'organization:"{organisation}"')
+        for tag in tags or []:
+            terms.append(f'tags:"{tag}"')
+        if res_format:
+            terms.append(f'res_format:"{res_format}"')
+        return " AND ".join(terms)
+
+    @staticmethod
+    def _solr_timestamp(value: Union[str, datetime]) -> str:
+        """
+        Format a time for a Solr range query.
+
+        CKAN stores metadata_modified as UTC without an offset, Solr wants a trailing Z.
+        """
+        if isinstance(value, datetime):
+            if value.tzinfo is not None:
+                value = value.astimezone(timezone.utc).replace(tzinfo=None)
+            value = value.isoformat()
+        return value if value.endswith("Z") else f"{value}Z"
+
+    def _fetch_search_page(self, params: Dict[str, Any]) -> Tuple[int, List[Dict]]:
+        """
+        Request a single package_search page.
+
+        Returns:
+            Tuple[int, List[Dict]]: Total number of matches and the packages on this page
+        """
+        url = self.cat_session.base_url + CkanApiPaths.PACKAGE_SEARCH
+        try:
+            response = self.cat_session.session.get(url, params=params)
+            response.raise_for_status()
+            result = decode_response(response)["result"]
+            return int(result["count"]), result["results"]
+        except (requests.RequestException, KeyError, TypeError, ValueError) as e:
+            raise CatExplorerError(f"Failed to search datasets: {str(e)}")
+
+    def _offset_search_pages(
+        self, params: Dict[str, Any]
+    ) -> Generator[List[Dict], None, None]:
+        """
+        Yield package_search pages, paging with start/rows until the total count is reached.
+        """
+        rows = params["rows"]
+        start = 0
+        while True:
+            count, page = self._fetch_search_page({**params, "start": start})
+            if not page:
+                return
+            yield page
+            start += rows
+            if start >= count:
+                return
+
+    def _cursor_search_pages(
+        self,
+        params: Dict[str, Any],
+        filter_query: str,
+        modified_since: Optional[Union[str, datetime]],
+    ) -> Generator[List[Dict], None, None]:
+        """
+        Yield package_search pages, paging on metadata_modified.
+
+        Each page asks for packages modified at or after the last one seen. Packages sharing
+        that timestamp are ordered by id, so the ones already yielded are skipped with start.
+        """
+        cursor = self._solr_timestamp(modified_since) if modified_since else "*"
+        seen_at_cursor: set = set()
+        rows = params["rows"]
+
+        while True:
+            term = f"metadata_modified:[{cursor} TO *]"
+            _, page = self._fetch_search_page(
+                {
+                    **params,
+                    "fq": f"{filter_query} AND {term}" if filter_query else term,
+                    "sort": "metadata_modified asc, id asc",
+                    "start": len(seen_at_cursor),
+                }
+            )
+            fetched = len(page)
+            page = [p for p in page if p.get("id") not in seen_at_cursor]
+            if not page:
+                return
+            yield page
+            if fetched < rows:
+                return
+
+            last = page[-1]["metadata_modified"]
+            next_cursor = self._solr_timestamp(last)
+            if next_cursor != cursor:
+                cursor = next_cursor
+                seen_at_cursor = set()
+            seen_at_cursor.update(
+                p["id"] for p in page if p["metadata_modified"] == last
+            )
+
+    @staticmethod
+    def _prefetch(
+        pages: Iterator[List[Dict]],
+    ) -> Generator[List[Dict], None, None]:
+        """
+        Fetch page n + 1 in a worker thread while the caller consumes page n.
+        """
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            pending = executor.submit(next, pages, None)
+            while True:
+                page = pending.result()
+                if page is None:
+                    return
+                pending = executor.submit(next, pages, None)
+                yield page
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     @staticmethod
     def _extract_condensed_package_data(
         data: List[Dict[str, Any]], base_fields: List[str], resource_fields: List[str]
@@ -934,35 +1559,104 @@ class CkanCatExplorer:
         ]
 
     @staticmethod
-    def _create_pandas_dataframe(data: List[Dict[str, Any]]) -> pd.DataFrame:
+    def _arrow_column(values: List[Any]) -> pa.Array:
         """
-        Creates a pandas dataframe from the data.
+        Build an Arrow array from a column of values, letting Arrow infer the type.
+
+        Portals sometimes mix types within a field (e.g. a number in a text field),
+        those columns are kept as strings rather than failing the whole table.
         """
-        df = pd.json_normalize(
-            data,
-            record_path="resources",
-            meta=["name", "notes_markdown"],
-            record_prefix="resource_",
-        )
-        return df
+        try:
+            return pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return pa.array(
+                [None if value is None else str(value) for value in values],
+                type=pa.string(),
+            )
 
     @staticmethod
-    def _create_polars_dataframe(data: List[Dict[str, Any]]) -> pl.DataFrame:
+    def _build_condensed_table(
+        data: List[Dict[str, Any]], base_fields: List[str], resource_fields: List[str]
+    ) -> pa.Table:
         """
-        Creates a polars dataframe from the data.
+        Build an Arrow table with one row per package and a nested list of resources.
+
+        Columns are filled in a single pass over the packages and turned into Arrow arrays
+        directly, the resources column is a list<struct> built from offsets into flat
+        resource columns, so no intermediate dictionaries are created.
         """
-        df = pl.DataFrame(data)
-        return (
-            df.explode("resources")
-            .with_columns(
+        columns: Dict[str, List[Any]] = {field: [] for field in base_fields}
+        resource_columns: Dict[str, List[Any]] = {field: [] for field in resource_fields}
+        offsets = [0]
+
+        for entry in data:
+            for field in base_fields:
+                columns[field].append(entry.get(field))
+            resources = entry.get("resources") or []
+            for resource in resources:
+                for field in resource_fields:
+                    resource_columns[field].append(resource.get(field))
+            offsets.append(offsets[-1] + len(resources))
+
+        resources_array = pa.ListArray.from_arrays(
+            pa.array(offsets, type=pa.int32()),
+            pa.StructArray.from_arrays(
                 [
-                    pl.col("resources").struct.field(f).alias(f"resource_{f}")
-                    for f in ["name", "created", "format", "url"]
-                ]
-            )
-            .drop("resources", "num_resources")
+                    CkanCatExplorer._arrow_column(resource_columns[field])
+                    for field in resource_fields
+                ],
+                names=resource_fields,
+            ),
+        )
+        arrays = [CkanCatExplorer._arrow_column(columns[field]) for field in base_fields]
+        return pa.Table.from_arrays(
+            arrays + [resources_array], names=base_fields + ["resources"]
+        )
+
+    @staticmethod
+    def _build_unpacked_table(
+        data: List[Dict[str, Any]], base_fields: List[str], resource_fields: List[str]
+    ) -> pa.Table:
+        """
+        Build an Arrow table with one row per resource.
+
+        Package fields are repeated for each of the package's resources and resource fields
+        get a resource_ prefix. Packages without resources produce no rows.
+        """
+        columns: Dict[str, List[Any]] = {
+            **{field: [] for field in base_fields},
+            **{f"resource_{field}": [] for field in resource_fields},
+        }
+
+        for entry in data:
+            resources = entry.get("resources") or []
+            if not resources:
+                continue
+            for field in base_fields:
+                columns[field].extend([entry.get(field)] * len(resources))
+            for field in resource_fields:
+                columns[f"resource_{field}"].extend(
+                    resource.get(field) for resource in resources
+                )
+
+        return pa.Table.from_arrays(
+            [CkanCatExplorer._arrow_column(values) for values in columns.values()],
+            names=list(columns),
         )
 
+    @staticmethod
+    def _table_to_dataframe(
+        table: pa.Table, df_type: Literal["pandas", "polars"]
+    ) -> Union[pd.DataFrame, "pl.DataFrame"]:
+        """
+        Hand an Arrow table to pandas or polars without copying its buffers.
+
+        pandas columns use pd.ArrowDtype so they stay backed by the Arrow arrays.
+        """
+        if df_type.lower() == "polars":
+            return pl.from_arrow(table)
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+
     @staticmethod
     def _extract_resource_data(data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -1001,6 +1695,36 @@ class CkanCatExplorer:
 
         return result
 
+    @staticmethod
+    def _extract_harvest_rows(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Flatten a package into resource rows for a catalogue harvest.
+
+        Adds the package id, title, tags, organisation, modified time and resource id to the
+        rows from _extract_resource_data, and keeps packages without resources as a single row.
+
+        Args:
+        data (Dict[str, Any]): The input package data dictionary.
+
+        Returns:
+        List[Dict[str, Any]]: One dictionary per resource.
+        """
+        organisation = data.get("organization") or {}
+        package_fields = {
+            "package_id": data.get("id"),
+            "title": data.get("title"),
+            "tags": [tag.get("name") for tag in data.get("tags") or [] if tag.get("name")],
+            "organisation": organisation.get("name"),
+            "metadata_modified": data.get("metadata_modified"),
+        }
+
+        resources = data.get("resources") or [{}]
+        rows = CkanCatExplorer._extract_resource_data({**data, "resources": resources})
+        for row, resource in zip(rows, resources):
+            row.update(package_fields)
+            row["resource_id"] = resource.get("id")
+        return rows
+
 
 # FIND THE DATA YOU WANT / NEED / ISOLATE PACKAGES AND RESOURCES
 # For DataPress Catalogues Only
@@ -1079,7 +1803,7 @@ class DataPressCatExplorer:
             response = self.cat_session.session.get(url)
 
             if response.status_code == 200:
-                data = response.json()
+                data = decode_response(response)
                 if data:
                     logger.success(
                         "Health Check Passed: DataPress is running and available"
@@ -1108,20 +1832,29 @@ class DataPressCatExplorer:
         Returns:
             dict: Dictionary with dataset titles as keys and dataset IDs as values
         """
+        datasets = self.get_all_datasets_metadata()
+
+        # Build the dictionary: title -> id
+        return {
+            dataset["title"]: dataset["id"]
+            for dataset in datasets
+            if "title" in dataset and "id" in dataset
+        }
+
+    def get_all_datasets_metadata(self) -> List[Dict[str, Any]]:
+        """
+        Fetch the full metadata of every dataset in a DataPress catalogue.
+
+        Returns:
+            List[Dict]: One dictionary per dataset, including its resources
+        """
         try:
             endpoint = self.cat_session.base_url + DataPressApiPaths.SHOW_ALL_CATALOGUES
 
             response = self.cat_session.session.get(endpoint)
             response.raise_for_status()
 
-            datasets = response.json()
-
-            # Build the dictionary: title -> id
-            return {
-                dataset["title"]: dataset["id"]
-                for dataset in datasets
-                if "title" in dataset and "id" in dataset
-            }
+            return decode_response(response)
 
         except Exception as e:
             logger.error(f"Error fetching datasets from DataPress: {str(e)}")
@@ -1146,8 +1879,8 @@ class DataPressCatExplorer:
         )
 
         try:
-            response = requests.get(url)
-            data = response.json()
+            response = self.cat_session.session.get(url)
+            data = decode_response(response)
             return data
         except Exception as e:
             logger.error(
@@ -1166,8 +1899,8 @@ class DataPressCatExplorer:
         )
 
         try:
-            response = requests.get(url)
-            data = response.json()
+            response = self.cat_session.session.get(url)
+            data = decode_response(response)
             resources = data["resources"]
             return resources
         except Exception as e:
@@ -1204,7 +1937,12 @@ class DataPressCatExplorer:
 # FIND THE DATA YOU WANT / NEED / ISOLATE PACKAGES AND RESOURCES
 # For Open Datasoft Catalogues Only
 class OpenDataSoftCatExplorer:
-    def __init__(self, cat_session: CatSession):
+    def __init__(
+        self,
+        cat_session: CatSession,
+        cache: Optional[MetadataCache] = None,
+        base_path_file: Optional[Union[str, Path]] = None,
+    ):
         """
         Takes in a CatSession
 
@@ -1214,6 +1952,9 @@ class OpenDataSoftCatExplorer:
 
         Args:
             CkanCatSession
+            cache: Optional MetadataCache used to memoize show_dataset_info and show_dataset_export_options
+            base_path_file: Optional JSON file remembering which API base path each portal answers on,
+            so later runs skip detecting it
 
         # Example usage...
         if __name__ == "__main__":
@@ -1236,6 +1977,157 @@ class OpenDataSoftCatExplorer:
             )
 
         self.cat_session = cat_session
+        self.cache = cache
+        self.base_path_file = (
+            Path(base_path_file).expanduser() if base_path_file is not None else None
+        )
+        self._load_base_paths()
+
+    # ----------------------------
+    # Route requests to the API base path the portal answers on
+    # ----------------------------
+    def detect_base_path(self) -> str:
+        """
+        Find which API base path the portal serves, and remember it.
+
+        Called automatically by the first request to the catalog API, so this is only
+        needed to warm up before a batch of calls. Once known, the path is shared by every
+        explorer for the same portal and, with base_path_file, saved for later runs.
+
+        Returns:
+            str: OpenDataSoftApiPaths.BASE_PATH or OpenDataSoftApiPaths.BASE_PATH_2
+        """
+        known = self._known_base_path()
+        if known is not None:
+            return known
+        self._get_catalog("datasets", params={"limit": 1})
+        return self._known_base_path() or OpenDataSoftApiPaths.BASE_PATH
+
+    def _known_base_path(self) -> Optional[str]:
+        with _ODS_BASE_PATHS_LOCK:
+            return _ODS_BASE_PATHS.get(self.cat_session.base_url)
+
+    def _base_paths(self) -> List[str]:
+        """Base paths to try, the one known to work for this portal first."""
+        paths = [OpenDataSoftApiPaths.BASE_PATH, OpenDataSoftApiPaths.BASE_PATH_2]
+        known = self._known_base_path()
+        if known in paths:
+            paths.remove(known)
+            paths.insert(0, known)
+        return paths
+
+    def _remember_base_path(self, base_path: str) -> None:
+        with _ODS_BASE_PATHS_LOCK:
+            if _ODS_BASE_PATHS.get(self.cat_session.base_url) == base_path:
+                return
+            _ODS_BASE_PATHS[self.cat_session.base_url] = base_path
+        logger.info(f"{self.cat_session.domain} serves the catalog API at {base_path.format('')}")
+        self._save_base_path(base_path)
+
+    def _load_base_paths(self) -> None:
+        if self.base_path_file is None or not self.base_path_file.exists():
+            return
+        try:
+            saved = json.loads(self.base_path_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable base path file {self.base_path_file}: {e}")
+            return
+        valid = (OpenDataSoftApiPaths.BASE_PATH, OpenDataSoftApiPaths.BASE_PATH_2)
+        with _ODS_BASE_PATHS_LOCK:
+            for base_url, base_path in saved.items():
+                if base_path in valid:
+                    _ODS_BASE_PATHS.setdefault(base_url, base_path)
+
+    def _save_base_path(self, base_path: str) -> None:
+        """
+        Add the base path to the base path file.
+
+        Saving is only an optimisation for later runs, so failures are logged and the
+        request that found the base path still succeeds.
+        """
+        if self.base_path_file is None:
+            return
+        with _ODS_BASE_PATH_FILE_LOCK:
+            try:
+                saved = json.loads(self.base_path_file.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                saved = {}
+            saved[self.cat_session.base_url] = base_path
+
+            temporary = None
+            try:
+                self.base_path_file.parent.mkdir(parents=True, exist_ok=True)
+                # A unique name per write, so another process saving at the same time
+                # can't replace or remove our temporary file
+                with tempfile.NamedTemporaryFile(
+                    "w",
+                    encoding="utf-8",
+                    dir=self.base_path_file.parent,
+                    prefix=f".{self.base_path_file.name}.",
+                    suffix=".tmp",
+                    delete=False,
+                ) as file:
+                    temporary = file.name
+                    json.dump(saved, file, indent=2, sort_keys=True)
+                os.replace(temporary, self.base_path_file)
+            except OSError as e:
+                logger.warning(f"Could not save base path to {self.base_path_file}: {e}")
+                if temporary is not None:
+                    try:
+                        os.remove(temporary)
+                    except OSError:
+                        pass
+
+    def _get_catalog(
+        self,
+        route: str,
+        params: Optional[Dict[str, Any]] = None,
+        valid: Optional[Callable[[Any], bool]] = None,
+        stream: bool = False,
+    ) -> Any:
+        """
+        GET a catalog API route and decode it, on the base path the portal answers on.
+
+        With stream=True the response is returned undecoded, with its body still unread.
+
+        Until the base path is known, BASE_PATH is tried and then BASE_PATH_2. The first
+        that answers (and passes the valid check, if given) is remembered. After that
+        requests go straight to it. The other path is only tried if the remembered one
+        fails with something other than a 404, which means the resource doesn't exist.
+
+        Raises:
+            requests.RequestException: The error from the last base path tried
+        """
+        known = self._known_base_path()
+        last_error: Optional[requests.RequestException] = None
+        fallback = None
+
+        for base_path in self._base_paths():
+            url = self.cat_session.base_url + base_path.format(route)
+            try:
+                response = self.cat_session.session.get(url, params=params, stream=stream)
+                response.raise_for_status()
+                if stream:
+                    self._remember_base_path(base_path)
+                    return response
+                data = decode_response(response)
+            except requests.RequestException as e:
+                last_error = e
+                status = getattr(e.response, "status_code", None)
+                if base_path == known and status == 404:
+                    break
+                logger.warning(f"Request to {url} failed: {e}. Trying the next base path.")
+                continue
+
+            if valid is not None and not valid(data):
+                fallback = data if fallback is None else fallback
+                continue
+            self._remember_base_path(base_path)
+            return data
+
+        if fallback is not None:
+            return fallback
+        raise last_error
 
     # ----------------------------
     # Check OpenDataSoft site health
@@ -1258,7 +2150,7 @@ class OpenDataSoftCatExplorer:
             response = self.cat_session.session.get(url)
 
             if response.status_code == 200:
-                data = response.json()
+                data = decode_response(response)
                 if data:
                     logger.success(
                         "Health Check Passed: OpenDataSoft is running and available"
@@ -1280,65 +2172,44 @@ class OpenDataSoftCatExplorer:
     # ----------------------------
     # Get all datasets available on the catalogue
     # ----------------------------
-    def fetch_all_datasets(self) -> dict | None:
-        urls = [
-            self.cat_session.base_url + OpenDataSoftApiPaths.SHOW_DATASETS,
-            self.cat_session.base_url + OpenDataSoftApiPaths.SHOW_DATASETS_2,
-        ]
-        dataset_dict = {}
-        total_count = 0
-
-        for url in urls:
-            offset = 0
-            limit = 100
+    def fetch_all_datasets(self, max_workers: int = 4) -> dict | None:
+        """
+        Fetch every dataset in the catalogue and return a dictionary of title:dataset_id.
 
-            try:
-                while True:
-                    params = {"offset": offset, "limit": limit}
-                    response = self.cat_session.session.get(url, params=params)
+        The first page gives the catalogue's total_count, and the remaining pages are then
+        requested concurrently. Keep max_workers at or below the session's
+        TransportConfig.pool_maxsize.
 
-                    if response.status_code == 400 and url == urls[0]:
-                        logger.warning(
-                            "SHOW_DATASETS endpoint returned 400 status. Trying SHOW_DATASETS_2."
-                        )
-                        break  # Break the inner loop to try the next URL
-
-                    response.raise_for_status()
-                    result = response.json()
+        Args:
+            max_workers: Pages requested at once. 1 fetches them one after another
 
-                    for dataset_info in result.get("datasets", []):
-                        if (
-                            "dataset" in dataset_info
-                            and "metas" in dataset_info["dataset"]
-                            and "default" in dataset_info["dataset"]["metas"]
-                            and "title" in dataset_info["dataset"]["metas"]["default"]
-                            and "dataset_id" in dataset_info["dataset"]
-                        ):
-                            title = dataset_info["dataset"]["metas"]["default"]["title"]
-                            dataset_id = dataset_info["dataset"]["dataset_id"]
-                            dataset_dict[title] = dataset_id
+        Returns:
+            dict | None: Dataset titles mapped to dataset ids, or None if nothing was found
 
-                    # Update total_count if available
-                    if "total_count" in result:
-                        total_count = result["total_count"]
+        # Example usage...
+        import HerdingCats as hc
 
-                    # Check if we've reached the end of the datasets
-                    if len(result.get("datasets", [])) < limit:
-                        break
-                    offset += limit
+        def main():
+            with hc.CatSession(hc.OpenDataSoftDataCatalogues.PARIS) as session:
+                explore = hc.OpenDataSoftCatExplorer(session)
+                datasets = explore.fetch_all_datasets(max_workers=8)
 
-                # If we've successfully retrieved datasets, no need to try the second URL
-                if dataset_dict:
-                    break
+        if __name__ == "__main__":
+            main()
+        """
+        dataset_dict = {}
+        total_count = 0
 
-            except requests.RequestException as e:
-                if url == urls[-1]:
-                    logger.error(f"Failed to fetch datasets: {e}")
-                    raise CatExplorerError(f"Failed to fetch datasets: {str(e)}")
-                else:
-                    logger.warning(
-                        f"Failed to fetch datasets from {url}: {e}. Trying next URL."
-                    )
+        for total_count, datasets in self._dataset_pages(max_workers=max_workers):
+            for dataset in datasets:
+                if (
+                    "metas" in dataset
+                    and "default" in dataset["metas"]
+                    and "title" in dataset["metas"]["default"]
+                    and "dataset_id" in dataset
+                ):
+                    title = dataset["metas"]["default"]["title"]
+                    dataset_dict[title] = dataset["dataset_id"]
 
         if dataset_dict:
             returned_count = len(dataset_dict)
@@ -1353,68 +2224,283 @@ class OpenDataSoftCatExplorer:
             logger.warning("No datasets were retrieved.")
             return None
 
+    def iter_datasets(
+        self, page_size: int = 100, max_workers: int = 1
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the full metadata of every dataset in the catalogue, a page at a time.
+
+        Unlike fetch_all_datasets, which keeps only titles and ids, each dataset is
+        yielded as returned by the catalogue, with dataset_id, metas and fields.
+
+        Args:
+            page_size: Datasets requested per page (OpenDataSoft caps this at 100)
+            max_workers: Pages requested at once, after the first
+
+        Returns:
+            Iterator[Dict]: One dictionary per dataset
+
+        # Example usage...
+        import HerdingCats as hc
+
+        def main():
+            with hc.CatSession(hc.OpenDataSoftDataCatalogues.UK_POWER_NETWORKS_DNO) as session:
+                explore = hc.OpenDataSoftCatExplorer(session)
+                for dataset in explore.iter_datasets():
+                    print(dataset["dataset_id"], dataset["metas"]["default"].get("modified"))
+
+        if __name__ == "__main__":
+            main()
+        """
+        for _, datasets in self._dataset_pages(page_size, max_workers):
+            yield from datasets
+
+    def export_catalogue(
+        self,
+        export_format: Literal["csv", "parquet", "json"] = "csv",
+        df_type: Literal["arrow", "pandas", "polars"] = "arrow",
+        where: Optional[str] = None,
+    ) -> Union["pa.Table", pd.DataFrame, "pl.DataFrame"]:
+        """
+        Download the whole catalogue's metadata in one request, using the catalog exports endpoint.
+
+        fetch_all_datasets pages through the catalogue 100 datasets at a time and keeps only
+        titles and ids. This asks the portal for a single export of every dataset, with all
+        its metadata columns, and streams it straight into an Arrow table.
+
+        CSV is read by pyarrow as it downloads. Parquet is spooled to a temporary file first,
+        because it has to be read from the end. JSON is decoded in memory, so it is the
+        slowest of the three.
+
+        Args:
+            export_format: "csv", "parquet" or "json". Parquet is the fastest, but not every
+            portal offers it
+            df_type: Return an Arrow table, or a pandas or polars DataFrame
+            where: Optional ODSQL filter, e.g. "publisher = 'UK Power Networks'"
+
+        Returns:
+            One row per dataset, as a pyarrow Table, pandas DataFrame or polars DataFrame
+
+        # Example usage...
+        import HerdingCats as hc
+
+        def main():
+            with hc.CatSession(hc.OpenDataSoftDataCatalogues.PARIS) as session:
+                explore = hc.OpenDataSoftCatExplorer(session)
+                catalogue = explore.export_catalogue(df_type="polars")
+                print(catalogue.select("dataset_id", "title", "modified"))
+
+        if __name__ == "__main__":
+            main()
+        """
+        if export_format not in ("csv", "parquet", "json"):
+            raise ValueError(f"Unsupported export format: {export_format}")
+        if df_type not in ("arrow", "pandas", "polars"):
+            raise ValueError(f"Unsupported df_type: {df_type}")
+
+        params = {"where": where} if where else None
+        try:
+            response = self._get_catalog(
+                f"exports/{export_format}", params=params, stream=True
+            )
+        except requests.RequestException as e:
+            logger.error(f"Failed to export catalogue: {e}")
+            raise CatExplorerError(f"Failed to export catalogue: {str(e)}")
+
+        try:
+            with response:
+                body = self._export_body(response)
+                match export_format:
+                    case "csv":
+                        table = pacsv.read_csv(
+                            body,
+                            parse_options=pacsv.ParseOptions(
+                                delimiter=";", newlines_in_values=True
+                            ),
+                        )
+                    case "parquet":
+                        with tempfile.TemporaryFile() as spool:
+                            shutil.copyfileobj(body, spool, _EXPORT_CHUNK_SIZE)
+                            spool.seek(0)
+                            table = pq.read_table(spool)
+                    case "json":
+                        table = pa.Table.from_pylist(decode_response(response))
+        except (requests.RequestException, pa.ArrowException, OSError, ValueError) as e:
+            logger.error(f"Failed to read catalogue export: {e}")
+            raise CatExplorerError(f"Failed to read catalogue export: {str(e)}")
+
+        logger.success(f"Exported {table.num_rows} datasets from {self.cat_session.domain}")
+        if df_type == "arrow":
+            return table
+        return CkanCatExplorer._table_to_dataframe(table, df_type)
+
+    @staticmethod
+    def _export_body(response: requests.Response) -> Any:
+        """
+        File-like body of a streamed export response.
+
+        Responses served by a ReplayStore or HttpCache have no raw stream, and one being
+        recorded has already been read, so those are read from the body held in memory.
+        """
+        if response.raw is None or response._content_consumed:
+            return io.BytesIO(response.content)
+        # Let urllib3 undo any gzip transfer encoding while we read the raw stream
+        response.raw.decode_content = True
+        return response.raw
+
+    def _dataset_pages(
+        self, limit: int = 100, max_workers: int = 1
+    ) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        Page through the datasets endpoint, yielding (total_count, datasets) per page in order.
+
+        The first page is fetched alone to read total_count, and finds the portal's base path
+        if it isn't known yet. The remaining offsets are then requested up to max_workers at
+        a time. If total_count turns out to be stale and the last page is full, paging carries
+        on one request at a time until a short page.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        def page(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+            return [item["dataset"] for item in result.get("datasets", []) if "dataset" in item]
+
+        try:
+            # A base path that answers with no datasets is treated like one that fails
+            result = self._get_catalog(
+                "datasets",
+                params={"offset": 0, "limit": limit},
+                valid=lambda data: bool(data.get("datasets")),
+            )
+        except requests.RequestException as e:
+            logger.error(f"Failed to fetch datasets: {e}")
+            raise CatExplorerError(f"Failed to fetch datasets: {str(e)}")
+
+        datasets = page(result)
+        if not datasets:
+            return
+        total_count = result.get("total_count", 0)
+        yield total_count, datasets
+        if len(result.get("datasets", [])) < limit:
+            return
+
+        url = self.cat_session.base_url + self._base_paths()[0].format("datasets")
+
+        def fetch(offset: int) -> Dict[str, Any]:
+            response = self.cat_session.session.get(
+                url, params={"offset": offset, "limit": limit}
+            )
+            response.raise_for_status()
+            return decode_response(response)
+
+        next_offset = limit
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending: deque = deque()
+
+            def fill() -> None:
+                nonlocal next_offset
+                while len(pending) < max_workers and next_offset < total_count:
+                    pending.append(executor.submit(fetch, next_offset))
+                    next_offset += limit
+
+            try:
+                fill()
+                while True:
+                    if not pending:
+                        # total_count was stale and the last page was full
+                        pending.append(executor.submit(fetch, next_offset))
+                        next_offset += limit
+                    result = pending.popleft().result()
+                    datasets = page(result)
+                    if datasets:
+                        yield result.get("total_count", total_count), datasets
+                    # Check if we've reached the end of the datasets
+                    if len(result.get("datasets", [])) < limit:
+                        return
+                    fill()
+            except requests.RequestException as e:
+                logger.error(f"Failed to fetch datasets: {e}")
+                raise CatExplorerError(f"Failed to fetch datasets: {str(e)}")
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def search_datasets(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Full-text search of the catalogue's datasets.
+
+        Uses an ODSQL where clause holding just the quoted query, which OpenDataSoft
+        treats as a full-text search over the dataset metadata.
+
+        Args:
+            query: Free text query
+            limit: Maximum number of datasets returned (OpenDataSoft caps this at 100)
+
+        Returns:
+            List[Dict]: Matching datasets, each with dataset_id and metas
+
+        # Example usage...
+        import HerdingCats as hc
+
+        def main():
+            with hc.CatSession(hc.OpenDataSoftDataCatalogues.UK_POWER_NETWORKS_DNO) as session:
+                explore = hc.OpenDataSoftCatExplorer(session)
+                for dataset in explore.search_datasets("substation"):
+                    print(dataset["dataset_id"])
+
+        if __name__ == "__main__":
+            main()
+        """
+        escaped = query.replace('"', '\\"')
+        params = {"where": f'"{escaped}"', "limit": limit}
+
+        try:
+            result = self._get_catalog("datasets", params=params)
+        except requests.RequestException as e:
+            logger.error(f"Failed to search datasets: {e}")
+            raise CatExplorerError(f"Failed to search datasets: {str(e)}")
+
+        datasets = [item["dataset"] for item in result.get("datasets", []) if "dataset" in item]
+        logger.success(f"Found {len(datasets)} datasets for query '{query}'")
+        return datasets
+
     # ----------------------------
     # Get metadata about specific datasets in the catalogue
     # ----------------------------
+    @memoize
     def show_dataset_info(self, dataset_id):
-        urls = [
-            self.cat_session.base_url
-            + OpenDataSoftApiPaths.SHOW_DATASET_INFO.format(dataset_id),
-            self.cat_session.base_url
-            + OpenDataSoftApiPaths.SHOW_DATASET_INFO.format(dataset_id),
-        ]
-        last_error = []
-        for url in urls:
-            try:
-                response = requests.get(url)
-                response.raise_for_status()
-                data = response.json()
-                return data
-            except requests.RequestException as e:
-                last_error = e
-                continue
-        error_msg = f"\033[91mFailed to fetch dataset: {str(last_error)}. Are you sure this dataset exists? Check again.\033[0m"
-        raise CatExplorerError(error_msg)
+        try:
+            return self._get_catalog(f"datasets/{dataset_id}")
+        except requests.RequestException as e:
+            error_msg = f"\033[91mFailed to fetch dataset: {str(e)}. Are you sure this dataset exists? Check again.\033[0m"
+            raise CatExplorerError(error_msg)
 
     # ----------------------------
     # Show what export file types are available for a particular dataset
     # ----------------------------
+    @memoize
     def show_dataset_export_options(self, dataset_id):
-        urls = [
-            self.cat_session.base_url
-            + OpenDataSoftApiPaths.SHOW_DATASET_EXPORTS.format(dataset_id),
-            self.cat_session.base_url
-            + OpenDataSoftApiPaths.SHOW_DATASET_EXPORTS_2.format(dataset_id),
-        ]
-        last_error = []
-        for url in urls:
-            try:
-                response = requests.get(url)
-                response.raise_for_status()
-                data = response.json()
-
-                # Extract download links and formats
-                export_options = []
-                for link in data["links"]:
-                    if link["rel"] != "self":
-                        export_options.append(
-                            {"format": link["rel"], "download_url": link["href"]}
-                        )
+        try:
+            data = self._get_catalog(f"datasets/{dataset_id}/exports")
+        except requests.RequestException as e:
+            error_msg = f"\033[91mFailed to fetch dataset: {str(e)}. Are you sure this dataset exists? Check again.\033[0m"
+            raise CatExplorerError(error_msg)
 
-                return export_options
+        # Extract download links and formats
+        export_options = []
+        for link in data["links"]:
+            if link["rel"] != "self":
+                export_options.append({"format": link["rel"], "download_url": link["href"]})
 
-            except requests.RequestException as e:
-                last_error = e
-                continue
-
-        error_msg = f"\033[91mFailed to fetch dataset: {str(last_error)}. Are you sure this dataset exists? Check again.\033[0m"
-        raise CatExplorerError(error_msg)
+        return export_options
 
 
 # FIND THE DATA YOU WANT / NEED / ISOLATE PACKAGES AND RESOURCES
 # For French Gouv data catalogue Only
 class FrenchGouvCatExplorer:
-    def __init__(self, cat_session: CatSession):
+    def __init__(
+        self, cat_session: CatSession, cache: Optional[MetadataCache] = None
+    ):
         """
         Takes in a CatSession
 
@@ -1424,6 +2510,7 @@ class FrenchGouvCatExplorer:
 
         Args:
             CkanCatSession
+            cache: Optional MetadataCache used to memoize get_dataset_meta
 
         # Example usage...
         import HerdingCats as hc
@@ -1453,6 +2540,7 @@ class FrenchGouvCatExplorer:
             )
 
         self.cat_session = cat_session
+        self.cache = cache
 
     # ----------------------------
     # Check French Gouv site health
@@ -1467,7 +2555,7 @@ class FrenchGouvCatExplorer:
             response = self.cat_session.session.get(url)
 
             if response.status_code == 200:
-                data = response.json()
+                data = decode_response(response)
                 if data:
                     logger.success(
                         "Health Check Passed: French Gouv is running and available"
@@ -1603,7 +2691,7 @@ class FrenchGouvCatExplorer:
 
             # Handle response
             if response.status_code == 200:
-                data = response.json()
+                data = decode_response(response)
                 # Adjust the key as per actual API response structure
                 results = data.get(
                     "data", data.get("results", data.get("datasets", []))
@@ -1622,6 +2710,7 @@ class FrenchGouvCatExplorer:
     # ----------------------------
     # Get metadata for a specific datasets
     # ----------------------------
+    @memoize
     def get_dataset_meta(self, identifier: str) -> dict:
         """
         Fetches a metadata for a specific dataset using either its ID or slug.
@@ -1660,7 +2749,7 @@ class FrenchGouvCatExplorer:
 
             # Handle response
             if response.status_code == 200:
-                data = response.json()
+                data = decode_response(response)
                 resource_title = data.get("title")
                 resource_id = data.get("id")
                 logger.success(
@@ -1716,7 +2805,7 @@ class FrenchGouvCatExplorer:
             response = self.cat_session.session.get(url)
 
             if response.status_code == 200:
-                data = response.json()
+                data = decode_response(response)
                 resource_title = data.get("title")
                 resource_id = data.get("id")
                 logger.success(
@@ -1958,11 +3047,17 @@ class FrenchGouvCatExplorer:
 # FIND THE DATA YOU WANT / NEED / ISOLATE PACKAGES AND RESOURCES
 # For ONS Nomis data catalogue Only
 class ONSNomisCatExplorer:
-    def __init__(self, cat_session: CatSession):
+    def __init__(
+        self, cat_session: CatSession, cache: Optional[MetadataCache] = None
+    ):
         """
         Takes in a CatSession
 
         Allows user to start exploring data catalogue programatically
+
+        Args:
+            cat_session: CatSession for the ONS Nomis API
+            cache: Optional MetadataCache used to memoize get_dataset_info and get_codelist_meta_info
         """
         # Check if the CatSession has a catalogue_type attribute
         if not hasattr(cat_session, "catalogue_type"):
@@ -1980,6 +3075,7 @@ class ONSNomisCatExplorer:
             )
 
         self.cat_session = cat_session
+        self.cache = cache
 
     # ----------------------------
     # Check Nomis site health
@@ -2020,7 +3116,7 @@ class ONSNomisCatExplorer:
         try:
             response = self.cat_session.session.get(url)
             response.raise_for_status()
-            data = response.json()
+            data = decode_response(response)
 
             if (
                 "structure" in data
@@ -2046,6 +3142,7 @@ class ONSNomisCatExplorer:
         except requests.RequestException as e:
             raise CatExplorerError(f"Failed to search datasets: {str(e)}")
 
+    @memoize
     def get_dataset_info(self, dataset_id: str) -> dict:
         """
         Get the metadata for a specific dataset
@@ -2063,7 +3160,7 @@ class ONSNomisCatExplorer:
             )
             response = self.cat_session.session.get(url)
             response.raise_for_status()
-            return response.json()
+            return decode_response(response)
         except requests.RequestException as e:
             raise CatExplorerError(f"Failed to search datasets: {str(e)}")
 
@@ -2091,7 +3188,7 @@ class ONSNomisCatExplorer:
             )
             response = self.cat_session.session.get(url)
             response.raise_for_status()
-            data = response.json()
+            data = decode_response(response)
 
             structure = data.get("structure", {})
             keyfamilies = structure.get("keyfamilies", {}).get("keyfamily", [])
@@ -2128,6 +3225,7 @@ class ONSNomisCatExplorer:
         except requests.RequestException as e:
             raise CatExplorerError(f"Failed to search datasets: {str(e)}")
 
+    @memoize
     def get_codelist_meta_info(self, codelist_id: str) -> dict:
         """
         Get the metadata for a specific codelist
@@ -2145,7 +3243,7 @@ class ONSNomisCatExplorer:
             )
             response = self.cat_session.session.get(url)
             response.raise_for_status()
-            return response.json()
+            return decode_response(response)
         except requests.RequestException as e:
             raise CatExplorerError(f"Failed to search datasets: {str(e)}")
 
@@ -2315,7 +3413,7 @@ class ONSGeoExplorer:
             response = self.cat_session.session.get(url)
 
             if response.status_code == 200:
-                data = response.json()
+                data = decode_response(response)
                 if data:
                     logger.success(
                         "Health Check Passed: ONS Geo Portal is running and available"
@@ -2388,7 +3486,7 @@ class ONSGeoExplorer:
                 response = self.cat_session.session.get(base_url, params=params)
 
             response.raise_for_status()
-            data = response.json()
+            data = decode_response(response)
 
             logger.success(f"Search completed for query: '{q}'. Found results.")
             return data
@@ -2501,7 +3599,7 @@ class ONSGeoExplorer:
             response = self.cat_session.session.get(url, params=params)
             logger.info(f"Request URL: {response.url}")
             response.raise_for_status()
-            data = response.json()
+            data = decode_response(response)
 
             if data.get("error"):
                 logger.error(f"ArcGIS API Error: {data['error']}")
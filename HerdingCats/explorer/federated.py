@@ -0,0 +1,376 @@
+import time
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from loguru import logger
+
+from ..config.source_endpoints import FrenchGouvApiPaths
+from ..session.session import CatSession, CatalogueType
+from ..utils.json_decoder import decode_response
+from .explore import CkanCatExplorer, OpenDataSoftCatExplorer
+from .search_index import CatalogueIndex
+
+# Reciprocal rank fusion constant, keeps each portal's own ordering as a tie break
+_RRF_K = 60
+
+
+class SearchHit:
+    """
+    A dataset found by a federated search, in the same shape whichever portal it came from.
+
+    Args:
+        source: Catalogue the hit came from (the session's domain)
+        catalogue_type: Type of that catalogue, e.g. "ckan"
+        id: Dataset id or name, as used by that catalogue's explorer
+        title: Dataset title
+        description: Dataset description
+        url: Link to the dataset's page on the portal
+        organisation: Publisher
+        formats: Resource formats, where the portal lists them
+        modified: Last modified timestamp
+        rank: Position in the portal's own results, starting at 0
+        score: Merged relevance score, higher is better
+    """
+
+    __slots__ = (
+        "source",
+        "catalogue_type",
+        "id",
+        "title",
+        "description",
+        "url",
+        "organisation",
+        "formats",
+        "modified",
+        "rank",
+        "score",
+    )
+
+    def __init__(
+        self,
+        source: str,
+        catalogue_type: str,
+        id: str,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        url: Optional[str] = None,
+        organisation: Optional[str] = None,
+        formats: Tuple[str, ...] = (),
+        modified: Optional[str] = None,
+        rank: int = 0,
+        score: float = 0.0,
+    ) -> None:
+        self.source = source
+        self.catalogue_type = catalogue_type
+        self.id = id
+        self.title = title
+        self.description = description
+        self.url = url
+        self.organisation = organisation
+        self.formats = tuple(formats)
+        self.modified = modified
+        self.rank = rank
+        self.score = score
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __repr__(self) -> str:
+        return f"SearchHit(source={self.source!r}, id={self.id!r}, score={self.score:.3f})"
+
+
+class SourceResult:
+    """
+    The outcome of searching one catalogue.
+
+    Args:
+        source: Catalogue searched
+        hits: Hits in the portal's own order, empty if the search failed
+        elapsed: Seconds the search took, or the timeout if it ran out of time
+        error: The exception raised, a TimeoutError if the source ran out of time
+    """
+
+    __slots__ = ("source", "hits", "elapsed", "error")
+
+    def __init__(
+        self,
+        source: str,
+        hits: List[SearchHit],
+        elapsed: float,
+        error: Optional[Exception] = None,
+    ) -> None:
+        self.source = source
+        self.hits = hits
+        self.elapsed = elapsed
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        status = "ok" if self.ok else f"error={self.error!r}"
+        return f"SourceResult(source={self.source!r}, hits={len(self.hits)}, {status})"
+
+
+class FederatedSearch:
+    """
+    Search several catalogues at once and merge the results.
+
+    Every catalogue is searched in its own thread. Each has its own timeout, counted from
+    the start of the search. Results are returned per catalogue as soon as each one finishes,
+    so a slow portal never holds up the others. Hits are normalised to SearchHit, and merged
+    results are ranked by scoring every hit against the query with BM25. Each portal's own
+    ordering is used as a tie break.
+
+    Supports CKAN, OpenDataSoft and data.gouv.fr sessions.
+
+    Args:
+        sessions: Open CatSessions for the catalogues to search
+        timeout: Seconds each catalogue gets before it is reported as timed out
+        timeouts: Per catalogue overrides, keyed by session domain
+        rows: Results requested from each catalogue
+
+    # Example usage...
+    import HerdingCats as hc
+
+    def main():
+        with hc.CatSession(hc.CkanDataCatalogues.NATIONAL_GRID_DNO) as ckan, \\
+             hc.CatSession(hc.OpenDataSoftDataCatalogues.UK_POWER_NETWORKS_DNO) as ods, \\
+             hc.CatSession(hc.FrenchGouvCatalogue.GOUV_FR) as gouv:
+            search = hc.FederatedSearch([ckan, ods, gouv], timeout=5)
+
+            # Results from each catalogue as soon as it answers
+            for result in search.iter_search("substation"):
+                print(result.source, len(result.hits), result.error)
+
+            # Or everything merged into a single ranking
+            for hit in search.search("substation", limit=20):
+                print(hit.score, hit.source, hit.title)
+
+    if __name__ == "__main__":
+        main()
+    """
+
+    def __init__(
+        self,
+        sessions: Iterable[CatSession],
+        timeout: float = 10.0,
+        timeouts: Optional[Dict[str, float]] = None,
+        rows: int = 20,
+    ) -> None:
+        self.sessions = list(sessions)
+        if not self.sessions:
+            raise ValueError("At least one session is required")
+        if timeout <= 0:
+            raise ValueError("timeout must be greater than 0")
+
+        self.timeout = timeout
+        self.timeouts = timeouts or {}
+        self.rows = rows
+        self._searchers = [
+            (session.domain, self._searcher(session)) for session in self.sessions
+        ]
+
+    # ----------------------------
+    # Search
+    # ----------------------------
+    def iter_search(self, query: str) -> Iterator[SourceResult]:
+        """
+        Search every catalogue concurrently, yielding each result as it finishes.
+
+        Catalogues that fail yield a SourceResult holding the error. Catalogues still
+        running when their timeout expires yield one holding a TimeoutError. Their requests
+        are left to finish in the background and the results are discarded.
+
+        Args:
+            query: Free text query
+
+        Returns:
+            Iterator[SourceResult]
+        """
+        start = time.monotonic()
+        executor = ThreadPoolExecutor(
+            max_workers=len(self._searchers), thread_name_prefix="federated-search"
+        )
+        pending: Dict[Future, Tuple[str, float]] = {}
+        for source, searcher in self._searchers:
+            future = executor.submit(self._run, source, searcher, query)
+            pending[future] = (source, start + self.timeouts.get(source, self.timeout))
+
+        try:
+            while pending:
+                next_deadline = min(deadline for _, deadline in pending.values())
+                done, _ = wait(
+                    pending,
+                    timeout=max(0.0, next_deadline - time.monotonic()),
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    pending.pop(future)
+                    yield future.result()
+
+                now = time.monotonic()
+                for future, (source, deadline) in list(pending.items()):
+                    if deadline <= now and not future.done():
+                        pending.pop(future)
+                        future.cancel()
+                        budget = deadline - start
+                        logger.warning(f"Search of {source} timed out after {budget:.1f}s")
+                        yield SourceResult(
+                            source,
+                            [],
+                            budget,
+                            TimeoutError(f"{source} did not answer within {budget:.1f}s"),
+                        )
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[SearchHit]:
+        """
+        Search every catalogue and merge the hits into one ranking.
+
+        Catalogues that fail or time out are logged and left out.
+
+        Args:
+            query: Free text query
+            limit: Maximum number of hits returned
+
+        Returns:
+            List[SearchHit]: Best matches first
+        """
+        hits = [hit for result in self.iter_search(query) for hit in result.hits]
+        merged = self.merge(query, hits)
+        return merged[:limit] if limit is not None else merged
+
+    @staticmethod
+    def merge(query: str, hits: List[SearchHit]) -> List[SearchHit]:
+        """
+        Rank hits from different catalogues against each other.
+
+        Portals score relevance differently, so their scores cannot be compared.
+        Instead every hit's title, description and formats are scored against the
+        query with BM25. Reciprocal rank fusion of each portal's own ordering is
+        added so hits the portal ranked highly stay ahead on ties.
+        """
+        index = CatalogueIndex()
+        for position, hit in enumerate(hits):
+            index.add(
+                str(position),
+                title=hit.title,
+                notes=hit.description,
+                formats=hit.formats,
+                name=hit.id,
+            )
+        relevance = {
+            int(result["id"]): result["score"]
+            for result in index.search(query, limit=len(hits))
+        }
+
+        for position, hit in enumerate(hits):
+            hit.score = relevance.get(position, 0.0) + 1 / (_RRF_K + hit.rank + 1)
+        return sorted(hits, key=lambda hit: hit.score, reverse=True)
+
+    def _run(
+        self, source: str, searcher: Callable[[str], List[SearchHit]], query: str
+    ) -> SourceResult:
+        start = time.monotonic()
+        try:
+            hits = searcher(query)
+            elapsed = time.monotonic() - start
+            logger.info(f"{source} returned {len(hits)} hits in {elapsed:.2f}s")
+            return SourceResult(source, hits, elapsed)
+        except Exception as e:
+            logger.warning(f"Search of {source} failed: {e}")
+            return SourceResult(source, [], time.monotonic() - start, e)
+
+    # ----------------------------
+    # Per catalogue searches, normalised to SearchHit
+    # ----------------------------
+    def _searcher(self, session: CatSession) -> Callable[[str], List[SearchHit]]:
+        match session.catalogue_type:
+            case CatalogueType.CKAN:
+                explorer = CkanCatExplorer(session)
+                return lambda query: self._search_ckan(explorer, query)
+            case CatalogueType.OPENDATA_SOFT:
+                explorer = OpenDataSoftCatExplorer(session)
+                return lambda query: self._search_opendatasoft(explorer, query)
+            case CatalogueType.GOUV_FR:
+                return lambda query: self._search_french_gouv(session, query)
+            case _:
+                raise ValueError(
+                    f"Federated search does not support {session.catalogue_type} catalogues"
+                )
+
+    def _search_ckan(self, explorer: CkanCatExplorer, query: str) -> List[SearchHit]:
+        session = explorer.cat_session
+        packages = explorer.package_search(query, self.rows).get("results", [])
+        return [
+            SearchHit(
+                session.domain,
+                CatalogueType.CKAN.value,
+                package.get("name"),
+                title=package.get("title"),
+                description=package.get("notes"),
+                url=f"{session.base_url}/dataset/{package.get('name')}",
+                organisation=(package.get("organization") or {}).get("name"),
+                formats=tuple(
+                    r.get("format") for r in package.get("resources") or [] if r.get("format")
+                ),
+                modified=package.get("metadata_modified"),
+                rank=rank,
+            )
+            for rank, package in enumerate(packages)
+        ]
+
+    def _search_opendatasoft(
+        self, explorer: OpenDataSoftCatExplorer, query: str
+    ) -> List[SearchHit]:
+        session = explorer.cat_session
+        hits = []
+        for rank, dataset in enumerate(explorer.search_datasets(query, self.rows)):
+            metas = (dataset.get("metas") or {}).get("default") or {}
+            hits.append(
+                SearchHit(
+                    session.domain,
+                    CatalogueType.OPENDATA_SOFT.value,
+                    dataset.get("dataset_id"),
+                    title=metas.get("title"),
+                    description=metas.get("description"),
+                    url=f"{session.base_url}/explore/dataset/{dataset.get('dataset_id')}/",
+                    organisation=metas.get("publisher"),
+                    modified=metas.get("modified"),
+                    rank=rank,
+                )
+            )
+        return hits
+
+    def _search_french_gouv(self, session: CatSession, query: str) -> List[SearchHit]:
+        # FrenchGouvCatExplorer.search_datasets returns [] on any failure, which would
+        # report an outage as a search with no hits, so the API is called directly
+        response = session.session.get(
+            session.base_url + FrenchGouvApiPaths.SEARCH_DATASETS,
+            params={"q": query, "page_size": self.rows},
+        )
+        response.raise_for_status()
+        datasets = decode_response(response).get("data", [])
+        return [
+            SearchHit(
+                session.domain,
+                CatalogueType.GOUV_FR.value,
+                dataset.get("slug") or dataset.get("id"),
+                title=dataset.get("title"),
+                description=dataset.get("description"),
+                url=dataset.get("page")
+                or f"{session.base_url}/datasets/{dataset.get('slug') or dataset.get('id')}",
+                organisation=(dataset.get("organization") or {}).get("name"),
+                formats=tuple(
+                    r.get("format").upper()
+                    for r in dataset.get("resources") or []
+                    if r.get("format")
+                ),
+                modified=dataset.get("last_modified"),
+                rank=rank,
+            )
+            for rank, dataset in enumerate(datasets)
+        ]
@@ -0,0 +1,194 @@
+import copy
+import functools
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+# Marks a lookup that found nothing, so None can still be told apart from a miss
+_MISSING = object()
+
+
+class MetadataCache:
+    """
+    In-memory LRU cache for explorer metadata calls.
+
+    Entries are keyed by catalogue (the session's base URL), endpoint (the explorer method
+    name) and the call's arguments, expire after ttl seconds and the least recently used entry is dropped once max_entries is reached.
+    Only successful, non-empty results are cached, errors always go back to the network.
+
+    A cache can be shared by several explorers, including explorers for different catalogues,
+    whose results are kept apart. Values are copied on the way in and out,
+    so changing a returned dictionary never changes what is cached.
+
+    Args:
+        max_entries: Maximum number of results kept
+        ttl: Seconds a result is reused for. None keeps results until they are evicted or invalidated
+
+    # Example usage...
+    import HerdingCats as hc
+
+    def main():
+        cache = hc.MetadataCache(max_entries=2048, ttl=600)
+        with hc.CatSession(hc.CkanDataCatalogues.UK_GOV) as session:
+            explore = hc.CkanCatExplorer(session, cache=cache)
+            explore.show_package_info("package-name")  # network
+            explore.show_package_info("package-name")  # cache
+            cache.invalidate("show_package_info", "package-name")
+            print(cache.stats())
+
+    if __name__ == "__main__":
+        main()
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = 300) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be greater than 0")
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(catalogue: Optional[str], endpoint: str, *args, **kwargs) -> Hashable:
+        """Build the cache key for a catalogue's endpoint and its arguments."""
+        return (endpoint, catalogue, _freeze(args), _freeze(kwargs))
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a copy of the cached value for a key, or default if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (
+                entry[0] is None or entry[0] > time.monotonic()
+            ):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(entry[1])
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache a copy of a value, evicting the least recently used entry if full."""
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(
+        self,
+        endpoint: Optional[str] = None,
+        *args,
+        catalogue: Optional[str] = None,
+        **kwargs,
+    ) -> int:
+        """
+        Remove cached results.
+
+        Args:
+            endpoint: Explorer method name. None clears everything
+            *args, **kwargs: Only remove the result for these arguments.
+            If none are given every result for the endpoint is removed
+            catalogue: Only remove results from this catalogue's base URL.
+            None removes them for every catalogue
+
+        Returns:
+            int: Number of entries removed
+        """
+        with self._lock:
+            if endpoint is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+
+            arguments = (_freeze(args), _freeze(kwargs)) if args or kwargs else None
+            keys = [
+                key
+                for key in self._entries
+                if key[0] == endpoint
+                and (catalogue is None or key[1] == catalogue)
+                and (arguments is None or key[2:] == arguments)
+            ]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        """Remove every cached result and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return cache metrics.
+
+        Returns:
+            dict: hits, misses and the number of entries currently cached
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _freeze(value: Any) -> Hashable:
+    """Turn dictionaries, lists and sets into hashable equivalents."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    return value
+
+
+def memoize(method: Callable) -> Callable:
+    """
+    Cache an explorer method's results in the explorer's MetadataCache.
+
+    Explorers without a cache (self.cache is None) call straight through.
+    """
+    endpoint = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        cache: Optional[MetadataCache] = getattr(self, "cache", None)
+        if cache is None:
+            return method(self, *args, **kwargs)
+
+        # Explorers for different catalogues can share a cache, so the base URL is in the key
+        session = getattr(self, "cat_session", None)
+        catalogue = getattr(session, "base_url", None)
+        try:
+            key = cache.make_key(catalogue, endpoint, *args, **kwargs)
+            hash(key)
+        except TypeError:
+            return method(self, *args, **kwargs)
+
+        result = cache.get(key, _MISSING)
+        if result is not _MISSING:
+            return result
+
+        result = method(self, *args, **kwargs)
+        if result:
+            cache.set(key, result)
+        return result
+
+    return wrapper
@@ -0,0 +1,187 @@
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+
+class ResourceRecord:
+    """
+    A single downloadable resource.
+
+    Uses __slots__, so a record takes a fraction of the memory of the dictionary or list
+    it replaces, and a loader can validate it with one isinstance check.
+
+    For compatibility with code written against the old [name, created, format, url] lists,
+    a record can also be indexed, unpacked and compared like that list. It hashes like the
+    equivalent (name, created, format, url) tuple, so records and tuples can be mixed in
+    sets and dictionary keys.
+
+    Args:
+        name: Resource name
+        created: Creation timestamp as returned by the catalogue
+        format: File format, e.g. "CSV"
+        url: Download URL
+        id: Resource id, if the catalogue has one
+        last_modified: Last modified timestamp, if the catalogue has one
+        package: Name of the package the resource belongs to
+
+    # Example usage...
+    import HerdingCats as hc
+
+    def main():
+        with hc.CatSession(hc.CkanDataCatalogues.LONDON_DATA_STORE) as session:
+            explore = hc.CkanCatExplorer(session)
+            resources = explore.extract_resource_url(explore.show_package_info("package-name"))
+            for resource in resources:
+                print(resource.format, resource.url)
+
+            loader = hc.CkanLoader()
+            df = loader.polars_data_loader(resources, "csv")
+
+    if __name__ == "__main__":
+        main()
+    """
+
+    __slots__ = ("name", "created", "format", "url", "id", "last_modified", "package")
+
+    def __init__(
+        self,
+        name: Optional[str],
+        created: Optional[str],
+        format: Optional[str],
+        url: Optional[str],
+        id: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        package: Optional[str] = None,
+    ) -> None:
+        self.name = name
+        self.created = created
+        self.format = format
+        self.url = url
+        self.id = id
+        self.last_modified = last_modified
+        self.package = package
+
+    @classmethod
+    def from_ckan(
+        cls, resource: Dict[str, Any], package: Optional[str] = None
+    ) -> "ResourceRecord":
+        """Build a record from a resource in a CKAN package."""
+        return cls(
+            resource.get("name"),
+            resource.get("created"),
+            resource.get("format"),
+            resource.get("url"),
+            resource.get("id"),
+            resource.get("last_modified"),
+            package,
+        )
+
+    def _positional(self) -> Tuple[Optional[str], ...]:
+        return (self.name, self.created, self.format, self.url)
+
+    def __getitem__(self, index):
+        return self._positional()[index]
+
+    def __len__(self) -> int:
+        return 4
+
+    def __iter__(self) -> Iterator[Optional[str]]:
+        return iter(self._positional())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ResourceRecord):
+            return all(
+                getattr(self, slot) == getattr(other, slot) for slot in self.__slots__
+            )
+        if isinstance(other, (list, tuple)):
+            return list(self._positional()) == list(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        # Records equal to a tuple must hash like it. Records equal to each other share
+        # these fields too, so they hash the same
+        return hash(self._positional())
+
+    def __repr__(self) -> str:
+        return f"ResourceRecord(name={self.name!r}, format={self.format!r}, url={self.url!r})"
+
+
+class PackageRecord:
+    """
+    A package (dataset) and its resources.
+
+    Uses __slots__ and holds its resources as a tuple of ResourceRecords, so a harvest of a
+    whole catalogue can be kept in memory far more cheaply than the raw package dictionaries.
+
+    Args:
+        id: Package id
+        name: Package name
+        title: Package title
+        organisation: Name of the publishing organisation
+        notes: Package description
+        metadata_modified: Last modified timestamp of the package metadata
+        resources: The package's resources
+        tags: Tag names
+    """
+
+    __slots__ = (
+        "id",
+        "name",
+        "title",
+        "organisation",
+        "notes",
+        "metadata_modified",
+        "resources",
+        "tags",
+    )
+
+    def __init__(
+        self,
+        id: Optional[str],
+        name: Optional[str],
+        title: Optional[str] = None,
+        organisation: Optional[str] = None,
+        notes: Optional[str] = None,
+        metadata_modified: Optional[str] = None,
+        resources: Tuple[ResourceRecord, ...] = (),
+        tags: Tuple[str, ...] = (),
+    ) -> None:
+        self.id = id
+        self.name = name
+        self.title = title
+        self.organisation = organisation
+        self.notes = notes
+        self.metadata_modified = metadata_modified
+        self.resources = tuple(resources)
+        self.tags = tuple(tags)
+
+    @classmethod
+    def from_ckan(cls, package: Dict[str, Any]) -> "PackageRecord":
+        """Build a record from a CKAN package dictionary."""
+        name = package.get("name")
+        organisation = package.get("organization") or {}
+        return cls(
+            package.get("id"),
+            name,
+            package.get("title"),
+            organisation.get("name"),
+            package.get("notes_markdown") or package.get("notes"),
+            package.get("metadata_modified"),
+            tuple(
+                ResourceRecord.from_ckan(resource, name)
+                for resource in package.get("resources") or []
+            ),
+            tuple(tag.get("name") for tag in package.get("tags") or [] if tag.get("name")),
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PackageRecord):
+            return NotImplemented
+        return all(getattr(self, slot) == getattr(other, slot) for slot in self.__slots__)
+
+    def __hash__(self) -> int:
+        return hash((self.id, self.name, self.metadata_modified))
+
+    def __repr__(self) -> str:
+        return (
+            f"PackageRecord(name={self.name!r}, organisation={self.organisation!r}, "
+            f"resources={len(self.resources)})"
+        )
@@ -0,0 +1,58 @@
+"""
+msgspec schemas for the large CKAN responses.
+
+Each schema lists only the fields the explorers use, so msgspec can skip the rest of
+the payload while decoding. Only imported when msgspec is installed, see schema().
+"""
+
+from typing import List, Optional
+
+import msgspec
+
+
+class CkanResource(msgspec.Struct):
+    id: Optional[str] = None
+    name: Optional[str] = None
+    format: Optional[str] = None
+    url: Optional[str] = None
+    created: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class CkanOrganisation(msgspec.Struct):
+    name: Optional[str] = None
+
+
+class CkanGroup(msgspec.Struct):
+    name: Optional[str] = None
+
+
+class CkanTag(msgspec.Struct):
+    name: Optional[str] = None
+
+
+class CkanHarvestPackage(msgspec.Struct):
+    id: Optional[str] = None
+    name: Optional[str] = None
+    title: Optional[str] = None
+    maintainer: Optional[str] = None
+    maintainer_email: Optional[str] = None
+    notes: Optional[str] = None
+    notes_markdown: Optional[str] = None
+    metadata_modified: Optional[str] = None
+    organization: Optional[CkanOrganisation] = None
+    groups: List[CkanGroup] = []
+    tags: List[CkanTag] = []
+    resources: List[CkanResource] = []
+
+
+class CkanHarvestPage(msgspec.Struct):
+    """current_package_list_with_resources"""
+
+    result: List[CkanHarvestPackage]
+
+
+class CkanPackageList(msgspec.Struct):
+    """package_list"""
+
+    result: List[str]
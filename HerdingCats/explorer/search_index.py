@@ -0,0 +1,309 @@
+import heapq
+import json
+import math
+import os
+import re
+import threading
+
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+from loguru import logger
+
+from .records import PackageRecord
+
+# Bumped if the layout of the saved index changes
+INDEX_VERSION = 1
+
+_TOKEN = re.compile(r"\w+")
+
+# Common words that would match most packages and add nothing to the ranking
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from in is it of on or the to with".split()
+)
+
+# How many times a term in each field counts towards a package's score
+FIELD_WEIGHTS = {"title": 3, "name": 2, "tags": 2, "formats": 1, "notes": 1}
+
+
+def tokenise(text: Optional[str]) -> List[str]:
+    """Lowercase a string and split it into search terms."""
+    if not text:
+        return []
+    return [t for t in _TOKEN.findall(text.lower()) if t not in _STOPWORDS]
+
+
+class CatalogueIndex:
+    """
+    Local full-text index over harvested catalogue metadata, ranked with BM25.
+
+    Packages are indexed by title, name, notes, tags and resource formats, with title
+    matches counting most. Queries run in memory against an inverted index, so they take
+    milliseconds, work offline and behave the same whichever portal the metadata came from.
+
+    Adding a package that is already indexed replaces it, so the index can be kept up
+    to date from incremental harvests. Indexes can be saved to and loaded from JSON.
+
+    Args:
+        k1: BM25 term frequency saturation
+        b: BM25 document length normalisation
+
+    # Example usage...
+    import HerdingCats as hc
+
+    def main():
+        with hc.CatSession(hc.CkanDataCatalogues.UK_GOV) as session:
+            explore = hc.CkanCatExplorer(session)
+            index = explore.build_search_index()
+        index.save("uk_gov_index.json")
+
+        for hit in index.search("road traffic accidents", limit=5, res_format="CSV"):
+            print(hit["id"], hit["score"], hit["title"])
+
+    if __name__ == "__main__":
+        main()
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75) -> None:
+        self.k1 = k1
+        self.b = b
+        # term -> {package id: weighted term frequency}
+        self._postings: Dict[str, Dict[str, int]] = {}
+        # package id -> {term: weighted term frequency}, used to remove a package
+        self._terms: Dict[str, Dict[str, int]] = {}
+        self._lengths: Dict[str, int] = {}
+        self._total_length = 0
+        # package id -> fields returned with search results
+        self._documents: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    # ----------------------------
+    # Add and remove packages
+    # ----------------------------
+    def add(
+        self,
+        package_id: str,
+        title: Optional[str] = None,
+        notes: Optional[str] = None,
+        tags: Iterable[str] = (),
+        formats: Iterable[str] = (),
+        name: Optional[str] = None,
+        **fields: Any,
+    ) -> None:
+        """
+        Index a package, replacing it if it is already in the index.
+
+        Args:
+            package_id: Unique id for the package, returned with search results
+            title: Package title
+            notes: Package description
+            tags: Tag names
+            formats: Resource formats, e.g. ["CSV", "JSON"]
+            name: Package name or slug
+            **fields: Extra values stored and returned with search results, not searched
+        """
+        tags = list(tags)
+        formats = sorted({f.upper() for f in formats if f})
+
+        frequencies: Counter = Counter()
+        for field, text in (
+            ("title", title),
+            ("name", name),
+            ("notes", notes),
+            ("tags", " ".join(tags)),
+            ("formats", " ".join(formats)),
+        ):
+            weight = FIELD_WEIGHTS[field]
+            for term in tokenise(text):
+                frequencies[term] += weight
+
+        with self._lock:
+            self._remove(package_id)
+            self._terms[package_id] = dict(frequencies)
+            length = sum(frequencies.values())
+            self._lengths[package_id] = length
+            self._total_length += length
+            for term, frequency in frequencies.items():
+                self._postings.setdefault(term, {})[package_id] = frequency
+            self._documents[package_id] = {
+                "title": title,
+                "name": name,
+                "tags": tags,
+                "formats": formats,
+                **fields,
+            }
+
+    def add_ckan_package(self, package: Dict[str, Any]) -> None:
+        """Index a CKAN package dictionary, as returned by package_show or package_search."""
+        organisation = package.get("organization") or {}
+        self.add(
+            package.get("name") or package["id"],
+            title=package.get("title"),
+            notes=package.get("notes") or package.get("notes_markdown"),
+            tags=[tag.get("name") or "" for tag in package.get("tags") or []],
+            formats=[r.get("format") or "" for r in package.get("resources") or []],
+            name=package.get("name"),
+            organisation=organisation.get("name"),
+            metadata_modified=package.get("metadata_modified"),
+        )
+
+    def add_record(self, record: PackageRecord) -> None:
+        """Index a PackageRecord."""
+        self.add(
+            record.name or record.id,
+            title=record.title,
+            notes=record.notes,
+            tags=record.tags,
+            formats=[r.format or "" for r in record.resources],
+            name=record.name,
+            organisation=record.organisation,
+            metadata_modified=record.metadata_modified,
+        )
+
+    def apply_harvest(
+        self, changed: Dict[str, List[Dict[str, Any]]], deleted: Iterable[str] = ()
+    ) -> None:
+        """
+        Update the index from the output of CkanCatExplorer.harvest_incremental.
+
+        Changed packages are indexed by the title, tags, notes and resource formats
+        carried in their harvest rows.
+        """
+        for name in deleted:
+            self.remove(name)
+        for name, rows in changed.items():
+            first = rows[0] if rows else {}
+            self.add(
+                name,
+                title=first.get("title"),
+                notes=first.get("notes_markdown"),
+                tags=first.get("tags") or [],
+                formats=[row.get("resource_format") or "" for row in rows],
+                name=name,
+                organisation=first.get("organisation"),
+                metadata_modified=first.get("metadata_modified"),
+            )
+
+    def remove(self, package_id: str) -> bool:
+        """
+        Remove a package from the index.
+
+        Returns:
+            bool: True if the package was indexed
+        """
+        with self._lock:
+            return self._remove(package_id)
+
+    def _remove(self, package_id: str) -> bool:
+        terms = self._terms.pop(package_id, None)
+        if terms is None:
+            return False
+        for term in terms:
+            postings = self._postings[term]
+            del postings[package_id]
+            if not postings:
+                del self._postings[term]
+        self._total_length -= self._lengths.pop(package_id)
+        del self._documents[package_id]
+        return True
+
+    # ----------------------------
+    # Query the index
+    # ----------------------------
+    def search(
+        self, query: str, limit: int = 10, res_format: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Rank packages against a free text query.
+
+        Packages matching any query term are scored with BM25, so packages matching more
+        (and rarer) terms rank higher.
+
+        Args:
+            query: Free text query
+            limit: Maximum number of results
+            res_format: Only return packages with a resource in this format, e.g. "CSV"
+
+        Returns:
+            List[Dict]: Best matches first, each with id, score and the stored fields
+        """
+        terms = tokenise(query)
+        wanted_format = res_format.upper() if res_format else None
+
+        with self._lock:
+            count = len(self._lengths)
+            if not terms or not count:
+                return []
+            average_length = self._total_length / count
+
+            scores: Counter = Counter()
+            for term in set(terms):
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for package_id, frequency in postings.items():
+                    norm = self.k1 * (
+                        1 - self.b + self.b * self._lengths[package_id] / average_length
+                    )
+                    scores[package_id] += idf * frequency * (self.k1 + 1) / (frequency + norm)
+
+            if wanted_format:
+                scores = Counter(
+                    {
+                        package_id: score
+                        for package_id, score in scores.items()
+                        if wanted_format in self._documents[package_id]["formats"]
+                    }
+                )
+
+            best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+            return [
+                {"id": package_id, "score": score, **self._documents[package_id]}
+                for package_id, score in best
+            ]
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def __contains__(self, package_id: str) -> bool:
+        return package_id in self._lengths
+
+    # ----------------------------
+    # Save and load
+    # ----------------------------
+    def save(self, path: Union[str, Path]) -> Path:
+        """Write the index to a JSON file, atomically."""
+        target = Path(path).expanduser()
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temporary = target.with_name(f"{target.name}.tmp")
+        with self._lock:
+            data = {
+                "version": INDEX_VERSION,
+                "k1": self.k1,
+                "b": self.b,
+                "terms": self._terms,
+                "documents": self._documents,
+            }
+            temporary.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(temporary, target)
+        logger.success(f"Saved search index of {len(self)} packages to {target}")
+        return target
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "CatalogueIndex":
+        """Load an index saved with save()."""
+        data = json.loads(Path(path).expanduser().read_text(encoding="utf-8"))
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported search index version {data.get('version')}")
+
+        index = cls(k1=data["k1"], b=data["b"])
+        index._terms = data["terms"]
+        index._documents = data["documents"]
+        for package_id, terms in index._terms.items():
+            length = sum(terms.values())
+            index._lengths[package_id] = length
+            index._total_length += length
+            for term, frequency in terms.items():
+                index._postings.setdefault(term, {})[package_id] = frequency
+        return index
@@ -0,0 +1,136 @@
+import json
+import os
+
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+from loguru import logger
+
+# Bumped if the layout of the snapshot file changes
+SNAPSHOT_VERSION = 1
+
+
+class HarvestSnapshot:
+    """
+    Local copy of a CKAN catalogue's packages, kept up to date by incremental harvests.
+
+    Each package is stored as the flattened resource rows produced by
+    CkanCatExplorer.harvest_package_resources, keyed by package name.
+    The watermark is the newest metadata_modified seen, so the next harvest only asks
+    the catalogue for packages changed since then.
+
+    Snapshots are saved as a single JSON file, written to a temporary file first
+    so an interrupted save never leaves a half written snapshot behind.
+
+    Args:
+        path: JSON file the snapshot is saved to and loaded from
+
+    # Example usage...
+    import HerdingCats as hc
+
+    def main():
+        snapshot = hc.HarvestSnapshot.load("london_datastore.json")
+        with hc.CatSession(hc.CkanDataCatalogues.LONDON_DATA_STORE) as session:
+            explore = hc.CkanCatExplorer(session)
+            changed, deleted = explore.harvest_incremental(snapshot)
+            print(f"{len(changed)} changed, {len(deleted)} deleted")
+        snapshot.save()
+
+    if __name__ == "__main__":
+        main()
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None) -> None:
+        self.path = Path(path).expanduser() if path is not None else None
+        self.watermark: Optional[str] = None
+        self.harvested_at: Optional[str] = None
+        self.packages: Dict[str, List[Dict[str, Any]]] = {}
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "HarvestSnapshot":
+        """
+        Load a snapshot from disk. A missing file gives an empty snapshot,
+        so the first harvest into it is a full one.
+        """
+        snapshot = cls(path)
+        if not snapshot.path.exists():
+            return snapshot
+
+        data = json.loads(snapshot.path.read_text(encoding="utf-8"))
+        if data.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(
+                f"Unsupported snapshot version {data.get('version')} in {snapshot.path}"
+            )
+        snapshot.watermark = data["watermark"]
+        snapshot.harvested_at = data["harvested_at"]
+        snapshot.packages = data["packages"]
+        return snapshot
+
+    def save(self, path: Optional[Union[str, Path]] = None) -> Path:
+        """
+        Write the snapshot to disk.
+
+        Args:
+            path: Where to write it. Defaults to the path the snapshot was created with
+
+        Returns:
+            Path: The file written
+        """
+        target = Path(path).expanduser() if path is not None else self.path
+        if target is None:
+            raise ValueError("No path given for the snapshot")
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temporary = target.with_name(f"{target.name}.tmp")
+        temporary.write_text(
+            json.dumps(
+                {
+                    "version": SNAPSHOT_VERSION,
+                    "watermark": self.watermark,
+                    "harvested_at": self.harvested_at,
+                    "packages": self.packages,
+                }
+            ),
+            encoding="utf-8",
+        )
+        os.replace(temporary, target)
+        self.path = target
+        logger.success(f"Saved snapshot of {len(self.packages)} packages to {target}")
+        return target
+
+    def merge(
+        self, packages: Dict[str, List[Dict[str, Any]]], deleted: Iterable[str] = ()
+    ) -> None:
+        """
+        Apply a harvest to the snapshot.
+
+        Args:
+            packages: New or changed packages, as resource rows keyed by package name
+            deleted: Names of packages no longer in the catalogue
+        """
+        for name in deleted:
+            self.packages.pop(name, None)
+
+        for name, rows in packages.items():
+            self.packages[name] = rows
+            modified = self.modified(name)
+            if modified and (self.watermark is None or modified > self.watermark):
+                self.watermark = modified
+
+        self.harvested_at = datetime.now(timezone.utc).isoformat()
+
+    def modified(self, name: str) -> Optional[str]:
+        """metadata_modified of a package in the snapshot, None if it is not there."""
+        rows = self.packages.get(name)
+        return rows[0].get("metadata_modified") if rows else None
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over every resource row in the snapshot."""
+        for rows in self.packages.values():
+            yield from rows
+
+    def __len__(self) -> int:
+        return len(self.packages)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.packages
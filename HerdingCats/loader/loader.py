@@ -1,9 +1,6 @@
+from __future__ import annotations
+
 import requests
-import pandas as pd
-import polars as pl
-import duckdb
-import boto3
-import pyarrow as pa
 import uuid
 import urllib.parse
 from ..errors.errors import OpenDataSoftExplorerError, FrenchCatDataLoaderError
@@ -17,11 +14,22 @@ from .loader_stores import (
     ResourceValidators,
 )
 
-from typing import Union, Optional, Literal, List, Dict, Any
-from pandas.core.frame import DataFrame as PandasDataFrame
-from polars.dataframe.frame import DataFrame as PolarsDataFrame
+from typing import TYPE_CHECKING, Union, Optional, Literal, List, Dict, Any
 from io import BytesIO
 from loguru import logger
+from ..utils.json_decoder import decode_response
+from ..utils.lazy_imports import LazyModule
+
+if TYPE_CHECKING:
+    from pandas.core.frame import DataFrame as PandasDataFrame
+    from polars.dataframe.frame import DataFrame as PolarsDataFrame
+
+# Heavy dependencies are only imported when a loader actually needs them
+pd = LazyModule("pandas")
+pl = LazyModule("polars")
+duckdb = LazyModule("duckdb")
+boto3 = LazyModule("boto3")
+pa = LazyModule("pyarrow")
 
 # TODO: Start building proper data loader stores for different formats and locations
 # TODO: further harmonise how the loader deal with the input data
@@ -34,9 +42,15 @@ class CkanLoader:
 
     STORAGE_TYPES = {"s3": S3Uploader, "local": LocalUploader}
 
-    def __init__(self):
+    def __init__(self, cat_session: Optional[CatSession] = None) -> None:
+        """
+        Args:
+            cat_session: Optional CatSession used to download resources.
+            Downloads then share its connection pool, retry policy and rate limits.
+        """
         self._validate_dependencies()
         self.df_loader = DataFrameLoader()
+        self._http = cat_session.session if cat_session is not None else requests
 
     def _validate_dependencies(self):
         """Validate that all required dependencies are available."""
@@ -47,7 +61,11 @@ class CkanLoader:
             "boto3": boto3,
             "pyarrow": pa,
         }
-        missing = [name for name, module in required_modules.items() if module is None]
+        missing = [
+            name
+            for name, module in required_modules.items()
+            if not module.is_available()
+        ]
         if missing:
             raise ImportError(f"Missing required dependencies: {', '.join(missing)}")
 
@@ -62,7 +80,7 @@ class CkanLoader:
             BytesIO object containing the data
         """
         try:
-            response = requests.get(url)
+            response = self._http.get(url)
             response.raise_for_status()
             return BytesIO(response.content)
         except requests.RequestException as e:
@@ -104,9 +122,9 @@ class CkanLoader:
         )
         headers = {"Authorization": api_key} if api_key else {}
 
-        response = requests.get(api_call, headers=headers)
+        response = session.session.get(api_call, headers=headers)
         response.raise_for_status()
-        data = response.json()
+        data = decode_response(response)
         records = data["result"]["result"]["records"]
         return pl.DataFrame(records) if records else pl.DataFrame([])
 
@@ -347,9 +365,15 @@ class OpenDataSoftLoader:
 
     STORAGE_TYPES = {"s3": S3Uploader, "local": LocalUploader}
 
-    def __init__(self) -> None:
+    def __init__(self, cat_session: Optional[CatSession] = None) -> None:
+        """
+        Args:
+            cat_session: Optional CatSession used to download resources.
+            Downloads then share its connection pool, retry policy and rate limits.
+        """
         self._validate_dependencies()
         self.df_loader = DataFrameLoader()
+        self._http = cat_session.session if cat_session is not None else requests
 
     def _validate_dependencies(self):
         """Validate that all required dependencies are available."""
@@ -360,7 +384,11 @@ class OpenDataSoftLoader:
             "boto3": boto3,
             "pyarrow": pa,
         }
-        missing = [name for name, module in required_modules.items() if module is None]
+        missing = [
+            name
+            for name, module in required_modules.items()
+            if not module.is_available()
+        ]
         if missing:
             raise ImportError(f"Missing required dependencies: {', '.join(missing)}")
 
@@ -416,7 +444,7 @@ class OpenDataSoftLoader:
             if api_key:
                 url = f"{url}?apikey={api_key}"
 
-            response = requests.get(url)
+            response = self._http.get(url)
             response.raise_for_status()
             return BytesIO(response.content)
         except requests.RequestException as e:
@@ -639,9 +667,15 @@ class FrenchGouvLoader:
 
     STORAGE_TYPES = {"s3": S3Uploader, "local": LocalUploader}
 
-    def __init__(self) -> None:
+    def __init__(self, cat_session: Optional[CatSession] = None) -> None:
+        """
+        Args:
+            cat_session: Optional CatSession used to download resources.
+            Downloads then share its connection pool, retry policy and rate limits.
+        """
         self._validate_dependencies()
         self.df_loader = DataFrameLoader()
+        self._http = cat_session.session if cat_session is not None else requests
 
     def _validate_dependencies(self):
         """Validate that all required dependencies are available."""
@@ -652,7 +686,11 @@ class FrenchGouvLoader:
             "boto3": boto3,
             "pyarrow": pa,
         }
-        missing = [name for name, module in required_modules.items() if module is None]
+        missing = [
+            name
+            for name, module in required_modules.items()
+            if not module.is_available()
+        ]
         if missing:
             raise ImportError(f"Missing required dependencies: {', '.join(missing)}")
 
@@ -713,7 +751,7 @@ class FrenchGouvLoader:
             if api_key:
                 url = f"{url}?apikey={api_key}"
 
-            response = requests.get(url)
+            response = self._http.get(url)
             response.raise_for_status()
             return BytesIO(response.content)
         except requests.RequestException as e:
@@ -933,9 +971,15 @@ class ONSNomisLoader:
 
     STORAGE_TYPES = {"s3": S3Uploader, "local": LocalUploader}
 
-    def __init__(self) -> None:
+    def __init__(self, cat_session: Optional[CatSession] = None) -> None:
+        """
+        Args:
+            cat_session: Optional CatSession used to download resources.
+            Downloads then share its connection pool, retry policy and rate limits.
+        """
         self._validate_dependencies()
         self.df_loader = DataFrameLoader()
+        self._http = cat_session.session if cat_session is not None else requests
 
     def _validate_dependencies(self):
         """Validate that all required dependencies are available."""
@@ -946,14 +990,18 @@ class ONSNomisLoader:
             "boto3": boto3,
             "pyarrow": pa,
         }
-        missing = [name for name, module in required_modules.items() if module is None]
+        missing = [
+            name
+            for name, module in required_modules.items()
+            if not module.is_available()
+        ]
         if missing:
             raise ImportError(f"Missing required dependencies: {', '.join(missing)}")
 
     def _fetch_data(self, url: str) -> BytesIO:
         """Fetch data from URL and return as BytesIO object."""
         try:
-            response = requests.get(url)
+            response = self._http.get(url)
             response.raise_for_status()
             return BytesIO(response.content)
         except requests.RequestException as e:
@@ -1135,9 +1183,15 @@ class DataPressLoader:
 
     STORAGE_TYPES = {"s3": S3Uploader, "local": LocalUploader}
 
-    def __init__(self) -> None:
+    def __init__(self, cat_session: Optional[CatSession] = None) -> None:
+        """
+        Args:
+            cat_session: Optional CatSession used to download resources.
+            Downloads then share its connection pool, retry policy and rate limits.
+        """
         self._validate_dependencies()
         self.df_loader = DataFrameLoader()
+        self._http = cat_session.session if cat_session is not None else requests
 
     def _validate_dependencies(self):
         """Validate that all required dependencies are available."""
@@ -1148,7 +1202,11 @@ class DataPressLoader:
             "boto3": boto3,
             "pyarrow": pa,
         }
-        missing = [name for name, module in required_modules.items() if module is None]
+        missing = [
+            name
+            for name, module in required_modules.items()
+            if not module.is_available()
+        ]
         if missing:
             raise ImportError(f"Missing required dependencies: {', '.join(missing)}")
 
@@ -1204,7 +1262,7 @@ class DataPressLoader:
             if api_key:
                 url = f"{url}?apikey={api_key}"
 
-            response = requests.get(url)
+            response = self._http.get(url)
             response.raise_for_status()
             return BytesIO(response.content)
         except requests.RequestException as e:
@@ -1,4 +1,7 @@
+from __future__ import annotations
+
 from typing import (
+    TYPE_CHECKING,
     Protocol,
     Literal,
     Optional,
@@ -11,24 +14,29 @@ from typing import (
     TypeVar,
 )
 
-import boto3
-import pandas as pd
-import polars as pl
-import duckdb
-import pyarrow as pa
-import pyarrow.parquet as pq
 import os
 
 from functools import wraps
 from io import BytesIO
-from botocore.client import BaseClient as Boto3Client
 from loguru import logger
-from botocore.exceptions import ClientError
-
-from pandas.core.frame import DataFrame as PandasDataFrame
-from polars.dataframe.frame import DataFrame as PolarsDataFrame
 
 from enum import IntEnum
+from ..explorer.records import ResourceRecord
+from ..utils.lazy_imports import LazyModule
+
+if TYPE_CHECKING:
+    from botocore.client import BaseClient as Boto3Client
+    from pandas.core.frame import DataFrame as PandasDataFrame
+    from polars.dataframe.frame import DataFrame as PolarsDataFrame
+
+# Heavy dependencies are only imported when a loader actually needs them
+boto3 = LazyModule("boto3")
+botocore_exceptions = LazyModule("botocore.exceptions", "boto3")
+pd = LazyModule("pandas")
+pl = LazyModule("polars")
+duckdb = LazyModule("duckdb")
+pa = LazyModule("pyarrow")
+pq = LazyModule("pyarrow.parquet", "pyarrow")
 
 # We can use protocols to define the methods that implementations must implement
 # This is useful for having a more reusable pattern for defining shared behaviours
@@ -66,6 +74,7 @@ class ResourceValidators:
         4. Transforms the input into a simplified [format, url] list
 
         Input formats expected:
+        - A ResourceRecord or a list of ResourceRecords, checked with isinstance only
         - Single list: [name, date, format, url] indexed by ResourceIndex
         - List of lists: [[name, date, format, url], [...], ...]
 
@@ -92,6 +101,14 @@ class ResourceValidators:
                 # Skip validation and just call the function
                 return func(self, resource_data, *args, **kwargs)
 
+            # Fast path for ResourceRecords from extract_resource_url, already structured
+            record = _select_resource_record(resource_data, desired_format)
+            if record is not None:
+                if not (record.url or "").startswith(("http://", "https://")):
+                    logger.error(f"Invalid URL format: {record.url}")
+                    raise ValueError("Invalid URL format")
+                return func(self, [(record.format or "").lower(), record.url], *args, **kwargs)
+
             # First validate we have a list
             if not isinstance(resource_data, list) or not resource_data:
                 logger.error("Invalid resource data: must be a non-empty list")
@@ -307,6 +324,41 @@ class ResourceValidators:
         return wrapper
 
 
+def _select_resource_record(
+    resource_data: Any, desired_format: Optional[str]
+) -> Optional[ResourceRecord]:
+    """
+    Pick the ResourceRecord to load from a record or list of records.
+
+    Returns None if resource_data is not made of ResourceRecords.
+
+    Raises:
+        ValueError: If no record has the desired format
+    """
+    if isinstance(resource_data, ResourceRecord):
+        return resource_data
+    if not (
+        isinstance(resource_data, list)
+        and resource_data
+        and isinstance(resource_data[0], ResourceRecord)
+    ):
+        return None
+    if not desired_format:
+        return resource_data[0]
+
+    wanted = desired_format.lower()
+    for record in resource_data:
+        if (record.format or "").lower() == wanted:
+            return record
+
+    available_formats = [str(record.format) for record in resource_data]
+    logger.error(f"No resource found with format: {desired_format}")
+    raise ValueError(
+        f"No resource with format '{desired_format}' found. "
+        f"Available formats: {', '.join(available_formats)}"
+    )
+
+
 class StorageTrait(Protocol):
     """Protocol defining the interface for remote storage uploaders."""
 
@@ -331,7 +383,7 @@ class S3Uploader(StorageTrait):
         try:
             self.client.head_bucket(Bucket=bucket_name)
             logger.info("Bucket Found")
-        except ClientError as error:
+        except botocore_exceptions.ClientError as error:
             error_code = int(error.response["Error"]["Code"])
             if error_code == 404:
                 raise ValueError(f"Bucket '{bucket_name}' does not exist")
@@ -0,0 +1,210 @@
+import asyncio
+
+from typing import Any, Dict, Optional, Union
+from loguru import logger
+from urllib.parse import urlparse
+
+from ..config.sources import (
+    CkanDataCatalogues,
+    DataPressCatalogues,
+    OpenDataSoftDataCatalogues,
+    FrenchGouvCatalogue,
+    ONSNomisAPI,
+    ONSGeoPortal,
+)
+from .rate_limit import DEFAULT_RATE_LIMITER, RateLimit, RateLimiter
+from .retry import RetryPolicy
+from .session import CatalogueType, CatSession
+from ..utils.lazy_imports import LazyModule
+
+# Optional dependency, only imported when an AsyncCatSession is created
+aiohttp = LazyModule("aiohttp")
+
+
+# START AN ASYNC SESSION WITH A DATA CATALOGUE
+class AsyncCatSession:
+    def __init__(
+        self,
+        catalogue: Union[
+            CkanDataCatalogues,
+            DataPressCatalogues,
+            OpenDataSoftDataCatalogues,
+            FrenchGouvCatalogue,
+            ONSNomisAPI,
+            ONSGeoPortal,
+        ],
+        max_concurrency: int = 50,
+        timeout: float = 30,
+        retry: Optional[RetryPolicy] = None,
+        rate_limit: Optional[RateLimit] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        base_url: Optional[str] = None,
+    ) -> None:
+        """
+        Initialise an asyncio session with a predefined catalog.
+
+        Requests are bounded by max_concurrency, so one process can keep hundreds of requests
+        in flight without a thread per request. Like a lazy CatSession no request is made until
+        the first API call.
+
+        Requires aiohttp: pip install aiohttp
+
+        Args:
+            catalogue: A predefined catalogue from one of the supported enum types
+            max_concurrency: Maximum number of requests in flight at once
+            timeout: Total timeout in seconds for a single request
+            retry: Optional RetryPolicy used for every request
+            rate_limit: Optional RateLimit applied to the catalogue's host, shared with every other session.
+            Other hosts are only throttled if configured on the rate_limiter
+            rate_limiter: RateLimiter holding the per host budgets. Defaults to the process wide one
+            base_url: Optional URL to use instead of the catalogue's own, e.g. a mirror
+
+        Returns:
+            An AsyncCatSession Object
+
+        # Example usage...
+        import asyncio
+        import HerdingCats as hc
+
+        async def main():
+            async with hc.AsyncCatSession(hc.CkanDataCatalogues.UK_GOV, max_concurrency=100) as session:
+                explore = hc.AsyncCkanCatExplorer(session)
+                packages = await explore.get_package_list()
+
+        if __name__ == "__main__":
+            asyncio.run(main())
+        """
+        if not aiohttp.is_available():
+            raise ImportError(
+                "aiohttp is not installed. Please run 'pip install aiohttp' to use AsyncCatSession."
+            )
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.domain, self._catalogue_type = CatSession._process_catalogue(catalogue)
+        self.base_url = (
+            base_url.rstrip("/")
+            if base_url
+            else (
+                f"https://{self.domain}"
+                if not self.domain.startswith("http")
+                else self.domain
+            )
+        )
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.retry = retry
+        self.rate_limit = rate_limit
+        self.rate_limiter = rate_limiter or DEFAULT_RATE_LIMITER
+        self.session: Optional["aiohttp.ClientSession"] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        if self.rate_limit is not None:
+            self.rate_limiter.configure(self.host, self.rate_limit)
+
+    async def start_session(self) -> None:
+        """Create the underlying aiohttp session. No request is made."""
+        if self.session is not None:
+            return
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        logger.info(f"Async session created for {self.domain}")
+
+    async def close_session(self) -> None:
+        """Close the session."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+            logger.success(f"Async Session Closed: {self.base_url}")
+
+    async def __aenter__(self):
+        """Allow use with the async context manager"""
+        await self.start_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Allow use with the async context manager"""
+        await self.close_session()
+
+    async def get_json(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """
+        Make a GET request and decode the JSON response.
+
+        Concurrency, rate limits and retries are applied here.
+
+        Args:
+            url: Full URL or a path relative to the catalogue's base URL
+            params: Optional query parameters
+            headers: Optional request headers
+
+        Returns:
+            The decoded JSON body
+
+        Raises:
+            aiohttp.ClientResponseError: If the final response has an error status
+        """
+        if self.session is None or self._semaphore is None:
+            await self.start_session()
+
+        if url.startswith("/"):
+            url = self.base_url + url
+        host = urlparse(url).hostname or self.host
+        max_attempts = self.retry.max_attempts if self.retry is not None else 1
+
+        attempt = 0
+        while True:
+            attempt += 1
+            async with self._semaphore:
+                # Only hosts with a limit configured on the limiter are throttled
+                wait = self.rate_limiter.reserve(host)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+                try:
+                    async with self.session.get(
+                        url, params=params, headers=headers
+                    ) as response:
+                        if (
+                            self.retry is not None
+                            and response.status in self.retry.status_codes
+                            and attempt < max_attempts
+                        ):
+                            delay = self.retry.retry_after(
+                                response.headers.get("Retry-After")
+                            )
+                            if delay is None:
+                                delay = self.retry.backoff(attempt)
+                            logger.warning(
+                                f"{url} returned status code {response.status}, retrying in {delay:.2f}s"
+                            )
+                        else:
+                            response.raise_for_status()
+                            return await response.json(content_type=None)
+
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                    if attempt >= max_attempts:
+                        raise
+                    delay = self.retry.backoff(attempt)
+                    logger.warning(f"Failed to connect to {url}, retrying in {delay:.2f}s")
+
+            # Back off outside the semaphore, so other requests can use the slot meanwhile
+            await asyncio.sleep(delay)
+
+    @property
+    def host(self) -> str:
+        """Return the host name of the catalogue"""
+        return urlparse(self.base_url).hostname or self.domain
+
+    @property
+    def catalogue_type(self) -> CatalogueType:
+        """Return the catalog type (CKAN, OpenDataSoft, French Government, DataPress, or ONSNomis)"""
+        return self._catalogue_type
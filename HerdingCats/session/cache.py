@@ -0,0 +1,260 @@
+import json
+import sqlite3
+import threading
+import time
+
+from pathlib import Path
+from typing import Dict, Optional, Union
+from loguru import logger
+from requests import PreparedRequest, Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# Where the cache lives if no path is given
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "herdingcats" / "http_cache.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+)
+"""
+
+
+class CachedResponse:
+    """A response read back from the cache."""
+
+    def __init__(
+        self, status: int, headers: Dict[str, str], body: bytes, stored_at: float
+    ) -> None:
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.stored_at = stored_at
+
+    @property
+    def etag(self) -> Optional[str]:
+        return CaseInsensitiveDict(self.headers).get("ETag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return CaseInsensitiveDict(self.headers).get("Last-Modified")
+
+    def to_response(self, request: PreparedRequest) -> Response:
+        """Build a requests Response that behaves like one read from the network."""
+        response = Response()
+        response.status_code = self.status
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response._content = self.body
+        response._content_consumed = True
+        response.from_cache = True
+        return response
+
+
+class HttpCache:
+    """
+    Persistent HTTP response cache stored in a single SQLite file.
+
+    Successful GET responses are kept on disk. Within ttl seconds they are served without
+    touching the network. After that they are revalidated with If-None-Match / If-Modified-Since,
+    so an unchanged resource costs a 304 instead of a full download.
+    The least recently used entries are evicted once the cache grows past max_size.
+
+    Requests carrying an Authorization header and responses marked Cache-Control: no-store
+    are never cached.
+
+    Args:
+        path: SQLite file to use. Defaults to ~/.cache/herdingcats/http_cache.sqlite
+        ttl: Seconds a cached response is served without revalidation. 0 always revalidates
+        max_size: Maximum total size of cached bodies in bytes
+        max_entry_size: Responses larger than this many bytes are not cached
+
+    # Example usage...
+    import HerdingCats as hc
+
+    def main():
+        cache = hc.HttpCache(ttl=3600)
+        with hc.CatSession(hc.CkanDataCatalogues.UK_GOV, cache=cache) as session:
+            explore = hc.CkanCatExplorer(session)
+            packages = explore.get_package_list()
+            print(cache.stats())
+
+    if __name__ == "__main__":
+        main()
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path, None] = None,
+        ttl: float = 300,
+        max_size: int = 512 * 1024 * 1024,
+        max_entry_size: int = 64 * 1024 * 1024,
+    ) -> None:
+        if ttl < 0:
+            raise ValueError("ttl can't be negative")
+        if max_size < 1 or max_entry_size < 1:
+            raise ValueError("max_size and max_entry_size must be at least 1")
+
+        self.path = Path(path).expanduser() if path is not None else DEFAULT_CACHE_PATH
+        self.ttl = ttl
+        self.max_size = max_size
+        self.max_entry_size = max_entry_size
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(_SCHEMA)
+
+    @staticmethod
+    def key(request: PreparedRequest) -> Optional[str]:
+        """Cache key for a request, or None if the request must not be cached."""
+        if request.method != "GET" or "Authorization" in request.headers:
+            return None
+        return f"GET {request.url}"
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the cached response for a key and mark it as recently used."""
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT status, headers, body, stored_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+        status, headers, body, stored_at = row
+        return CachedResponse(status, json.loads(headers), body, stored_at)
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        """Check if a cached response can be served without revalidation."""
+        return time.time() - entry.stored_at < self.ttl
+
+    def store(self, key: str, response: Response) -> bool:
+        """
+        Save a response. Only 200 responses that fit in the cache are stored.
+
+        Returns:
+            bool: True if the response was stored
+        """
+        if response.status_code != 200:
+            return False
+        if "no-store" in response.headers.get("Cache-Control", "").lower():
+            return False
+        body = response.content
+        if len(body) > self.max_entry_size:
+            return False
+
+        # The body is stored decoded, so drop headers describing the wire encoding
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name.lower() not in ("content-encoding", "content-length", "transfer-encoding")
+        }
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.status_code,
+                    json.dumps(headers),
+                    body,
+                    len(body),
+                    now,
+                    now,
+                ),
+            )
+            self._evict()
+        return True
+
+    def refresh(self, key: str, response: Response) -> None:
+        """Mark a cached response as fresh again after a 304, merging any updated headers."""
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT headers FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return
+            headers = CaseInsensitiveDict(json.loads(row[0]))
+            for name in ("ETag", "Last-Modified", "Cache-Control", "Expires", "Date"):
+                if name in response.headers:
+                    headers[name] = response.headers[name]
+            now = time.time()
+            self._conn.execute(
+                "UPDATE responses SET headers = ?, stored_at = ?, accessed_at = ? WHERE key = ?",
+                (json.dumps(dict(headers)), now, now, key),
+            )
+
+    def record(self, outcome: str) -> None:
+        """Count a "hits", "revalidated" or "misses" outcome."""
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache fits in max_size. Caller holds the lock."""
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        if total <= self.max_size:
+            return
+
+        evicted = 0
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at ASC"
+        ).fetchall():
+            if total <= self.max_size:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+        logger.info(f"Evicted {evicted} responses from the HTTP cache")
+
+    def delete(self, key: str) -> None:
+        """Remove a single entry."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return cache metrics.
+
+        Returns:
+            dict: hits (served from disk), revalidated (304s), misses, entries and size in bytes
+        """
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+            "entries": entries,
+            "size": size,
+        }
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,197 @@
+import threading
+import time
+
+from typing import Dict, Optional
+from loguru import logger
+
+
+class RateLimit:
+    """
+    Request rate allowed against a single host.
+
+    Args:
+        requests_per_second: Sustained number of requests per second
+        burst: Number of requests that can be sent back to back before throttling starts
+    """
+
+    def __init__(self, requests_per_second: float, burst: int = 1) -> None:
+        if requests_per_second <= 0:
+            raise ValueError("requests_per_second must be greater than 0")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+
+    def __repr__(self) -> str:
+        return f"RateLimit(requests_per_second={self.requests_per_second}, burst={self.burst})"
+
+
+class RateLimitStats:
+    """Counters for how much a host's requests have been throttled."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.throttled_requests = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float) -> None:
+        self.requests += 1
+        if wait > 0:
+            self.throttled_requests += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "requests": self.requests,
+            "throttled_requests": self.throttled_requests,
+            "total_wait": self.total_wait,
+            "max_wait": self.max_wait,
+        }
+
+
+class TokenBucket:
+    """
+    Thread safe token bucket.
+
+    Each request takes a token. Tokens refill at the configured rate up to the burst size.
+    Callers that find the bucket empty reserve the next token and sleep until it is due,
+    so concurrent callers are served in order without busy waiting.
+    """
+
+    def __init__(self, rate_limit: RateLimit) -> None:
+        self.rate_limit = rate_limit
+        self._tokens = float(rate_limit.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            rate = self.rate_limit.requests_per_second
+            self._tokens = min(
+                float(self.rate_limit.burst),
+                self._tokens + (now - self._updated) * rate,
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / rate
+
+    def acquire(self) -> float:
+        """
+        Block until a request may be sent.
+
+        Returns:
+            float: Number of seconds spent waiting
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class RateLimiter:
+    """
+    Registry of token buckets keyed by host.
+
+    One limiter is shared by every CatSession in the process by default, so explorers
+    and loaders hitting the same portal from different sessions or threads share one budget.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._stats: Dict[str, RateLimitStats] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, host: str, rate_limit: RateLimit) -> None:
+        """Set the rate limit for a host, replacing any different limit already set."""
+        with self._lock:
+            existing = self._buckets.get(host)
+            if existing is not None and (
+                existing.rate_limit.requests_per_second
+                == rate_limit.requests_per_second
+                and existing.rate_limit.burst == rate_limit.burst
+            ):
+                return
+            if existing is not None:
+                logger.info(
+                    f"Replacing rate limit for {host}: {existing.rate_limit} -> {rate_limit}"
+                )
+            self._buckets[host] = TokenBucket(rate_limit)
+            self._stats.setdefault(host, RateLimitStats())
+
+    def reserve(self, host: str, rate_limit: Optional[RateLimit] = None) -> float:
+        """
+        Reserve a slot to send a request to a host without blocking.
+
+        Used by async callers, which should sleep for the returned delay themselves.
+
+        Args:
+            host: Host the request is going to
+            rate_limit: Limit to register for the host if it does not have one yet.
+            Hosts without a limit are not throttled.
+
+        Returns:
+            float: Number of seconds to wait before sending the request
+        """
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None and rate_limit is not None:
+                bucket = self._buckets[host] = TokenBucket(rate_limit)
+            if bucket is None:
+                return 0.0
+            stats = self._stats.setdefault(host, RateLimitStats())
+
+        wait = bucket.reserve()
+        with self._lock:
+            stats.record(wait)
+        return wait
+
+    def acquire(self, host: str, rate_limit: Optional[RateLimit] = None) -> float:
+        """
+        Block until a request may be sent to a host.
+
+        Args:
+            host: Host the request is going to
+            rate_limit: Limit to register for the host if it does not have one yet.
+            Hosts without a limit are not throttled.
+
+        Returns:
+            float: Number of seconds spent waiting
+        """
+        wait = self.reserve(host, rate_limit)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def stats(self, host: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+        """
+        Return throttling metrics.
+
+        Args:
+            host: Only return metrics for this host
+
+        Returns:
+            dict: {host: {"requests", "throttled_requests", "total_wait", "max_wait"}}
+        """
+        with self._lock:
+            return {
+                name: stats.as_dict()
+                for name, stats in self._stats.items()
+                if host is None or name == host
+            }
+
+    def reset(self) -> None:
+        """Remove every configured limit and metric."""
+        with self._lock:
+            self._buckets.clear()
+            self._stats.clear()
+
+
+# Shared by every CatSession unless a session is given its own limiter
+DEFAULT_RATE_LIMITER = RateLimiter()
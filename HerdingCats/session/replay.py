@@ -0,0 +1,122 @@
+import base64
+import hashlib
+import json
+import threading
+import time
+
+from pathlib import Path
+from typing import Literal, Optional, Union
+from loguru import logger
+from requests import ConnectionError, PreparedRequest, Response
+
+from .cache import CachedResponse
+
+ReplayMode = Literal["record", "replay", "auto"]
+
+
+class ReplayStore:
+    """
+    Record real HTTP responses to fixture files and serve them back later.
+
+    Each request is stored as one JSON file named after a hash of its method and URL,
+    so fixtures can be committed and diffed like any other test data.
+
+    Modes:
+        record: Always go to the network and save every response
+        replay: Only serve saved responses. Missing fixtures raise requests.ConnectionError
+        auto: Serve saved responses and record any that are missing
+
+    Args:
+        path: Directory holding the fixture files
+        mode: "record", "replay" or "auto"
+
+    # Example usage...
+    import HerdingCats as hc
+
+    def main():
+        # First run against the live portal, later runs fully offline
+        replay = hc.ReplayStore("tests/fixtures/uk_gov", mode="auto")
+        with hc.CatSession(hc.CkanDataCatalogues.UK_GOV, replay=replay) as session:
+            explore = hc.CkanCatExplorer(session)
+            print(explore.get_package_count())
+
+    if __name__ == "__main__":
+        main()
+    """
+
+    def __init__(self, path: Union[str, Path], mode: ReplayMode = "replay") -> None:
+        if mode not in ("record", "replay", "auto"):
+            raise ValueError("mode must be one of: record, replay, auto")
+
+        self.path = Path(path).expanduser()
+        self.mode = mode
+        self.recorded = 0
+        self.replayed = 0
+        self._lock = threading.Lock()
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(request: PreparedRequest) -> str:
+        """Fixture name for a request."""
+        digest = hashlib.sha1(f"{request.method} {request.url}".encode()).hexdigest()
+        return f"{digest}.json"
+
+    def load(self, request: PreparedRequest) -> Optional[Response]:
+        """
+        Return the recorded response for a request.
+
+        Raises:
+            requests.ConnectionError: In replay mode if nothing was recorded for the request
+        """
+        if self.mode == "record":
+            return None
+
+        fixture = self.path / self.key(request)
+        if not fixture.exists():
+            if self.mode == "replay":
+                raise ConnectionError(
+                    f"No recorded response for {request.method} {request.url}",
+                    request=request,
+                )
+            return None
+
+        data = json.loads(fixture.read_text(encoding="utf-8"))
+        body = (
+            base64.b64decode(data["body_base64"])
+            if "body_base64" in data
+            else data["body"].encode("utf-8")
+        )
+        with self._lock:
+            self.replayed += 1
+        response = CachedResponse(
+            data["status"], data["headers"], body, time.time()
+        ).to_response(request)
+        response.from_replay = True
+        return response
+
+    def save(self, request: PreparedRequest, response: Response) -> None:
+        """Write a response to its fixture file."""
+        if self.mode == "replay":
+            return
+
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name.lower() not in ("content-encoding", "content-length", "transfer-encoding")
+        }
+        data = {
+            "method": request.method,
+            "url": request.url,
+            "status": response.status_code,
+            "headers": headers,
+        }
+        try:
+            data["body"] = response.content.decode("utf-8")
+        except UnicodeDecodeError:
+            data["body_base64"] = base64.b64encode(response.content).decode("ascii")
+
+        fixture = self.path / self.key(request)
+        fixture.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        with self._lock:
+            self.recorded += 1
+        logger.debug(f"Recorded {request.method} {request.url} to {fixture.name}")
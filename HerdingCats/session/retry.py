@@ -0,0 +1,110 @@
+import random
+import time
+
+from email.utils import parsedate_to_datetime
+from typing import Any, Iterable, Optional, Type
+from urllib3.util.retry import Retry
+
+
+class RetryPolicy:
+    """
+    Retry settings for requests made through a CatSession.
+
+    Failed requests are retried with exponential backoff plus random jitter.
+    If the server sends a Retry-After header (common with 429 and 503 responses) it is honoured.
+
+    Args:
+        max_attempts: Total number of attempts per request, including the first one
+        status_codes: Response status codes that trigger a retry
+        backoff_factor: Base delay in seconds, doubled after each failed attempt
+        backoff_max: Upper bound in seconds for a single backoff delay
+        jitter: Maximum random number of seconds added to each backoff delay
+        respect_retry_after: Wait for as long as the server's Retry-After header asks
+        methods: HTTP methods that are safe to retry
+
+    # Example usage...
+    import HerdingCats as hc
+
+    def main():
+        retry = hc.RetryPolicy(max_attempts=6, backoff_factor=1.0)
+        with hc.CatSession(hc.OpenDataSoftDataCatalogues.PARIS, retry=retry) as session:
+            explore = hc.OpenDataSoftCatExplorer(session)
+            datasets = explore.fetch_all_datasets()
+
+    if __name__ == "__main__":
+        main()
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        status_codes: Iterable[int] = (429, 500, 502, 503, 504),
+        backoff_factor: float = 0.5,
+        backoff_max: float = 60.0,
+        jitter: float = 0.5,
+        respect_retry_after: bool = True,
+        methods: Iterable[str] = ("GET", "HEAD", "OPTIONS"),
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if backoff_factor < 0 or backoff_max < 0 or jitter < 0:
+            raise ValueError("Backoff settings can't be negative")
+
+        self.max_attempts = max_attempts
+        self.status_codes = frozenset(status_codes)
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+        self.methods = frozenset(method.upper() for method in methods)
+
+    def to_urllib3(self, retry_class: Type[Retry] = Retry, **kwargs: Any) -> Retry:
+        """
+        Build the urllib3 Retry object used by the session's HTTP adapter.
+
+        The last response is returned rather than raised once attempts run out,
+        so callers still see the real status code via raise_for_status().
+
+        Args:
+            retry_class: Retry subclass to build
+            **kwargs: Extra arguments for retry_class
+        """
+        return retry_class(
+            total=self.max_attempts - 1,
+            status_forcelist=self.status_codes,
+            allowed_methods=self.methods,
+            backoff_factor=self.backoff_factor,
+            backoff_max=self.backoff_max,
+            backoff_jitter=self.jitter,
+            respect_retry_after_header=self.respect_retry_after,
+            raise_on_status=False,
+            **kwargs,
+        )
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Delay in seconds before the next attempt, used by AsyncCatSession.
+
+        Args:
+            attempt: Number of attempts made so far (1 after the first failure)
+        """
+        delay = min(self.backoff_max, self.backoff_factor * (2 ** (attempt - 1)))
+        return delay + random.uniform(0, self.jitter)
+
+    def retry_after(self, header: Optional[str]) -> Optional[float]:
+        """
+        Parse a Retry-After header given either in seconds or as an HTTP date.
+
+        Returns:
+            Seconds to wait, or None if the header is missing, invalid or ignored
+        """
+        if not header or not self.respect_retry_after:
+            return None
+        try:
+            return max(0.0, float(header))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(header).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
@@ -1,5 +1,7 @@
 import requests
-from typing import Union
+import threading
+import time
+from typing import Dict, Optional, Union
 from loguru import logger
 from urllib.parse import urlparse
 from enum import Enum
@@ -12,6 +14,11 @@ from ..config.sources import (
     ONSGeoPortal,
 )
 from ..errors.errors import CatSessionError
+from .cache import HttpCache
+from .rate_limit import DEFAULT_RATE_LIMITER, RateLimit, RateLimiter
+from .replay import ReplayStore
+from .retry import RetryPolicy
+from .transport import CatHTTPAdapter, TransportConfig
 
 
 # TODO: We need to find a better pattern than just chaining match statements
@@ -26,6 +33,12 @@ class CatalogueType(Enum):
     ONS_GEO_PORTAL = "ons_geo_portal"
 
 
+# Successful health probes shared by every session in this process
+# Maps a base url to the monotonic time it was last seen alive
+_PROBE_CACHE: Dict[str, float] = {}
+_PROBE_LOCK = threading.Lock()
+
+
 # START A SESSION WITH A DATA CATALOGUE
 class CatSession:
     def __init__(
@@ -38,6 +51,15 @@ class CatSession:
             ONSNomisAPI,
             ONSGeoPortal,
         ],
+        lazy: bool = False,
+        probe_ttl: Optional[float] = None,
+        transport: Optional[TransportConfig] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limit: Optional[RateLimit] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[HttpCache] = None,
+        replay: Optional[ReplayStore] = None,
+        base_url: Optional[str] = None,
     ) -> None:
         """
         Initialise a session with a predefined catalog.
@@ -45,18 +67,63 @@ class CatSession:
         Args:
             catalogue: A predefined catalogue from one of the supported enum types
             (CkanDataCatalogues, OpenDataSoftDataCatalogues, FrenchGouvCatalogue, DataPressCatalogues, ONSNomisAPI, or ONSGeoPortal)
+            lazy: If True no network I/O happens when the session is created or started.
+            The first real API call made through the session doubles as the liveness check.
+            probe_ttl: Number of seconds a successful health probe of this catalogue is reused for
+            by any session in the same process. None (the default) always probes.
+            transport: Optional TransportConfig with connection pool sizes, keep-alive,
+            socket options and default timeouts. Defaults match a plain requests.Session.
+            retry: Optional RetryPolicy used for every request made through the session,
+            including loader downloads when the session is passed to a loader. None disables retries.
+            rate_limit: Optional RateLimit (requests per second and burst) applied to the catalogue's host,
+            on every attempt including retries. The budget is shared with every other session talking
+            to the same host. Other hosts, e.g. file downloads, are only throttled if configured on the rate_limiter.
+            rate_limiter: RateLimiter holding the per host budgets. Defaults to one shared by the whole process.
+            cache: Optional HttpCache that keeps GET responses on disk and revalidates them
+            with ETag / Last-Modified. None (the default) disables caching.
+            replay: Optional ReplayStore that records responses to fixture files or serves them back offline.
+            base_url: Optional URL to use instead of the catalogue's own, e.g. a mirror or a local MockCatalogueServer
 
         Returns:
             A CatSession Object
+
+        # Example usage...
+        import HerdingCats as hc
+
+        def main():
+            with hc.CatSession(hc.CkanDataCatalogues.UK_GOV, lazy=True) as session:
+                explore = hc.CkanCatExplorer(session)
+                print(explore.get_package_count())
+
+        if __name__ == "__main__":
+            main()
         """
         self.domain, self._catalogue_type = self._process_catalogue(catalogue)
-        self.session = requests.Session()
+        self.transport = transport or TransportConfig()
+        self.retry = retry
+        self.rate_limit = rate_limit
+        self.rate_limiter = rate_limiter or DEFAULT_RATE_LIMITER
+        self.cache = cache
+        self.replay = replay
         self.base_url = (
-            f"https://{self.domain}"
-            if not self.domain.startswith("http")
-            else self.domain
+            base_url.rstrip("/")
+            if base_url
+            else (
+                f"https://{self.domain}"
+                if not self.domain.startswith("http")
+                else self.domain
+            )
         )
-        self._validate_url()
+        # The adapter configures the rate limit for the catalogue's host
+        self.session = self._build_session()
+        self.lazy = lazy
+        self.probe_ttl = probe_ttl
+        self._probed = False
+
+        if self.lazy:
+            self.session.hooks["response"].append(self._record_first_response)
+        else:
+            self._validate_url()
 
     @staticmethod
     def _process_catalogue(
@@ -99,14 +166,70 @@ class CatSession:
         parsed_url = urlparse(catalogue.value)
         return parsed_url.netloc if parsed_url.netloc else parsed_url.path, catalog_type
 
+    def _build_session(self) -> requests.Session:
+        """Create the underlying requests session with the configured transport."""
+        session = requests.Session()
+        adapter = CatHTTPAdapter(
+            self.transport,
+            self.retry,
+            self.rate_limit,
+            self.rate_limiter,
+            self.cache,
+            self.replay,
+            host=self.host,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not self.transport.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def _has_recent_probe(self) -> bool:
+        """Check if this catalogue passed a health probe within probe_ttl seconds."""
+        if self.probe_ttl is None:
+            return False
+        with _PROBE_LOCK:
+            probed_at = _PROBE_CACHE.get(self.base_url)
+        return probed_at is not None and time.monotonic() - probed_at < self.probe_ttl
+
+    def _mark_probed(self) -> None:
+        """Record that the catalogue is alive so later calls can skip probing."""
+        self._probed = True
+        with _PROBE_LOCK:
+            _PROBE_CACHE[self.base_url] = time.monotonic()
+
+    def _record_first_response(self, response: requests.Response, *args, **kwargs):
+        """
+        Response hook used in lazy mode.
+
+        The first response received from the catalogue is treated as the health probe.
+        """
+        if self._probed:
+            return None
+        if response.status_code < 500:
+            self._mark_probed()
+            logger.success(f"Session started successfully with {self.domain}")
+        else:
+            logger.warning(
+                f"First request to {self.domain} returned status code {response.status_code}"
+            )
+        return None
+
     def _validate_url(self) -> None:
         """
         Validate the URL to catch any errors.
         Will raise status code error if there is a problem with the url.
+
+        Skipped if the catalogue passed a probe within probe_ttl seconds.
         """
+        if self._has_recent_probe():
+            self._probed = True
+            return
+
         try:
             response = self.session.get(self.base_url, timeout=10)
             response.raise_for_status()
+            self._mark_probed()
         except requests.RequestException as e:
             logger.error(f"Failed to connect to {self.base_url}: {str(e)}")
             raise CatSessionError(
@@ -116,10 +239,23 @@ class CatSession:
             )
 
     def start_session(self) -> None:
-        """Start a session with the specified domain."""
+        """
+        Start a session with the specified domain.
+
+        No request is made if the catalogue has already been probed or the session is lazy.
+        """
+        if self.lazy:
+            logger.info(f"Lazy session created for {self.domain}")
+            return
+
+        if self._probed or self._has_recent_probe():
+            logger.success(f"Session started successfully with {self.domain}")
+            return
+
         try:
             response = self.session.get(self.base_url)
             response.raise_for_status()
+            self._mark_probed()
             logger.success(f"Session started successfully with {self.domain}")
         except requests.RequestException as e:
             logger.error(f"Failed to start session: {e}")
@@ -141,6 +277,20 @@ class CatSession:
         """Allows use with the context manager with"""
         self.close_session()
 
+    @property
+    def host(self) -> str:
+        """Return the host name of the catalogue"""
+        return urlparse(self.base_url).hostname or self.domain
+
+    def rate_limit_stats(self) -> dict:
+        """
+        Return rate limiting metrics for the catalogue host.
+
+        Returns:
+            dict: requests, throttled_requests, total_wait and max_wait (seconds)
+        """
+        return self.rate_limiter.stats(self.host).get(self.host, {})
+
     @property
     def catalogue_type(self) -> CatalogueType:
         """Return the catalog type (CKAN, OpenDataSoft, French Government, DataPress, or ONSNomis)"""
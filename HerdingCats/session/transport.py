@@ -0,0 +1,219 @@
+import socket
+
+from typing import List, Optional, Tuple, Union
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+from .cache import HttpCache
+from .rate_limit import DEFAULT_RATE_LIMITER, RateLimit, RateLimiter
+from .replay import ReplayStore
+from .retry import RetryPolicy
+
+# Type aliases for the transport settings
+SocketOption = Tuple[int, int, int]
+Timeout = Union[float, Tuple[float, float], None]
+
+
+class TransportConfig:
+    """
+    Connection pooling and socket settings for the HTTP transport used by a CatSession.
+
+    The defaults match a bare requests.Session, so only change what you need.
+
+    Args:
+        pool_connections: Number of host connection pools to cache (max pools)
+        pool_maxsize: Maximum number of connections kept open per host
+        pool_block: Block when a pool is full instead of opening throwaway connections
+        keep_alive: Reuse connections between requests and enable TCP keep-alive on them
+        socket_options: Extra (level, option, value) socket options for new connections
+        timeout: Default timeout applied to any request made without one.
+        Either a single number of seconds or a (connect, read) tuple
+
+    # Example usage...
+    import HerdingCats as hc
+
+    def main():
+        transport = hc.TransportConfig(pool_maxsize=32, pool_block=True, timeout=(5, 30))
+        with hc.CatSession(hc.CkanDataCatalogues.UK_GOV, transport=transport) as session:
+            explore = hc.CkanCatExplorer(session)
+
+    if __name__ == "__main__":
+        main()
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        socket_options: Optional[List[SocketOption]] = None,
+        timeout: Timeout = None,
+    ) -> None:
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise ValueError("pool_connections and pool_maxsize must be at least 1")
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.extra_socket_options = socket_options or []
+        self.timeout = timeout
+
+    @property
+    def socket_options(self) -> List[SocketOption]:
+        """All socket options applied to new connections."""
+        options = list(HTTPConnection.default_socket_options)
+        if self.keep_alive:
+            options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        options.extend(self.extra_socket_options)
+        return options
+
+
+class _RateLimitedRetry(Retry):
+    """
+    urllib3 Retry that takes a rate limiter token before every retry, after its backoff.
+
+    urllib3 retries inside a single adapter send, so without this a retry after a 429
+    would skip the host's token bucket.
+    """
+
+    def __init__(
+        self,
+        *args,
+        rate_limiter: Optional[RateLimiter] = None,
+        host: Optional[str] = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.rate_limiter = rate_limiter
+        self.host = host
+
+    def new(self, **kwargs) -> "_RateLimitedRetry":
+        kwargs.setdefault("rate_limiter", self.rate_limiter)
+        kwargs.setdefault("host", self.host)
+        return super().new(**kwargs)
+
+    def increment(self, *args, _pool=None, **kwargs) -> "_RateLimitedRetry":
+        retry = super().increment(*args, _pool=_pool, **kwargs)
+        if _pool is not None:
+            retry.host = _pool.host
+        return retry
+
+    def sleep(self, response=None) -> None:
+        super().sleep(response)
+        if self.rate_limiter is not None and self.host:
+            self.rate_limiter.acquire(self.host)
+
+
+class CatHTTPAdapter(HTTPAdapter):
+    """
+    HTTP adapter mounted on every CatSession.
+
+    Applies the pool sizes, socket options and default timeout from a TransportConfig,
+    the retry settings from an optional RetryPolicy, an optional RateLimit for the
+    catalogue's host, an optional HttpCache and an optional ReplayStore.
+
+    Every attempt takes a token from its host's bucket, including retries made by urllib3,
+    which take theirs after the backoff. Only hosts with a limit configured on the rate
+    limiter are throttled, so downloads from S3 or other file hosts run at full speed.
+    Fresh cache hits and replayed responses skip the network and the rate limiter entirely.
+
+    Args:
+        transport: Pooling, socket and timeout settings
+        retry: Optional RetryPolicy
+        rate_limit: Optional RateLimit for host
+        rate_limiter: RateLimiter holding the per host budgets
+        cache: Optional HttpCache
+        replay: Optional ReplayStore
+        host: The catalogue's host, which rate_limit applies to
+    """
+
+    __attrs__ = HTTPAdapter.__attrs__ + [
+        "transport",
+        "rate_limit",
+        "rate_limiter",
+        "cache",
+        "replay",
+    ]
+
+    def __init__(
+        self,
+        transport: Optional[TransportConfig] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limit: Optional[RateLimit] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[HttpCache] = None,
+        replay: Optional[ReplayStore] = None,
+        host: Optional[str] = None,
+    ) -> None:
+        self.transport = transport or TransportConfig()
+        self.rate_limit = rate_limit
+        self.rate_limiter = rate_limiter or DEFAULT_RATE_LIMITER
+        self.cache = cache
+        self.replay = replay
+        if rate_limit is not None and host:
+            self.rate_limiter.configure(host, rate_limit)
+        super().__init__(
+            pool_connections=self.transport.pool_connections,
+            pool_maxsize=self.transport.pool_maxsize,
+            pool_block=self.transport.pool_block,
+            max_retries=(
+                retry.to_urllib3(_RateLimitedRetry, rate_limiter=self.rate_limiter)
+                if retry is not None
+                else 0
+            ),
+        )
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        pool_kwargs["socket_options"] = self.transport.socket_options
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+
+    def send(
+        self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None
+    ):
+        if timeout is None:
+            timeout = self.transport.timeout
+
+        if self.replay is not None:
+            replayed = self.replay.load(request)
+            if replayed is not None:
+                return replayed
+
+        # Streamed downloads can be large, so they bypass the cache
+        key = self.cache.key(request) if self.cache is not None and not stream else None
+        cached = self.cache.get(key) if key is not None else None
+        if cached is not None:
+            if self.cache.is_fresh(cached):
+                self.cache.record("hits")
+                return cached.to_response(request)
+            if cached.etag:
+                request.headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                request.headers["If-Modified-Since"] = cached.last_modified
+
+        host = urlparse(request.url).hostname
+        if host:
+            self.rate_limiter.acquire(host)
+        response = super().send(
+            request,
+            stream=stream,
+            timeout=timeout,
+            verify=verify,
+            cert=cert,
+            proxies=proxies,
+        )
+        if self.replay is not None:
+            self.replay.save(request, response)
+
+        if key is None:
+            return response
+        if cached is not None and response.status_code == 304:
+            self.cache.record("revalidated")
+            self.cache.refresh(key, response)
+            response.close()
+            return cached.to_response(request)
+        self.cache.record("misses")
+        self.cache.store(key, response)
+        return response
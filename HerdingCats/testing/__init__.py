@@ -0,0 +1,3 @@
+from .mock_server import MockCatalogueServer
+
+__all__ = ["MockCatalogueServer"]
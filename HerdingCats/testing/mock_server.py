@@ -0,0 +1,689 @@
+import csv
+import json
+import re
+import pyarrow as pa
+import pyarrow.parquet as pq
+import threading
+import time
+
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO, StringIO
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from loguru import logger
+
+# Every generated package / dataset is timestamped from here
+_EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+# Matches field:value, field:"quoted value" and field:[low TO high] terms in a CKAN fq
+_FQ_TERM = re.compile(r'(\w+):(\[[^\]]*\]|"[^"]*"|\S+)')
+
+
+class MockCatalogueServer:
+    """
+    Local stand-in for the catalogue APIs HerdingCats talks to.
+
+    Serves the CKAN, OpenDataSoft, DataPress, data.gouv.fr, ONS Nomis and DCAT endpoints
+    from config/source_endpoints.py with generated data, so explorers and loaders can be
+    tested and benchmarked without network access. Every resource URL points back at the
+    server's own /files/ route.
+
+    requests counts the requests made to each path, and max_in_flight is the most
+    requests the server was answering at once, to check that clients run in parallel.
+
+    Args:
+        num_packages: Number of packages / datasets in every catalogue
+        payload_size: Characters of description text per package, to control response sizes
+        file_rows: Number of rows in every generated data file
+        latency: Seconds to wait before answering each request
+        ods_base_paths: OpenDataSoft base paths to serve ("v2", "explore" or both),
+        to mimic portals that only answer on one of them
+        max_limit: Most packages returned per CKAN page whatever limit is asked for,
+        to mimic portals that cap page sizes. None for no cap
+        host: Interface to bind to
+        port: Port to bind to. 0 picks a free port
+
+    # Example usage...
+    import HerdingCats as hc
+    from HerdingCats.testing import MockCatalogueServer
+
+    def main():
+        with MockCatalogueServer(num_packages=500, latency=0.01) as server:
+            with hc.CatSession(hc.CkanDataCatalogues.UK_GOV, base_url=server.url) as session:
+                explore = hc.CkanCatExplorer(session)
+                print(explore.get_package_count())
+
+    if __name__ == "__main__":
+        main()
+    """
+
+    def __init__(
+        self,
+        num_packages: int = 100,
+        payload_size: int = 256,
+        file_rows: int = 1000,
+        latency: float = 0.0,
+        ods_base_paths: Iterable[str] = ("v2", "explore"),
+        max_limit: Optional[int] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        if num_packages < 0 or payload_size < 0 or file_rows < 0 or latency < 0:
+            raise ValueError("MockCatalogueServer settings can't be negative")
+
+        self.num_packages = num_packages
+        self.payload_size = payload_size
+        self.file_rows = file_rows
+        self.latency = latency
+        self.ods_base_paths = frozenset(ods_base_paths)
+        self.max_limit = max_limit
+        self.host = host
+        self.port = port
+        self.requests: Counter = Counter()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.packages: Dict[str, Dict[str, Any]] = {}
+        self._next_index = num_packages
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    # ----------------------------
+    # Lifecycle
+    # ----------------------------
+    def start(self) -> "MockCatalogueServer":
+        """Generate the catalogue and start serving it in a background thread."""
+        if self._server is not None:
+            return self
+        self._server = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._server.daemon_threads = True
+        self._server.catalogue = self
+        self.port = self._server.server_address[1]
+        self.packages = {
+            package["name"]: package
+            for package in (self._make_package(i) for i in range(self.num_packages))
+        }
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Mock catalogue server running at {self.url}")
+        return self
+
+    def stop(self) -> None:
+        """Stop the server."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server, pass it to CatSession(base_url=...)"""
+        return f"http://{self.host}:{self.port}"
+
+    # ----------------------------
+    # Change the catalogue while it is being served
+    # ----------------------------
+    def update_package(self, name: str, **fields) -> Dict[str, Any]:
+        """Change a package and bump its metadata_modified timestamp."""
+        with self._lock:
+            package = self.packages[name]
+            package.update(fields)
+            package["metadata_modified"] = _timestamp(datetime.now(timezone.utc))
+            return package
+
+    def add_package(self) -> Dict[str, Any]:
+        """Add a new package and return it."""
+        with self._lock:
+            # Counted separately so a package added after a delete gets a new name
+            package = self._make_package(self._next_index)
+            self._next_index += 1
+            package["metadata_modified"] = _timestamp(datetime.now(timezone.utc))
+            self.packages[package["name"]] = package
+            return package
+
+    def delete_package(self, name: str) -> None:
+        """Remove a package from the catalogue."""
+        with self._lock:
+            del self.packages[name]
+
+    # ----------------------------
+    # Generated data
+    # ----------------------------
+    def _make_package(self, i: int) -> Dict[str, Any]:
+        name = f"package-{i:05d}"
+        modified = _timestamp(_EPOCH + timedelta(hours=i))
+        notes = (f"Description of {name}. " * (self.payload_size // 20 + 1))[
+            : self.payload_size
+        ]
+        return {
+            "id": f"id-{i:05d}",
+            "name": name,
+            "title": f"Package {i}",
+            "notes": notes,
+            "notes_markdown": notes,
+            "maintainer": f"Maintainer {i % 10}",
+            "maintainer_email": f"maintainer{i % 10}@example.com",
+            "organization": {"name": f"org-{i % 5}", "title": f"Organisation {i % 5}"},
+            "tags": [{"name": f"tag-{i % 7}"}, {"name": f"tag-{i % 3}-extra"}],
+            "groups": [{"name": f"group-{i % 4}"}],
+            "metadata_created": modified,
+            "metadata_modified": modified,
+            "num_resources": 2,
+            "resources": [
+                {
+                    "id": f"res-{i:05d}-{fmt}",
+                    "name": f"{name}.{fmt}",
+                    "format": fmt.upper(),
+                    "url": f"/files/{name}.{fmt}",
+                    "created": modified,
+                    "last_modified": modified,
+                }
+                for fmt in ("csv", "json")
+            ],
+        }
+
+    def _resource_url(self, path: str) -> str:
+        return self.url + path
+
+    def _package_with_urls(self, package: Dict[str, Any]) -> Dict[str, Any]:
+        resources = [
+            {**resource, "url": self._resource_url(resource["url"])}
+            for resource in package["resources"]
+        ]
+        return {**package, "resources": resources}
+
+    def _snapshot(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self.packages.values())
+
+    def _find(self, identifier: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            package = self.packages.get(identifier)
+            if package is not None:
+                return package
+            for package in self.packages.values():
+                if package["id"] == identifier:
+                    return package
+        return None
+
+    def csv_file(self, name: str) -> bytes:
+        """The generated CSV served for every data file."""
+        lines = ["id,name,value,date"]
+        lines.extend(
+            f"{row},{name}-{row},{row * 1.5},{(_EPOCH + timedelta(days=row % 365)).date()}"
+            for row in range(self.file_rows)
+        )
+        return ("\n".join(lines) + "\n").encode()
+
+    def data_file(self, name: str) -> Tuple[str, bytes]:
+        """The generated data file for a name, in the format given by its extension."""
+        rows = {
+            "id": list(range(self.file_rows)),
+            "name": [f"{name}-{row}" for row in range(self.file_rows)],
+            "value": [row * 1.5 for row in range(self.file_rows)],
+        }
+        if name.endswith(".json"):
+            records = [dict(zip(rows, values)) for values in zip(*rows.values())]
+            return "application/json", json.dumps(records).encode()
+        if name.endswith(".parquet"):
+            buffer = BytesIO()
+            pq.write_table(pa.table(rows), buffer)
+            return "application/octet-stream", buffer.getvalue()
+        return "text/csv", self.csv_file(name)
+
+    # ----------------------------
+    # CKAN
+    # ----------------------------
+    def _ckan(self, action: str, query: Dict[str, str]) -> Tuple[int, Any]:
+        packages = self._snapshot()
+        match action:
+            case "package_list":
+                return 200, _ckan_ok([package["name"] for package in packages])
+            case "package_show":
+                package = self._find(query.get("id", ""))
+                if package is None:
+                    return 404, _ckan_not_found()
+                return 200, _ckan_ok(self._package_with_urls(package))
+            case "package_search":
+                results = _filter_packages(packages, query.get("q"), query.get("fq"))
+                results = _sort_packages(results, query.get("sort"))
+                start = int(query.get("start", 0))
+                rows = int(query.get("rows", 10))
+                page = [self._package_with_urls(p) for p in results[start : start + rows]]
+                return 200, _ckan_ok({"count": len(results), "results": page})
+            case "current_package_list_with_resources":
+                offset = int(query.get("offset", 0))
+                limit = int(query.get("limit", 10))
+                if self.max_limit is not None:
+                    limit = min(limit, self.max_limit)
+                page = packages[offset : offset + limit]
+                return 200, _ckan_ok([self._package_with_urls(p) for p in page])
+            case "organization_list":
+                names = sorted({package["organization"]["name"] for package in packages})
+                return 200, _ckan_ok(names)
+            case "datastore_search_sql":
+                records = [{"id": i, "value": i * 1.5} for i in range(self.file_rows)]
+                return 200, _ckan_ok({"result": {"records": records}})
+        return 404, _ckan_not_found()
+
+    # ----------------------------
+    # OpenDataSoft
+    # ----------------------------
+    def _ods_dataset(self, package: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "dataset_id": package["name"],
+            "dataset_uid": package["id"],
+            "has_records": True,
+            "fields": [
+                {"name": "id", "type": "int"},
+                {"name": "value", "type": "double"},
+            ],
+            "metas": {
+                "default": {
+                    "title": package["title"],
+                    "description": package["notes"],
+                    "modified": package["metadata_modified"],
+                    "publisher": package["organization"]["title"],
+                    "keyword": [tag["name"] for tag in package["tags"]],
+                    "records_count": self.file_rows,
+                }
+            },
+        }
+
+    def ods_catalogue_export(self, export_format: str) -> Tuple[str, bytes]:
+        """The whole catalogue as one file, as served by catalog/exports/{format}."""
+        rows = [
+            {
+                "dataset_id": dataset["dataset_id"],
+                **dataset["metas"]["default"],
+                # Multi-valued fields are comma separated in CSV and Parquet exports
+                "keyword": ",".join(dataset["metas"]["default"]["keyword"]),
+            }
+            for dataset in (self._ods_dataset(package) for package in self._snapshot())
+        ]
+        if export_format == "json":
+            return "application/json", json.dumps(rows).encode()
+        if export_format == "parquet":
+            buffer = BytesIO()
+            pq.write_table(pa.Table.from_pylist(rows), buffer)
+            return "application/octet-stream", buffer.getvalue()
+
+        # OpenDataSoft CSV exports are semicolon separated
+        buffer = StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=list(rows[0]) if rows else [], delimiter=";")
+        writer.writeheader()
+        writer.writerows(rows)
+        return "text/csv", buffer.getvalue().encode()
+
+    def _ods(self, base: str, rest: str, query: Dict[str, str]) -> Tuple[int, Any]:
+        if rest == "datasets":
+            # A where clause holding only a quoted string is an ODSQL full-text search
+            where = query.get("where", "").strip()
+            packages = _filter_packages(
+                self._snapshot(), where.strip('"') if where.startswith('"') else None, None
+            )
+            offset = int(query.get("offset", 0))
+            limit = int(query.get("limit", 10))
+            return 200, {
+                "total_count": len(packages),
+                "links": [],
+                "datasets": [
+                    {"links": [], "dataset": self._ods_dataset(package)}
+                    for package in packages[offset : offset + limit]
+                ],
+            }
+
+        parts = rest.split("/")
+        package = self._find(parts[1]) if len(parts) > 1 else None
+        if package is None:
+            return 404, {"error_code": "NotFound", "message": "Unknown dataset"}
+
+        if len(parts) == 2:
+            return 200, {"links": [], "dataset": self._ods_dataset(package)}
+        if len(parts) == 3 and parts[2] == "exports":
+            exports = self.url + base + f"datasets/{package['name']}/exports/"
+            return 200, {
+                "links": [{"rel": "self", "href": exports.rstrip("/")}]
+                + [
+                    {"rel": fmt, "href": exports + fmt}
+                    for fmt in ("csv", "json", "xlsx", "parquet")
+                ]
+            }
+        return 404, {"error_code": "NotFound", "message": "Unknown route"}
+
+    # ----------------------------
+    # DataPress
+    # ----------------------------
+    def _datapress_dataset(self, package: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "id": package["id"],
+            "title": package["title"],
+            "description": package["notes"],
+            "updatedAt": package["metadata_modified"],
+            "resources": {
+                resource["id"]: {
+                    "title": resource["name"],
+                    "format": resource["format"].lower(),
+                    "url": self._resource_url(resource["url"]),
+                }
+                for resource in package["resources"]
+            },
+        }
+
+    # ----------------------------
+    # data.gouv.fr
+    # ----------------------------
+    def _gouv_dataset(self, package: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "id": package["id"],
+            "slug": package["name"],
+            "title": package["title"],
+            "description": package["notes"],
+            "created_at": package["metadata_created"],
+            "last_modified": package["metadata_modified"],
+            "organization": {"name": package["organization"]["title"]},
+            "tags": [tag["name"] for tag in package["tags"]],
+            "resources": [
+                {
+                    "id": resource["id"],
+                    "title": resource["name"],
+                    "format": resource["format"].lower(),
+                    "url": self._resource_url(resource["url"]),
+                    "created_at": resource["created"],
+                    "last_modified": resource["last_modified"],
+                    "latest": self._resource_url(resource["url"]),
+                    "frequency": "daily",
+                    "extras": {},
+                }
+                for resource in package["resources"]
+            ],
+        }
+
+    def _gouv(self, rest: str, query: Dict[str, str]) -> Tuple[int, Any]:
+        if rest == "":
+            results = _filter_packages(self._snapshot(), query.get("q"), None)
+            page_size = int(query.get("page_size", 20))
+            page = int(query.get("page", 1))
+            start = (page - 1) * page_size
+            return 200, {
+                "data": [self._gouv_dataset(p) for p in results[start : start + page_size]],
+                "page": page,
+                "page_size": page_size,
+                "total": len(results),
+            }
+
+        parts = rest.strip("/").split("/")
+        package = self._find(parts[0])
+        if package is None:
+            return 404, {"message": "Not found"}
+        dataset = self._gouv_dataset(package)
+        if len(parts) == 2 and parts[1] == "resources":
+            return 200, dataset["resources"]
+        return 200, dataset
+
+    # ----------------------------
+    # ONS Nomis
+    # ----------------------------
+    def _nomis_keyfamily(self, package: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "id": _nomis_id(package),
+            "name": {"value": package["title"]},
+            "components": {
+                "dimension": [
+                    {"codelist": f"CL_{_nomis_id(package)}_GEOGRAPHY", "conceptref": "GEOGRAPHY"},
+                    {"codelist": f"CL_{_nomis_id(package)}_MEASURES", "conceptref": "MEASURES"},
+                ],
+                "attribute": [{"codelist": "CL_OBS_STATUS", "conceptref": "OBS_STATUS"}],
+                "timedimension": {"codelist": f"CL_{_nomis_id(package)}_TIME", "conceptref": "TIME"},
+            },
+        }
+
+    def _nomis(self, rest: str) -> Tuple[int, Any]:
+        if rest == "dataset/def.sdmx.json":
+            keyfamilies = [self._nomis_keyfamily(p) for p in self._snapshot()]
+            return 200, {"structure": {"keyfamilies": {"keyfamily": keyfamilies}}}
+
+        match = re.fullmatch(r"dataset/([^/]+)/def\.sdmx\.json", rest)
+        if match:
+            package = self._find_nomis(match.group(1))
+            if package is None:
+                return 404, {"error": "Unknown dataset"}
+            keyfamily = self._nomis_keyfamily(package)
+            return 200, {"structure": {"keyfamilies": {"keyfamily": [keyfamily]}}}
+
+        match = re.fullmatch(r"dataset/([^/.]+)\.overview\.json", rest)
+        if match:
+            package = self._find_nomis(match.group(1))
+            if package is None:
+                return 404, {"error": "Unknown dataset"}
+            return 200, {"overview": {"id": match.group(1), "name": package["title"]}}
+
+        match = re.fullmatch(r"codelist/([^/]+)\.def\.sdmx\.json", rest)
+        if match:
+            codes = [
+                {
+                    "value": 2092957697 + i,
+                    "description": {"value": f"Area {i}"},
+                    "annotations": {
+                        "annotation": [
+                            {
+                                "annotationtitle": "TypeName",
+                                "annotationtext": "local authorities" if i % 2 else "regions",
+                            }
+                        ]
+                    },
+                }
+                for i in range(20)
+            ]
+            return 200, {
+                "structure": {
+                    "codelists": {"codelist": [{"id": match.group(1), "code": codes}]}
+                }
+            }
+        return 404, {"error": "Unknown route"}
+
+    def _find_nomis(self, dataset_id: str) -> Optional[Dict[str, Any]]:
+        match = re.fullmatch(r"NM_(\d+)_1", dataset_id)
+        if not match:
+            return None
+        return self._find(f"package-{int(match.group(1)):05d}")
+
+    # ----------------------------
+    # DCAT
+    # ----------------------------
+    def _dcat(self, query: Dict[str, str]) -> Tuple[int, Any]:
+        results = _filter_packages(self._snapshot(), query.get("q"), None)
+        return 200, {
+            "@context": {"dcat": "http://www.w3.org/ns/dcat#"},
+            "dcat:dataset": [
+                {
+                    "@id": package["id"],
+                    "dct:title": package["title"],
+                    "dct:description": package["notes"],
+                    "dct:modified": package["metadata_modified"],
+                    "dcat:distribution": [
+                        {
+                            "dcat:accessURL": self._resource_url(resource["url"]),
+                            "dct:format": resource["format"],
+                        }
+                        for resource in package["resources"]
+                    ],
+                }
+                for package in results
+            ],
+        }
+
+    # ----------------------------
+    # Routing
+    # ----------------------------
+    def handle(self, path: str, query: Dict[str, str]) -> Tuple[int, str, bytes]:
+        """Route a request and return (status, content type, body)."""
+        if path in ("", "/"):
+            return 200, "text/plain", b"ok"
+
+        if path.startswith("/files/"):
+            return 200, *self.data_file(path.rsplit("/", 1)[-1])
+
+        status: int
+        body: Any
+        if path.startswith("/api/3/action/"):
+            status, body = self._ckan(path[len("/api/3/action/") :], query)
+        elif path.startswith("/api/v2/catalog/") and "v2" in self.ods_base_paths:
+            rest = path[len("/api/v2/catalog/") :]
+            if rest.count("/") == 3 and "/exports/" in rest:
+                return 200, *self.data_file(rest.replace("/exports/", "."))
+            if rest.startswith("exports/"):
+                return 200, *self.ods_catalogue_export(rest[len("exports/") :])
+            status, body = self._ods("/api/v2/catalog/", rest, query)
+        elif (
+            path.startswith("/api/explore/v2.0/catalog/")
+            and "explore" in self.ods_base_paths
+        ):
+            rest = path[len("/api/explore/v2.0/catalog/") :]
+            if rest.count("/") == 3 and "/exports/" in rest:
+                return 200, *self.data_file(rest.replace("/exports/", "."))
+            if rest.startswith("exports/"):
+                return 200, *self.ods_catalogue_export(rest[len("exports/") :])
+            status, body = self._ods("/api/explore/v2.0/catalog/", rest, query)
+        elif path == "/api/datasets/export.json":
+            status, body = 200, [self._datapress_dataset(p) for p in self._snapshot()]
+        elif path.startswith("/api/dataset/"):
+            package = self._find(path[len("/api/dataset/") :])
+            status, body = (
+                (200, self._datapress_dataset(package))
+                if package is not None
+                else (404, {"error": "Not found"})
+            )
+        elif path.startswith("/api/1/datasets/"):
+            status, body = self._gouv(path[len("/api/1/datasets/") :], query)
+        elif path == "/api/1/datasets":
+            status, body = self._gouv("", query)
+        elif re.fullmatch(r"/api/v01/dataset/[^/]+\.data\.csv", path):
+            return 200, "text/csv", self.csv_file(path.rsplit("/", 1)[-1])
+        elif path.startswith("/api/v01/"):
+            status, body = self._nomis(path[len("/api/v01/") :])
+        elif path == "/api/feed/dcat-ap/3.0.0.json":
+            status, body = self._dcat(query)
+        else:
+            status, body = 404, {"error": f"Unknown route {path}"}
+
+        return status, "application/json", json.dumps(body).encode()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        catalogue: MockCatalogueServer = self.server.catalogue
+        parsed = urlparse(self.path)
+        query = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        with catalogue._lock:
+            catalogue.requests[parsed.path] += 1
+            catalogue.in_flight += 1
+            catalogue.max_in_flight = max(catalogue.max_in_flight, catalogue.in_flight)
+
+        try:
+            if catalogue.latency:
+                time.sleep(catalogue.latency)
+            status, content_type, body = catalogue.handle(parsed.path, query)
+        except (KeyError, ValueError) as e:
+            status, content_type = 400, "application/json"
+            body = json.dumps({"error": str(e)}).encode()
+        finally:
+            with catalogue._lock:
+                catalogue.in_flight -= 1
+
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _timestamp(value: datetime) -> str:
+    return value.strftime("%Y-%m-%dT%H:%M:%S.%f")
+
+
+def _nomis_id(package: Dict[str, Any]) -> str:
+    return f"NM_{int(package['id'].split('-')[1])}_1"
+
+
+def _ckan_ok(result: Any) -> Dict[str, Any]:
+    return {"success": True, "result": result}
+
+
+def _ckan_not_found() -> Dict[str, Any]:
+    return {
+        "success": False,
+        "error": {"__type": "Not Found Error", "message": "Not found"},
+    }
+
+
+def _filter_packages(
+    packages: List[Dict[str, Any]], q: Optional[str], fq: Optional[str]
+) -> List[Dict[str, Any]]:
+    """Apply a plain text query and a simple CKAN filter query."""
+    results = packages
+    if q and q != "*:*":
+        needle = q.lower()
+        results = [
+            p
+            for p in results
+            if needle in p["name"].lower()
+            or needle in p["title"].lower()
+            or needle in p["notes"].lower()
+        ]
+    if fq:
+        for field, value in _FQ_TERM.findall(fq):
+            results = [p for p in results if _matches(p, field, value)]
+    return results
+
+
+def _matches(package: Dict[str, Any], field: str, value: str) -> bool:
+    if value.startswith("["):
+        low, high = value.strip("[]").split(" TO ")
+        actual = package.get(field, "")
+        return (low == "*" or actual >= low.rstrip("Z")) and (
+            high == "*" or actual <= high.rstrip("Z")
+        )
+
+    value = value.strip('"')
+    match field:
+        case "organization":
+            return package["organization"]["name"] == value
+        case "tags":
+            return any(tag["name"] == value for tag in package["tags"])
+        case "res_format":
+            return any(r["format"].lower() == value.lower() for r in package["resources"])
+        case "groups":
+            return any(group["name"] == value for group in package["groups"])
+    return str(package.get(field)) == value
+
+
+def _sort_packages(
+    packages: List[Dict[str, Any]], sort: Optional[str]
+) -> List[Dict[str, Any]]:
+    if not sort:
+        return packages
+    # Sort on the last field first, Python's sort is stable so earlier fields win
+    results = list(packages)
+    for clause in reversed(sort.split(",")):
+        field, _, direction = clause.strip().partition(" ")
+        results.sort(
+            key=lambda p: p.get(field, ""), reverse=direction.lower() == "desc"
+        )
+    return results
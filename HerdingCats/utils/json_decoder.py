@@ -0,0 +1,131 @@
+import json
+
+from typing import Any, Literal, Optional, Union
+from loguru import logger
+from requests import JSONDecodeError, Response
+
+from .lazy_imports import LazyModule
+
+# Optional fast decoders, installed with the fast-json extra
+orjson = LazyModule("orjson")
+msgspec = LazyModule("msgspec")
+
+JsonBackend = Literal["auto", "orjson", "msgspec", "json"]
+
+
+class JsonDecoder:
+    """
+    Decodes JSON response bodies with the fastest decoder installed.
+
+    "auto" picks orjson, then msgspec, then the standard library json module.
+    Catalogue responses such as package_list or current_package_list_with_resources
+    can be tens of MB, and orjson or msgspec decode them several times faster.
+
+    When msgspec is installed, a schema (a msgspec type) can be passed to decode only
+    the fields the explorers go on to use. Everything else in the payload is skipped
+    without building Python objects for it. The result is still plain dicts and lists,
+    so callers do not need to know which decoder ran. If a payload does not match the
+    schema it is decoded in full instead.
+
+    Args:
+        backend: "auto", "orjson", "msgspec" or "json"
+
+    # Example usage...
+    import HerdingCats as hc
+
+    def main():
+        # Force the standard library decoder, e.g. to compare results
+        hc.set_json_backend("json")
+        with hc.CatSession(hc.CkanDataCatalogues.UK_GOV) as session:
+            explore = hc.CkanCatExplorer(session)
+            print(explore.get_package_count())
+
+    if __name__ == "__main__":
+        main()
+    """
+
+    def __init__(self, backend: JsonBackend = "auto") -> None:
+        if backend not in ("auto", "orjson", "msgspec", "json"):
+            raise ValueError("backend must be one of: auto, orjson, msgspec, json")
+
+        if backend == "auto":
+            if orjson.is_available():
+                backend = "orjson"
+            elif msgspec.is_available():
+                backend = "msgspec"
+            else:
+                backend = "json"
+        elif backend != "json" and not LazyModule(backend).is_available():
+            raise ImportError(
+                f"{backend} is required for this JSON backend. "
+                "Install it with: pip install HerdCats[fast-json]"
+            )
+
+        self.backend = backend
+        self.typed = backend != "json" and msgspec.is_available()
+
+    def decode(self, content: Union[bytes, str], schema: Optional[Any] = None) -> Any:
+        """
+        Decode a JSON document.
+
+        Args:
+            content: JSON as bytes or str
+            schema: Optional msgspec type listing the fields to keep. Ignored without msgspec
+
+        Raises:
+            ValueError: If the document is not valid JSON
+        """
+        if schema is not None and self.typed:
+            try:
+                return msgspec.to_builtins(msgspec.json.decode(content, type=schema))
+            except msgspec.ValidationError as e:
+                logger.debug(f"Response did not match {schema.__name__}, decoding in full: {e}")
+
+        if self.backend == "orjson":
+            return orjson.loads(content)
+        if self.backend == "msgspec":
+            return msgspec.json.decode(content)
+        return json.loads(content)
+
+    def decode_response(self, response: Response, schema: Optional[Any] = None) -> Any:
+        """
+        Decode a response body, like response.json().
+
+        Raises:
+            requests.JSONDecodeError: If the body is not valid JSON, the same error response.json()
+            raises, so existing `except requests.RequestException` handlers still apply
+        """
+        try:
+            return self.decode(response.content, schema)
+        except ValueError as e:
+            raise JSONDecodeError(str(e), response.text, 0)
+
+
+# Decoder used by the explorers, swapped with set_json_backend
+_decoder = JsonDecoder()
+
+
+def set_json_backend(backend: JsonBackend = "auto") -> JsonDecoder:
+    """
+    Choose the JSON decoder the explorers use.
+
+    Args:
+        backend: "auto", "orjson", "msgspec" or "json"
+
+    Returns:
+        JsonDecoder: The decoder now in use
+    """
+    global _decoder
+    _decoder = JsonDecoder(backend)
+    logger.info(f"Decoding JSON responses with {_decoder.backend}")
+    return _decoder
+
+
+def get_json_decoder() -> JsonDecoder:
+    """Return the JSON decoder the explorers use."""
+    return _decoder
+
+
+def decode_response(response: Response, schema: Optional[Any] = None) -> Any:
+    """Decode a response body with the current decoder."""
+    return _decoder.decode_response(response, schema)
@@ -0,0 +1,67 @@
+import importlib
+import importlib.util
+import sys
+
+from types import ModuleType
+from typing import Any, Optional
+
+
+class LazyModule(ModuleType):
+    """
+    Stand-in for a module that is only imported the first time one of its attributes is used.
+
+    pandas, polars, duckdb, boto3 and pyarrow each take hundreds of milliseconds to import.
+    Deferring them keeps `import HerdingCats` fast for code that only explores catalogues.
+
+    Args:
+        name: Module to import, e.g. "pyarrow.parquet"
+        install_name: Package to suggest in the error if the module is missing. Defaults to name
+
+    # Example usage...
+    from HerdingCats.utils.lazy_imports import LazyModule
+
+    pd = LazyModule("pandas")
+
+    def to_frame(rows):
+        return pd.DataFrame(rows)  # pandas is imported here, not at module import
+    """
+
+    def __init__(self, name: str, install_name: Optional[str] = None) -> None:
+        super().__init__(name)
+        self._install_name = install_name or name.split(".")[0]
+        self._module: Optional[ModuleType] = None
+
+    def _load(self) -> ModuleType:
+        if self._module is None:
+            try:
+                self._module = importlib.import_module(self.__name__)
+            except ImportError as e:
+                raise ImportError(
+                    f"{self.__name__} is not installed. Please run 'pip install {self._install_name}'."
+                ) from e
+        return self._module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<LazyModule {self.__name__!r} ({state})>"
+
+    @property
+    def is_loaded(self) -> bool:
+        """Check if the module has been imported yet."""
+        return self._module is not None
+
+    def is_available(self) -> bool:
+        """Check if the module's package can be imported, without importing it."""
+        if self._module is not None or self.__name__ in sys.modules:
+            return True
+        try:
+            # Finding a submodule would import its parent, so only look for the top level package
+            return importlib.util.find_spec(self.__name__.split(".")[0]) is not None
+        except ModuleNotFoundError:
+            return False
@@ -0,0 +1,104 @@
+from typing import List
+
+import HerdingCats as hc
+from HerdingCats.testing import MockCatalogueServer
+
+from .harness import BenchmarkResult, run_benchmark
+
+SUITE = "catalogue"
+
+
+def run(server: MockCatalogueServer, iterations: int) -> List[BenchmarkResult]:
+    """Catalogue enumeration against the mock server."""
+    results = []
+    packages = server.num_packages
+
+    with hc.CatSession(
+        hc.CkanDataCatalogues.UK_GOV, lazy=True, base_url=server.url
+    ) as session:
+        explore = hc.CkanCatExplorer(session)
+        results.append(
+            run_benchmark(
+                "ckan_get_package_list",
+                SUITE,
+                explore.get_package_list,
+                iterations=iterations,
+                items=packages,
+            )
+        )
+        rows = min(packages, 1000)
+        results.append(
+            run_benchmark(
+                "ckan_search_dataframe_unpack",
+                SUITE,
+                lambda: explore.package_search_condense_dataframe_unpack(
+                    "package", rows, "pandas"
+                ),
+                iterations=iterations,
+                items=rows,
+            )
+        )
+        index = explore.build_search_index()
+        results.append(
+            run_benchmark(
+                "ckan_search_index_query",
+                SUITE,
+                lambda: index.search("package 12", limit=10),
+                iterations=iterations,
+            )
+        )
+
+    with hc.CatSession(
+        hc.OpenDataSoftDataCatalogues.UK_POWER_NETWORKS_DNO,
+        lazy=True,
+        base_url=server.url,
+    ) as session:
+        explore = hc.OpenDataSoftCatExplorer(session)
+        results.append(
+            run_benchmark(
+                "opendatasoft_fetch_all_datasets",
+                SUITE,
+                explore.fetch_all_datasets,
+                iterations=iterations,
+                items=packages,
+            )
+        )
+        results.append(
+            run_benchmark(
+                "opendatasoft_export_catalogue",
+                SUITE,
+                lambda: explore.export_catalogue("parquet"),
+                iterations=iterations,
+                items=packages,
+            )
+        )
+
+    with hc.CatSession(
+        hc.DataPressCatalogues.LONDON_DATA_STORE, lazy=True, base_url=server.url
+    ) as session:
+        explore = hc.DataPressCatExplorer(session)
+        results.append(
+            run_benchmark(
+                "datapress_get_all_datasets",
+                SUITE,
+                explore.get_all_datasets,
+                iterations=iterations,
+                items=packages,
+            )
+        )
+
+    with hc.CatSession(
+        hc.ONSNomisAPI.ONS_NOMI, lazy=True, base_url=server.url
+    ) as session:
+        explore = hc.ONSNomisCatExplorer(session)
+        results.append(
+            run_benchmark(
+                "nomis_get_all_datasets",
+                SUITE,
+                explore.get_all_datasets,
+                iterations=iterations,
+                items=packages,
+            )
+        )
+
+    return results
@@ -0,0 +1,45 @@
+import subprocess
+import sys
+
+from typing import List
+
+from HerdingCats.testing import MockCatalogueServer
+
+from .harness import BenchmarkResult, run_benchmark
+
+SUITE = "import"
+
+# None of these should be imported by a bare `import HerdingCats`
+HEAVY_MODULES = ("pandas", "polars", "duckdb", "boto3", "botocore", "pyarrow", "aiohttp")
+
+
+def run(server: MockCatalogueServer, iterations: int) -> List[BenchmarkResult]:
+    """Cold start cost of importing the package in a fresh interpreter."""
+    results = [
+        run_benchmark(
+            "python_startup",
+            SUITE,
+            lambda: _python("pass"),
+            iterations=iterations,
+        ),
+        run_benchmark(
+            "import_herding_cats",
+            SUITE,
+            lambda: _python("import HerdingCats"),
+            iterations=iterations,
+        ),
+    ]
+
+    loaded = _python(
+        "import sys, HerdingCats; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    ).strip()
+    if loaded:
+        results[-1].error = f"Heavy modules imported eagerly: {loaded}"
+    return results
+
+
+def _python(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
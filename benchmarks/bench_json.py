@@ -0,0 +1,71 @@
+from typing import List
+
+import requests
+
+from HerdingCats.testing import MockCatalogueServer
+from HerdingCats.utils.json_decoder import JsonDecoder
+from HerdingCats.utils.lazy_imports import LazyModule
+
+from .harness import BenchmarkResult, run_benchmark
+
+SUITE = "json"
+
+# (case name, CKAN action, query string, schema name in HerdingCats.explorer.schemas)
+PAYLOADS = [
+    ("package_list", "package_list", "", "CkanPackageList"),
+    (
+        "current_package_list_with_resources",
+        "current_package_list_with_resources",
+        "?limit=1000",
+        "CkanHarvestPage",
+    ),
+]
+
+
+def run(server: MockCatalogueServer, iterations: int) -> List[BenchmarkResult]:
+    """
+    Decoding large CKAN responses with each JSON backend.
+
+    "json" is the path response.json() took before the decoder layer was added.
+    Backends that are not installed are reported as skipped.
+    """
+    results = []
+    packages = server.num_packages
+
+    for case, action, query, schema_name in PAYLOADS:
+        body = requests.get(f"{server.url}/api/3/action/{action}{query}").content
+        items = min(packages, 1000) if query else packages
+
+        for backend in ("json", "orjson", "msgspec"):
+            if backend != "json" and not LazyModule(backend).is_available():
+                results.append(
+                    BenchmarkResult.skip(f"{case}_{backend}", SUITE, f"{backend} not installed")
+                )
+                continue
+            decoder = JsonDecoder(backend)
+            results.append(
+                run_benchmark(
+                    f"{case}_{backend}",
+                    SUITE,
+                    lambda decoder=decoder: decoder.decode(body),
+                    iterations=iterations,
+                    items=items,
+                )
+            )
+
+        if LazyModule("msgspec").is_available():
+            from HerdingCats.explorer import schemas
+
+            decoder = JsonDecoder("msgspec")
+            schema = getattr(schemas, schema_name)
+            results.append(
+                run_benchmark(
+                    f"{case}_msgspec_typed",
+                    SUITE,
+                    lambda: decoder.decode(body, schema),
+                    iterations=iterations,
+                    items=items,
+                )
+            )
+
+    return results
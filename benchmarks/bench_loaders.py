@@ -0,0 +1,98 @@
+import itertools
+
+from typing import List, Optional
+
+import HerdingCats as hc
+from HerdingCats.testing import MockCatalogueServer
+
+from .harness import BenchmarkResult, run_benchmark
+
+SUITE = "loaders"
+
+
+def run(server: MockCatalogueServer, iterations: int) -> List[BenchmarkResult]:
+    """Loading a parquet resource from the mock server into DataFrames and DuckDB."""
+    results = []
+    rows = server.file_rows
+    resource = [
+        "data",
+        "2024-01-01",
+        "parquet",
+        f"{server.url}/files/package-00000.parquet",
+    ]
+    table_names = (f"bench_{i}" for i in itertools.count())
+
+    with hc.CatSession(
+        hc.CkanDataCatalogues.UK_GOV, lazy=True, base_url=server.url
+    ) as session:
+        loader = hc.CkanLoader(session)
+
+        results.append(
+            run_benchmark(
+                "polars_data_loader",
+                SUITE,
+                lambda: loader.polars_data_loader(resource),
+                iterations=iterations,
+                items=rows,
+            )
+        )
+        results.append(
+            run_benchmark(
+                "pandas_data_loader",
+                SUITE,
+                lambda: loader.pandas_data_loader(resource),
+                iterations=iterations,
+                items=rows,
+            )
+        )
+        # DuckDB reads remote files itself, which needs its httpfs extension
+        missing = _httpfs_missing()
+        if missing:
+            results.append(BenchmarkResult.skip("duckdb_data_loader", SUITE, missing))
+            results.append(BenchmarkResult.skip("query_to_polars", SUITE, missing))
+            return results
+
+        results.append(
+            run_benchmark(
+                "duckdb_data_loader",
+                SUITE,
+                lambda: loader.duckdb_data_loader(
+                    resource, table_name=next(table_names), format_type="parquet"
+                ),
+                iterations=iterations,
+                items=rows,
+            )
+        )
+        results.append(
+            run_benchmark(
+                "query_to_polars",
+                SUITE,
+                lambda: _query_to_polars(loader, resource, next(table_names)),
+                iterations=iterations,
+                items=rows,
+            )
+        )
+
+    return results
+
+
+def _httpfs_missing() -> Optional[str]:
+    """Install and load httpfs as the loaders do, returning why it failed, if it did."""
+    import duckdb
+
+    try:
+        with duckdb.connect() as con:
+            con.execute("INSTALL httpfs;")
+            con.execute("LOAD httpfs;")
+    except duckdb.Error as e:
+        return f"DuckDB httpfs extension unavailable: {str(e).splitlines()[0]}"
+    return None
+
+
+def _query_to_polars(loader: hc.CkanLoader, resource: list, table_name: str):
+    return loader.query_to_polars(
+        resource,
+        table_name=table_name,
+        format_type="parquet",
+        query=f"SELECT name, SUM(value) FROM {table_name} GROUP BY name",
+    )
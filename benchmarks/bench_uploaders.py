@@ -0,0 +1,56 @@
+import os
+import tempfile
+import uuid
+
+from io import BytesIO
+from typing import List
+
+from HerdingCats.loader.loader_stores import LocalUploader, S3Uploader
+from HerdingCats.testing import MockCatalogueServer
+
+from .harness import BenchmarkResult, run_benchmark
+
+SUITE = "uploaders"
+
+# S3 cases only run when a bucket is given, they never run against a fake
+S3_BUCKET_ENV = "HERDINGCATS_BENCH_S3_BUCKET"
+
+
+def run(server: MockCatalogueServer, iterations: int) -> List[BenchmarkResult]:
+    """Writing a CSV resource in raw and parquet mode."""
+    results = []
+    rows = server.file_rows
+    data = server.csv_file("upload.csv")
+
+    with tempfile.TemporaryDirectory() as directory:
+        uploader = LocalUploader(directory)
+        for mode in ("raw", "parquet"):
+            results.append(
+                run_benchmark(
+                    f"local_{mode}",
+                    SUITE,
+                    lambda mode=mode: uploader.upload(
+                        BytesIO(data), "bench", str(uuid.uuid4()), mode, "csv"
+                    ),
+                    iterations=iterations,
+                    items=rows,
+                )
+            )
+
+    bucket = os.environ.get(S3_BUCKET_ENV)
+    if bucket:
+        uploader = S3Uploader()
+        for mode in ("raw", "parquet"):
+            results.append(
+                run_benchmark(
+                    f"s3_{mode}",
+                    SUITE,
+                    lambda mode=mode: uploader.upload(
+                        BytesIO(data), bucket, f"herdingcats-bench/{uuid.uuid4()}", mode, "csv"
+                    ),
+                    iterations=iterations,
+                    items=rows,
+                )
+            )
+
+    return results
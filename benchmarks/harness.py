@@ -0,0 +1,266 @@
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from loguru import logger
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Seconds between RSS samples while measuring peak memory
+_RSS_SAMPLE_INTERVAL = 0.001
+
+
+class BenchmarkResult:
+    """
+    Timings and memory use for a single benchmark case.
+
+    A case that can't run here, e.g. because an optional dependency is missing, is
+    recorded as skipped with the reason, rather than as an error.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        suite: str,
+        timings: List[float],
+        items: int,
+        peak_memory: int,
+        error: Optional[str] = None,
+        skipped: Optional[str] = None,
+        peak_python_memory: int = 0,
+    ) -> None:
+        self.name = name
+        self.suite = suite
+        self.timings = timings
+        self.items = items
+        self.peak_memory = peak_memory
+        self.error = error
+        self.skipped = skipped
+        self.peak_python_memory = peak_python_memory
+
+    @classmethod
+    def skip(cls, name: str, suite: str, reason: str) -> "BenchmarkResult":
+        logger.warning(f"Skipping {suite}/{name}: {reason}")
+        return cls(name, suite, [], 0, 0, skipped=reason)
+
+    def as_dict(self) -> Dict[str, Any]:
+        if self.skipped is not None:
+            return {"name": self.name, "suite": self.suite, "skipped": self.skipped}
+        if self.error is not None or not self.timings:
+            return {"name": self.name, "suite": self.suite, "error": self.error}
+
+        total = sum(self.timings)
+        return {
+            "name": self.name,
+            "suite": self.suite,
+            "iterations": len(self.timings),
+            "items_per_iteration": self.items,
+            "throughput_per_s": (self.items * len(self.timings)) / total if total else None,
+            "latency_s": {
+                "mean": statistics.fmean(self.timings),
+                "min": min(self.timings),
+                "max": max(self.timings),
+                "p50": percentile(self.timings, 50),
+                "p95": percentile(self.timings, 95),
+                "p99": percentile(self.timings, 99),
+            },
+            "peak_memory_bytes": self.peak_memory,
+            "peak_python_bytes": self.peak_python_memory,
+        }
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Percentile using linear interpolation between the closest ranks."""
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def run_benchmark(
+    name: str,
+    suite: str,
+    func: Callable[[], Any],
+    iterations: int = 10,
+    warmup: int = 1,
+    items: int = 1,
+) -> BenchmarkResult:
+    """
+    Time a callable.
+
+    Latency is measured over `iterations` calls after `warmup` untimed calls.
+    Peak memory is how far the process's resident set size rose during one extra call,
+    so it includes Arrow, Polars and DuckDB buffers. Python allocations alone are
+    measured with tracemalloc on another call. Neither affects the timings.
+
+    Args:
+        name: Name of the case
+        suite: Suite the case belongs to
+        func: Callable to benchmark
+        iterations: Number of timed calls
+        warmup: Number of untimed calls made first
+        items: Units of work per call, used for throughput (e.g. packages listed)
+    """
+    logger.info(f"Running {suite}/{name}")
+    try:
+        for _ in range(warmup):
+            func()
+
+        timings = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+
+        peak = peak_rss_growth(func)
+
+        tracemalloc.start()
+        try:
+            func()
+            _, python_peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    except Exception as e:
+        logger.warning(f"{suite}/{name} failed: {e}")
+        return BenchmarkResult(name, suite, [], items, 0, error=str(e))
+
+    return BenchmarkResult(
+        name, suite, timings, items, peak, peak_python_memory=python_peak
+    )
+
+
+def _current_rss() -> Optional[int]:
+    """Resident set size of this process in bytes, where /proc is available."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _max_rss() -> int:
+    """Highest resident set size this process has reached, in bytes."""
+    if resource is None:
+        return 0
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS and kilobytes elsewhere
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def peak_rss_growth(func: Callable[[], Any]) -> int:
+    """
+    Call func once and return how many bytes the resident set size rose above its start.
+
+    Where /proc is available RSS is sampled from another thread while func runs, so the
+    peak of every case is seen even if an earlier case pushed the process higher.
+    Elsewhere ru_maxrss is used, which only moves once the process passes its
+    previous high-water mark, so later cases can read lower than they should.
+    """
+    start = _current_rss()
+    if start is None:
+        before = _max_rss()
+        func()
+        return max(0, _max_rss() - before)
+
+    peak = start
+    stop = threading.Event()
+
+    def sample() -> None:
+        nonlocal peak
+        while not stop.wait(_RSS_SAMPLE_INTERVAL):
+            peak = max(peak, _current_rss() or 0)
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        func()
+    finally:
+        stop.set()
+        sampler.join()
+    return max(0, peak - start)
+
+
+def environment() -> Dict[str, Any]:
+    """Describe where the benchmarks ran, so results from different releases can be compared."""
+    try:
+        from importlib.metadata import version
+
+        herding_cats_version = version("HerdCats")
+    except Exception:
+        herding_cats_version = None
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "herding_cats_version": herding_cats_version,
+        "git_commit": commit,
+    }
+
+
+def write_results(
+    results: List[BenchmarkResult], path: Path, config: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Write results to a JSON file and return what was written."""
+    report = {
+        "environment": environment(),
+        "config": config,
+        "results": [result.as_dict() for result in results],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2))
+    logger.success(f"Benchmark results written to {path}")
+    return report
+
+
+def compare(
+    report: Dict[str, Any], baseline: Dict[str, Any], threshold: float
+) -> List[str]:
+    """
+    Compare p50 latency against a baseline report.
+
+    Returns:
+        List of cases that got slower by more than threshold (e.g. 0.2 for 20%)
+    """
+    previous = {
+        (r["suite"], r["name"]): r for r in baseline["results"] if "latency_s" in r
+    }
+    regressions = []
+    for result in report["results"]:
+        old = previous.get((result["suite"], result["name"]))
+        if "latency_s" not in result or old is None:
+            continue
+        before = old["latency_s"]["p50"]
+        after = result["latency_s"]["p50"]
+        change = (after - before) / before if before else 0.0
+        line = f"{result['suite']}/{result['name']}: p50 {before:.4f}s -> {after:.4f}s ({change:+.1%})"
+        print(line)
+        if change > threshold:
+            regressions.append(line)
+    return regressions
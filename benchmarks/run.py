@@ -0,0 +1,107 @@
+"""
+Run the HerdingCats benchmarks against a local MockCatalogueServer.
+
+Results are written as JSON so runs from different releases can be compared.
+
+# Example usage...
+python -m benchmarks.run --output benchmarks/results/latest.json
+python -m benchmarks.run --suite catalogue --compare benchmarks/results/baseline.json
+"""
+
+import argparse
+import json
+import sys
+
+from pathlib import Path
+
+from loguru import logger
+
+from HerdingCats.testing import MockCatalogueServer
+
+from . import bench_catalogue, bench_import, bench_json, bench_loaders, bench_uploaders
+from .harness import compare, write_results
+
+SUITES = {
+    "import": bench_import,
+    "catalogue": bench_catalogue,
+    "json": bench_json,
+    "loaders": bench_loaders,
+    "uploaders": bench_uploaders,
+}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run the HerdingCats benchmarks")
+    parser.add_argument("--suite", choices=sorted(SUITES), action="append")
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--packages", type=int, default=1000)
+    parser.add_argument("--payload-size", type=int, default=512)
+    parser.add_argument("--file-rows", type=int, default=10000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument(
+        "--output", type=Path, default=Path("benchmarks/results/latest.json")
+    )
+    parser.add_argument("--compare", type=Path, help="Baseline results to compare with")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Fail if any p50 latency is this much slower than the baseline",
+    )
+    args = parser.parse_args(argv)
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    config = {
+        "suites": args.suite or sorted(SUITES),
+        "iterations": args.iterations,
+        "packages": args.packages,
+        "payload_size": args.payload_size,
+        "file_rows": args.file_rows,
+        "latency": args.latency,
+    }
+
+    results = []
+    with MockCatalogueServer(
+        num_packages=args.packages,
+        payload_size=args.payload_size,
+        file_rows=args.file_rows,
+        latency=args.latency,
+    ) as server:
+        for name in config["suites"]:
+            results.extend(SUITES[name].run(server, args.iterations))
+
+    report = write_results(results, args.output, config)
+    errors = 0
+    for result in report["results"]:
+        if "skipped" in result:
+            print(f"{result['suite']}/{result['name']}: SKIPPED {result['skipped']}")
+        elif "error" in result:
+            errors += 1
+            print(f"{result['suite']}/{result['name']}: ERROR {result['error']}")
+        else:
+            latency = result["latency_s"]
+            print(
+                f"{result['suite']}/{result['name']}: "
+                f"p50 {latency['p50']:.4f}s p95 {latency['p95']:.4f}s p99 {latency['p99']:.4f}s "
+                f"{result['throughput_per_s']:.0f} items/s "
+                f"peak {result['peak_memory_bytes'] / 1024 / 1024:.1f} MiB "
+                f"(Python {result['peak_python_bytes'] / 1024 / 1024:.1f} MiB)"
+            )
+
+    failed = errors > 0
+    if errors:
+        print(f"{errors} benchmark cases failed")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regressions above {args.threshold:.0%}")
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,6 +18,7 @@ const sidebars: SidebarsConfig = {
     "intro",
     "catalogues",
     "quick-start",
+    "sessions",
     {
       type: "category",
       label: "Explorer Classes",
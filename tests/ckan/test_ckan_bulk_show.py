@@ -0,0 +1,50 @@
+import pytest
+from HerdingCats.session.session import CatSession
+from HerdingCats.explorer.explore import CkanCatExplorer
+from HerdingCats.config.sources import CkanDataCatalogues
+from HerdingCats.errors.errors import CatExplorerError
+
+
+pytestmark = pytest.mark.mock_server(num_packages=40, payload_size=32, latency=0.01)
+
+
+def test_show_package_info_bulk_reports_failures_per_package(server):
+    """
+    Check that every package gets a result and missing packages yield errors instead of aborting
+    """
+    names = [f"package-{i:05d}" for i in range(40)] + ["missing-1", "missing-2"]
+
+    with CatSession(CkanDataCatalogues.UK_GOV, lazy=True, base_url=server.url) as session:
+        explore = CkanCatExplorer(session)
+        results = list(explore.show_package_info_bulk(names, max_workers=4))
+
+    assert sorted(name for name, _, _ in results) == sorted(names), (
+        "Expected one result per package"
+    )
+    errors = {name: error for name, info, error in results if error is not None}
+    assert set(errors) == {"missing-1", "missing-2"}, f"Unexpected failures: {errors}"
+    assert all(isinstance(e, CatExplorerError) for e in errors.values()), (
+        "Failures should be reported as CatExplorerError"
+    )
+    assert all(info for name, info, error in results if error is None), (
+        "Successful packages should include their resources"
+    )
+
+
+def test_show_package_info_bulk_reads_names_lazily(server):
+    """
+    Check that only a bounded number of names are read ahead of the results
+    """
+    consumed = []
+
+    def names():
+        for i in range(40):
+            consumed.append(i)
+            yield f"package-{i:05d}"
+
+    with CatSession(CkanDataCatalogues.UK_GOV, lazy=True, base_url=server.url) as session:
+        explore = CkanCatExplorer(session)
+        results = explore.show_package_info_bulk(names(), max_workers=2)
+        next(results)
+        assert len(consumed) <= 5, f"Read {len(consumed)} names before the first result"
+        results.close()
@@ -0,0 +1,82 @@
+import pytest
+from HerdingCats.session.session import CatSession
+from HerdingCats.explorer.explore import CkanCatExplorer
+from HerdingCats.config.sources import CkanDataCatalogues
+from HerdingCats.errors.errors import CatExplorerError
+from HerdingCats.testing import MockCatalogueServer
+
+HARVEST_PATH = "/api/3/action/current_package_list_with_resources"
+
+
+pytestmark = pytest.mark.mock_server(num_packages=95, payload_size=32)
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_harvest_package_resources_pages_whole_catalogue(server, max_workers):
+    """
+    Check that a harvest yields one row per resource, in catalogue order, in a handful of requests
+    """
+    with CatSession(CkanDataCatalogues.UK_GOV, lazy=True, base_url=server.url) as session:
+        explore = CkanCatExplorer(session)
+        rows = list(explore.harvest_package_resources(page_size=10, max_workers=max_workers))
+
+    assert len(rows) == 190, f"Expected 2 resources for each of 95 packages, got {len(rows)}"
+    assert [row["name"] for row in rows[::2]] == [f"package-{i:05d}" for i in range(95)], (
+        "Rows should keep the catalogue's order"
+    )
+    assert rows[0]["package_id"] == "id-00000", "Rows should include the package id"
+    assert rows[0]["resource_id"] == "res-00000-csv", "Rows should include the resource id"
+    assert rows[0]["organisation"] == "org-0", "Rows should include the organisation"
+    assert rows[0]["resource_url"].endswith("/files/package-00000.csv"), (
+        "Rows should include the resource url"
+    )
+    assert server.requests[HARVEST_PATH] <= 10 + max_workers, (
+        f"Too many harvest requests: {server.requests[HARVEST_PATH]}"
+    )
+
+
+def test_harvest_package_resources_keeps_packages_without_resources(server):
+    """
+    Check that a package without resources still yields a row
+    """
+    server.packages["package-00003"]["resources"] = []
+
+    with CatSession(CkanDataCatalogues.UK_GOV, lazy=True, base_url=server.url) as session:
+        explore = CkanCatExplorer(session)
+        rows = [
+            row
+            for row in explore.harvest_package_resources(page_size=50)
+            if row["name"] == "package-00003"
+        ]
+
+    assert len(rows) == 1, "Expected one row for a package without resources"
+    assert rows[0]["resource_url"] is None, "Resource fields should be None"
+
+
+def test_harvest_package_resources_raises_on_failed_page(server, monkeypatch):
+    """
+    Check that a failed page surfaces as a CatExplorerError
+    """
+    monkeypatch.setattr(server, "handle", lambda path, query: (500, "text/plain", b""))
+
+    with CatSession(CkanDataCatalogues.UK_GOV, lazy=True, base_url=server.url) as session:
+        explore = CkanCatExplorer(session)
+        with pytest.raises(CatExplorerError):
+            list(explore.harvest_package_resources(page_size=10))
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_harvest_continues_when_portal_caps_limit(max_workers):
+    """
+    Check that a portal capping limit below page_size still has every package harvested
+    """
+    with MockCatalogueServer(num_packages=95, payload_size=32, max_limit=20) as server:
+        with CatSession(CkanDataCatalogues.UK_GOV, lazy=True, base_url=server.url) as session:
+            explore = CkanCatExplorer(session)
+            records = list(
+                explore.harvest_package_records(page_size=50, max_workers=max_workers)
+            )
+
+    assert [record.name for record in records] == [f"package-{i:05d}" for i in range(95)], (
+        f"Expected all 95 packages once each, in order, got {len(records)}"
+    )
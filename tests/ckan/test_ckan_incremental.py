@@ -0,0 +1,66 @@
+import pytest
+from HerdingCats.session.session import CatSession
+from HerdingCats.explorer.explore import CkanCatExplorer
+from HerdingCats.explorer.snapshot import HarvestSnapshot
+from HerdingCats.config.sources import CkanDataCatalogues
+
+
+pytestmark = pytest.mark.mock_server(num_packages=50, payload_size=32)
+
+
+def test_harvest_incremental_only_fetches_changes(server, tmp_path):
+    """
+    Check that a second harvest returns only changed, new and deleted packages
+    """
+    path = tmp_path / "snapshot.json"
+
+    with CatSession(CkanDataCatalogues.UK_GOV, lazy=True, base_url=server.url) as session:
+        explore = CkanCatExplorer(session)
+
+        snapshot = HarvestSnapshot.load(path)
+        changed, deleted = explore.harvest_incremental(snapshot, page_size=20)
+        snapshot.save()
+        assert len(changed) == 50, f"First harvest should be full, got {len(changed)}"
+        assert deleted == set(), "Nothing should be deleted on the first harvest"
+        assert snapshot.watermark == "2024-01-03T01:00:00.000000", (
+            f"Unexpected watermark {snapshot.watermark}"
+        )
+
+        server.update_package("package-00007", title="Updated")
+        server.update_package("package-00021", title="Updated")
+        added = server.add_package()
+        server.delete_package("package-00003")
+        server.requests.clear()
+
+        snapshot = HarvestSnapshot.load(path)
+        changed, deleted = explore.harvest_incremental(snapshot, page_size=20)
+
+    assert set(changed) == {"package-00007", "package-00021", added["name"]}, (
+        f"Unexpected changes: {sorted(changed)}"
+    )
+    assert deleted == {"package-00003"}, f"Unexpected deletions: {deleted}"
+    assert len(snapshot) == 50, f"Snapshot should hold 50 packages, got {len(snapshot)}"
+    assert "package-00003" not in snapshot, "Deleted package should be removed"
+    assert server.requests["/api/3/action/current_package_list_with_resources"] == 0, (
+        "An incremental harvest should not page the whole catalogue"
+    )
+    assert snapshot.watermark == snapshot.modified(added["name"]), (
+        "Watermark should move to the newest change"
+    )
+
+
+def test_harvest_incremental_with_no_changes(server, tmp_path):
+    """
+    Check that re-running with nothing changed returns nothing and keeps the snapshot
+    """
+    with CatSession(CkanDataCatalogues.UK_GOV, lazy=True, base_url=server.url) as session:
+        explore = CkanCatExplorer(session)
+        snapshot = HarvestSnapshot(tmp_path / "snapshot.json")
+        explore.harvest_incremental(snapshot)
+        watermark = snapshot.watermark
+
+        changed, deleted = explore.harvest_incremental(snapshot)
+
+    assert changed == {} and deleted == set(), "Expected no changes"
+    assert snapshot.watermark == watermark, "Watermark should not move"
+    assert len(list(snapshot.rows())) == 100, "Expected two resource rows per package"
@@ -37,3 +37,42 @@ def test_get_package_count():
             )
         except AssertionError as e:
             pytest.fail(str(e))
+
+
+@pytest.mark.mock_server(num_packages=70)
+def test_package_count_uses_package_search(server):
+    """
+    Check that counts come from package_search without downloading package_list
+    """
+    with CatSession(CkanDataCatalogues.UK_GOV, lazy=True, base_url=server.url) as session:
+        explore = CkanCatExplorer(session)
+        assert explore.get_package_count() == 70, "Expected 70 packages"
+        assert explore.get_package_count(organisation="org-1") == 14, (
+            "Expected 14 packages for org-1"
+        )
+        assert explore.get_package_count(organisation="org-1", tags="tag-0") == 2, (
+            "Expected 2 packages for org-1 tagged tag-0"
+        )
+
+    assert server.requests["/api/3/action/package_list"] == 0, (
+        "package_list should not be downloaded"
+    )
+
+
+@pytest.mark.mock_server(num_packages=70)
+def test_package_count_falls_back_to_package_list(server, monkeypatch):
+    """
+    Check that package_list is used when package_search is unavailable
+    """
+    original = server.handle
+
+    def without_search(path, query):
+        if path.endswith("package_search"):
+            return 404, "application/json", b"{}"
+        return original(path, query)
+
+    monkeypatch.setattr(server, "handle", without_search)
+    with CatSession(CkanDataCatalogues.UK_GOV, lazy=True, base_url=server.url) as session:
+        assert CkanCatExplorer(session).get_package_count() == 70, (
+            "Expected the package_list count"
+        )
@@ -0,0 +1,87 @@
+import sys
+
+import pytest
+from HerdingCats.session.session import CatSession
+from HerdingCats.explorer.explore import CkanCatExplorer
+from HerdingCats.explorer.records import PackageRecord, ResourceRecord
+from HerdingCats.loader.loader import CkanLoader
+from HerdingCats.config.sources import CkanDataCatalogues
+
+
+pytestmark = pytest.mark.mock_server(num_packages=20, payload_size=32, file_rows=50)
+
+
+def test_extract_resource_url_returns_records(server):
+    """
+    Check that extract_resource_url returns ResourceRecords that still behave like the old lists
+    """
+    with CatSession(CkanDataCatalogues.UK_GOV, lazy=True, base_url=server.url) as session:
+        explore = CkanCatExplorer(session)
+        resources = explore.extract_resource_url(explore.show_package_info("package-00002"))
+
+    assert all(isinstance(r, ResourceRecord) for r in resources), "Expected ResourceRecords"
+    csv = resources[0]
+    name, created, fmt, url = csv
+    assert (name, fmt) == ("package-00002.csv", "CSV"), "Records should unpack like lists"
+    assert csv[3] == csv.url == url, "Records should index like lists"
+    assert csv == [name, created, fmt, url], "Records should compare equal to the old list"
+    assert csv.package == "package-00002", "Records should know their package"
+    assert not hasattr(csv, "__dict__"), "Records should use __slots__"
+    assert sys.getsizeof(csv) < sys.getsizeof({"name": name, "created": created}), (
+        "A record should be smaller than a dictionary"
+    )
+
+
+def test_loader_accepts_records(server):
+    """
+    Check that the CKAN loader picks a record by format without positional validation
+    """
+    parquet = ResourceRecord(
+        "data", "2024-01-01", "parquet", f"{server.url}/files/package-00000.parquet"
+    )
+    csv = ResourceRecord("data", "2024-01-01", "CSV", f"{server.url}/files/package-00000.csv")
+
+    with CatSession(CkanDataCatalogues.UK_GOV, lazy=True, base_url=server.url) as session:
+        loader = CkanLoader(session)
+        df = loader.polars_data_loader([csv, parquet], "parquet")
+        assert df.height == 50, f"Expected 50 rows, got {df.height}"
+
+        with pytest.raises(ValueError):
+            loader.polars_data_loader([csv], "xlsx")
+        with pytest.raises(ValueError):
+            loader.polars_data_loader(ResourceRecord("data", None, "parquet", "ftp://x"))
+
+
+def test_harvest_package_records(server):
+    """
+    Check that a harvest can yield compact PackageRecords
+    """
+    with CatSession(CkanDataCatalogues.UK_GOV, lazy=True, base_url=server.url) as session:
+        explore = CkanCatExplorer(session)
+        packages = list(explore.harvest_package_records(page_size=7))
+
+    assert len(packages) == 20, f"Expected 20 packages, got {len(packages)}"
+    first = packages[0]
+    assert isinstance(first, PackageRecord), "Expected PackageRecords"
+    assert (first.name, first.organisation, first.title) == ("package-00000", "org-0", "Package 0"), (
+        f"Unexpected record {first!r}"
+    )
+    assert [r.format for r in first.resources] == ["CSV", "JSON"], "Unexpected resources"
+    assert first.resources[0].id == "res-00000-csv", "Resources should keep their id"
+
+
+def test_records_hash_like_the_values_they_equal():
+    """
+    Check that a record and the tuple it equals can be mixed in sets and dictionary keys
+    """
+    record = ResourceRecord("roads.csv", "2024-01-01", "CSV", "http://x/roads.csv", id="res-1")
+    plain = ("roads.csv", "2024-01-01", "CSV", "http://x/roads.csv")
+
+    assert record == plain and hash(record) == hash(plain), (
+        "Equal values should have equal hashes"
+    )
+    assert plain in {record}, "A tuple should find the equal record in a set"
+    assert {record: "found"}[plain] == "found", "A tuple should find the equal record key"
+    assert len({record, ResourceRecord(*plain, id="res-1")}) == 1, (
+        "Equal records should collapse in a set"
+    )
@@ -0,0 +1,67 @@
+import pytest
+from HerdingCats.session.session import CatSession
+from HerdingCats.explorer.explore import CkanCatExplorer
+from HerdingCats.config.sources import CkanDataCatalogues
+
+pytestmark = pytest.mark.mock_server(num_packages=30, payload_size=32)
+
+RESOURCE_COLUMNS = ["resource_name", "resource_created", "resource_format", "resource_url"]
+
+
+@pytest.mark.parametrize("df_type", ["pandas", "polars"])
+def test_search_dataframe_unpack(server, df_type):
+    """
+    Check that the unpacked dataframe has one row per resource for pandas and polars
+    """
+    server.packages["package-00001"]["resources"] = []
+    with CatSession(CkanDataCatalogues.UK_GOV, lazy=True, base_url=server.url) as session:
+        explore = CkanCatExplorer(session)
+        df = explore.package_search_condense_dataframe_unpack("package", 5, df_type)
+
+    assert list(df.columns) == ["name", "notes_markdown"] + RESOURCE_COLUMNS, (
+        f"Unexpected columns: {list(df.columns)}"
+    )
+    assert df.shape == (8, 6), f"Expected 8 resource rows, got {df.shape}"
+    assert "package-00001" not in list(df["name"]), (
+        "Packages without resources should not produce rows"
+    )
+    assert list(df["resource_format"])[:2] == ["CSV", "JSON"], "Unexpected resource formats"
+
+
+@pytest.mark.parametrize("df_type", ["pandas", "polars"])
+def test_search_dataframe_nested(server, df_type):
+    """
+    Check that the condensed dataframe keeps resources nested, one row per package
+    """
+    server.packages["package-00001"]["resources"] = []
+    with CatSession(CkanDataCatalogues.UK_GOV, lazy=True, base_url=server.url) as session:
+        explore = CkanCatExplorer(session)
+        df = explore.package_search_condense_dataframe("package", 5, df_type)
+
+    assert list(df.columns) == ["name", "notes_markdown", "num_resources", "resources"], (
+        f"Unexpected columns: {list(df.columns)}"
+    )
+    assert df.shape[0] == 5, f"Expected 5 packages, got {df.shape[0]}"
+    resources = list(df["resources"])
+    assert len(resources[0]) == 2 and len(resources[1]) == 0, (
+        "Each row should hold that package's resources"
+    )
+
+
+def test_build_tables_handle_mixed_types():
+    """
+    Check that a field with mixed types is kept as strings instead of failing
+    """
+    packages = [
+        {"name": "a", "notes_markdown": 1, "resources": [{"name": "r", "format": 5}]},
+        {"name": "b", "notes_markdown": "text", "resources": [{"name": "s", "format": "CSV"}]},
+    ]
+    table = CkanCatExplorer._build_unpacked_table(
+        packages, ["name", "notes_markdown"], ["name", "format"]
+    )
+    assert table.column("notes_markdown").to_pylist() == ["1", "text"], (
+        "Mixed types should be converted to strings"
+    )
+    assert table.column("resource_format").to_pylist() == ["5", "CSV"], (
+        "Mixed resource types should be converted to strings"
+    )
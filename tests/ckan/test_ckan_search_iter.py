@@ -0,0 +1,79 @@
+import pytest
+from HerdingCats.session.session import CatSession
+from HerdingCats.explorer.explore import CkanCatExplorer
+from HerdingCats.config.sources import CkanDataCatalogues
+from HerdingCats.errors.errors import CatExplorerError
+
+
+pytestmark = pytest.mark.mock_server(num_packages=95, payload_size=32)
+
+
+def test_iter_package_search_pages_with_start(server):
+    """
+    Check that every package is yielded once when paging with start/rows
+    """
+    with CatSession(CkanDataCatalogues.UK_GOV, lazy=True, base_url=server.url) as session:
+        explore = CkanCatExplorer(session)
+        names = [p["name"] for p in explore.iter_package_search(rows=10)]
+
+    assert len(names) == 95, f"Expected 95 packages, got {len(names)}"
+    assert len(set(names)) == 95, "Packages should not be repeated"
+    assert server.requests["/api/3/action/package_search"] == 10, (
+        "Expected one request per page"
+    )
+
+
+def test_iter_package_search_filters_and_condenses(server):
+    """
+    Check that filters are sent as fq and condense yields the condensed view
+    """
+    with CatSession(CkanDataCatalogues.UK_GOV, lazy=True, base_url=server.url) as session:
+        explore = CkanCatExplorer(session)
+        packages = list(
+            explore.iter_package_search(
+                rows=5, organisation="org-1", prefetch=False, condense=True
+            )
+        )
+
+    assert len(packages) == 19, f"Expected 19 packages for org-1, got {len(packages)}"
+    assert set(packages[0]) == {"name", "notes_markdown", "resources"}, (
+        "Condensed packages should only hold the condensed fields"
+    )
+
+
+def test_iter_package_search_cursor_handles_shared_timestamps(server):
+    """
+    Check that cursor paging neither skips nor repeats packages sharing a metadata_modified
+    """
+    for i in range(10, 30):
+        server.packages[f"package-{i:05d}"]["metadata_modified"] = "2024-01-01T10:00:00.000000"
+
+    with CatSession(CkanDataCatalogues.UK_GOV, lazy=True, base_url=server.url) as session:
+        explore = CkanCatExplorer(session)
+        names = [p["name"] for p in explore.iter_package_search(rows=7, cursor=True)]
+        recent = list(
+            explore.iter_package_search(
+                rows=7, cursor=True, modified_since="2024-01-04T00:00:00"
+            )
+        )
+
+    assert sorted(names) == [f"package-{i:05d}" for i in range(95)], (
+        "Cursor paging should yield every package exactly once"
+    )
+    assert len(recent) == 95 - 72, f"Expected 23 recent packages, got {len(recent)}"
+
+
+def test_iter_package_search_stops_early_and_raises(server, monkeypatch):
+    """
+    Check that breaking out early is safe and request errors surface as CatExplorerError
+    """
+    with CatSession(CkanDataCatalogues.UK_GOV, lazy=True, base_url=server.url) as session:
+        explore = CkanCatExplorer(session)
+        iterator = explore.iter_package_search(rows=10)
+        first = next(iterator)
+        iterator.close()
+        assert first["name"] == "package-00000", "Expected the first package"
+
+        monkeypatch.setattr(server, "handle", lambda path, query: (500, "text/plain", b""))
+        with pytest.raises(CatExplorerError):
+            list(explore.iter_package_search(rows=10))
@@ -0,0 +1,15 @@
+import pytest
+from HerdingCats.testing import MockCatalogueServer
+
+
+@pytest.fixture
+def server(request):
+    """
+    A running MockCatalogueServer.
+
+    Its settings come from the closest mock_server marker, e.g. on the module:
+    pytestmark = pytest.mark.mock_server(num_packages=50, payload_size=32)
+    """
+    marker = request.node.get_closest_marker("mock_server")
+    with MockCatalogueServer(**(marker.kwargs if marker else {})) as server:
+        yield server
@@ -0,0 +1,86 @@
+from datetime import date
+
+import pytest
+from HerdingCats.session.session import CatSession
+from HerdingCats.explorer.catalogue_store import CatalogueStore
+from HerdingCats.errors.errors import CatExplorerError
+from HerdingCats.config.sources import (
+    CkanDataCatalogues,
+    DataPressCatalogues,
+    ONSNomisAPI,
+    OpenDataSoftDataCatalogues,
+)
+
+
+pytestmark = pytest.mark.mock_server(num_packages=60, payload_size=32)
+
+
+def test_snapshot_every_catalogue_type(server, tmp_path):
+    """
+    Check that CKAN, OpenDataSoft, DataPress and Nomis snapshots land in one queryable view
+    """
+    store = CatalogueStore(tmp_path)
+    catalogues = [
+        CkanDataCatalogues.UK_GOV,
+        OpenDataSoftDataCatalogues.UK_POWER_NETWORKS_DNO,
+        DataPressCatalogues.NORTHERN_DATA_MILL,
+        ONSNomisAPI.ONS_NOMI,
+    ]
+    for catalogue in catalogues:
+        with CatSession(catalogue, lazy=True, base_url=server.url) as session:
+            store.snapshot(session, harvest_date=date(2024, 5, 1))
+
+    assert len(store.snapshots()) == 4, f"Expected 4 snapshots, got {store.snapshots()}"
+
+    df = store.query(
+        "SELECT catalogue_type, count(DISTINCT package_id) AS packages "
+        "FROM catalogue GROUP BY catalogue_type ORDER BY catalogue_type",
+        df_type="pandas",
+    )
+    assert df["packages"].tolist() == [60, 60, 60, 60], f"Unexpected counts:\n{df}"
+    assert set(df["catalogue_type"]) == {"ckan", "opendatasoft", "data_press", "ons_nomis"}, (
+        f"Unexpected catalogue types:\n{df}"
+    )
+
+    with store.connect() as con:
+        ckan_rows = con.sql(
+            "SELECT count(*) FROM catalogue WHERE catalogue_type = 'ckan' AND resource_url IS NOT NULL"
+        ).fetchone()[0]
+    resources = sum(len(p["resources"]) for p in server.packages.values())
+    assert ckan_rows == resources, (
+        "CKAN snapshots should hold one row per resource"
+    )
+
+
+def test_catalogue_view_reads_latest_snapshot(server, tmp_path):
+    """
+    Check that older snapshots are kept, replaced on the same day, and catalogue shows the latest
+    """
+    store = CatalogueStore(tmp_path)
+    with CatSession(CkanDataCatalogues.UK_GOV, lazy=True, base_url=server.url) as session:
+        store.snapshot(session, harvest_date=date(2024, 5, 1))
+        server.delete_package("package-00001")
+        store.snapshot(session, harvest_date=date(2024, 5, 2))
+        store.snapshot(session, harvest_date=date(2024, 5, 2))
+
+    assert [d for _, d in store.snapshots()] == [date(2024, 5, 1), date(2024, 5, 2)], (
+        f"Unexpected snapshots: {store.snapshots()}"
+    )
+    df = store.query(
+        "SELECT harvest_date, count(DISTINCT package_name) AS packages "
+        "FROM catalogue_snapshots GROUP BY ALL ORDER BY harvest_date"
+    )
+    assert df["packages"].to_list() == [60, 59], f"Unexpected counts:\n{df}"
+
+    latest = store.query("SELECT DISTINCT package_name FROM catalogue")
+    assert "package-00001" not in latest["package_name"].to_list(), (
+        "catalogue should only show the latest snapshot"
+    )
+
+
+def test_empty_store_raises(tmp_path):
+    """
+    Check that querying a store without snapshots raises a clear error
+    """
+    with pytest.raises(CatExplorerError):
+        CatalogueStore(tmp_path).connect()
@@ -0,0 +1,126 @@
+from datetime import date
+
+import pytest
+
+from HerdingCats.session.session import CatSession
+from HerdingCats.explorer.catalogue_store import CatalogueStore
+from HerdingCats.explorer.diff import CatalogueDiff, diff_records, hash_index
+from HerdingCats.explorer.explore import OpenDataSoftCatExplorer
+from HerdingCats.config.sources import CkanDataCatalogues, OpenDataSoftDataCatalogues
+from HerdingCats.testing import MockCatalogueServer
+
+
+def test_diff_records_on_mappings():
+    """
+    Check that added, removed and modified keys are found in plain dictionaries
+    """
+    old = {"a": {"title": "A"}, "b": {"title": "B"}, "c": {"title": "C"}}
+    new = {"a": {"title": "A"}, "b": {"title": "B2"}, "d": {"title": "D"}}
+
+    diff = CatalogueDiff.from_changes(diff_records(old, new))
+    assert diff.added == {"d"}, f"Unexpected added: {diff.added}"
+    assert diff.removed == {"c"}, f"Unexpected removed: {diff.removed}"
+    assert diff.modified == {"b"}, f"Unexpected modified: {diff.modified}"
+    assert diff.changed == {"b", "d"}, "changed should be added and modified keys"
+
+
+def test_diff_records_streams_changes_against_saved_hashes():
+    """
+    Check that changes are yielded before the new snapshot is exhausted, and key order is ignored
+    """
+    old = hash_index([{"id": i, "v": i, "w": 0} for i in range(5)], key="id")
+    read = []
+
+    def new_records():
+        for i in range(1, 6):
+            read.append(i)
+            yield {"w": 0, "v": i if i != 3 else -1, "id": i}
+
+    changes = diff_records(old, new_records(), key="id", old_hashes=True)
+    first = next(changes)
+    assert (first.kind, first.key) == ("modified", 3), f"Unexpected first change: {first}"
+    # One record past the change is read, to see that no more rows share its key
+    assert read == [1, 2, 3, 4], "Changes should be yielded as the new snapshot is read"
+    assert [(c.kind, c.key) for c in changes] == [("added", 5), ("removed", 0)], (
+        "Added records should come before removed ones"
+    )
+
+
+def test_diff_opendatasoft_datasets():
+    """
+    Check that iter_datasets output can be diffed between two runs
+    """
+    with MockCatalogueServer(num_packages=30) as server:
+        with CatSession(
+            OpenDataSoftDataCatalogues.UK_POWER_NETWORKS_DNO, lazy=True, base_url=server.url
+        ) as session:
+            explore = OpenDataSoftCatExplorer(session)
+            before = hash_index(explore.iter_datasets(), key="dataset_id")
+            server.update_package("package-00004", title="Renamed")
+            server.delete_package("package-00007")
+            changes = list(
+                diff_records(before, explore.iter_datasets(), key="dataset_id", old_hashes=True)
+            )
+
+    assert [(c.kind, c.key) for c in changes] == [
+        ("modified", "package-00004"),
+        ("removed", "package-00007"),
+    ], f"Unexpected changes: {changes}"
+
+
+def test_diff_catalogue_store_snapshots(tmp_path):
+    """
+    Check that store snapshots are diffed by package and by resource
+    """
+    store = CatalogueStore(tmp_path)
+    with MockCatalogueServer(num_packages=40) as server:
+        with CatSession(CkanDataCatalogues.UK_GOV, lazy=True, base_url=server.url) as session:
+            store.snapshot(session, harvest_date=date(2024, 5, 1))
+            server.delete_package("package-00001")
+            server.update_package("package-00002", title="Renamed")
+            added = server.add_package()
+            store.snapshot(session, harvest_date=date(2024, 5, 2))
+            source = session.domain
+
+    packages = CatalogueDiff.from_changes(store.diff(source))
+    assert packages.added == {added["id"]}, f"Unexpected added: {packages.added}"
+    assert packages.removed == {"id-00001"}, f"Unexpected removed: {packages.removed}"
+    assert packages.modified == {"id-00002"}, f"Unexpected modified: {packages.modified}"
+
+    resources = list(store.diff(source, level="resource", batch_size=2))
+    new_urls = {c.record["resource_url"] for c in resources if c.kind == "added"}
+    assert len(new_urls) == len(added["resources"]), f"Unexpected added urls: {new_urls}"
+    assert all(added["name"] in url for url in new_urls), (
+        "Added resources should carry their urls"
+    )
+    assert all(isinstance(c.key, tuple) for c in resources), "Resource keys should be tuples"
+    assert not list(
+        store.diff(source, old_date=date(2024, 5, 2), new_date=date(2024, 5, 2))
+    ), "A snapshot should not differ from itself"
+
+
+def test_diff_records_with_shared_keys():
+    """
+    Check that a change to any row sharing a key is reported, as for harvest rows keyed by package
+    """
+    old = [
+        {"name": "roads", "resource_url": "roads.csv"},
+        {"name": "roads", "resource_url": "roads.json"},
+        {"name": "rail", "resource_url": "rail.csv"},
+    ]
+    new = [
+        {"name": "roads", "resource_url": "roads.csv"},
+        {"name": "roads", "resource_url": "roads.geojson"},
+        {"name": "rail", "resource_url": "rail.csv"},
+    ]
+
+    changes = list(diff_records(old, new, key="name"))
+    assert [(c.kind, c.key) for c in changes] == [("modified", "roads")], (
+        f"A change to the second row should be found, got {changes}"
+    )
+    assert changes[0].record == new[:2], "The change should carry every row for the key"
+    assert not list(diff_records(old, [new[0], old[1], old[2]][::-1], key="name")), (
+        "Row order within a key should not matter"
+    )
+    with pytest.raises(ValueError):
+        list(diff_records(old, [new[0], new[2], new[1]], key="name"))
@@ -0,0 +1,115 @@
+import threading
+import time
+
+import pytest
+from HerdingCats.session.session import CatSession
+from HerdingCats.explorer.federated import FederatedSearch, SearchHit
+from HerdingCats.config.sources import (
+    CkanDataCatalogues,
+    FrenchGouvCatalogue,
+    ONSNomisAPI,
+    OpenDataSoftDataCatalogues,
+)
+from HerdingCats.testing import MockCatalogueServer
+
+
+pytestmark = pytest.mark.mock_server(num_packages=200, payload_size=32)
+
+
+def _sessions(*pairs):
+    return [CatSession(catalogue, lazy=True, base_url=url) for catalogue, url in pairs]
+
+
+def test_federated_search_merges_every_catalogue(server):
+    """
+    Check that CKAN, OpenDataSoft and data.gouv.fr hits are normalised and merged into one ranking
+    """
+    sessions = _sessions(
+        (CkanDataCatalogues.UK_GOV, server.url),
+        (OpenDataSoftDataCatalogues.UK_POWER_NETWORKS_DNO, server.url),
+        (FrenchGouvCatalogue.GOUV_FR, server.url),
+    )
+    search = FederatedSearch(sessions, timeout=10)
+
+    results = {result.source: result for result in search.iter_search("package 12")}
+    assert len(results) == 3, f"Expected a result per catalogue, got {list(results)}"
+    assert all(result.ok for result in results.values()), f"Unexpected errors: {results}"
+    assert all(len(result.hits) == 11 for result in results.values()), (
+        "Each catalogue should return package 12 and packages 120-129"
+    )
+
+    merged = search.search("package 12", limit=6)
+    assert len(merged) == 6, f"Expected 6 hits, got {len(merged)}"
+    assert all(isinstance(hit, SearchHit) for hit in merged), "Hits should be SearchHits"
+    assert {hit.catalogue_type for hit in merged} == {"ckan", "opendatasoft", "french_gov"}, (
+        "The best hits should come from every catalogue"
+    )
+    assert merged == sorted(merged, key=lambda hit: hit.score, reverse=True), (
+        "Hits should be sorted by score"
+    )
+    assert all(hit.title and hit.url for hit in merged), "Hits should have a title and url"
+
+    for session in sessions:
+        session.close_session()
+
+
+def test_slow_catalogue_times_out_without_blocking_others(server, monkeypatch):
+    """
+    Check that a slow catalogue is reported as timed out while fast ones are returned first
+    """
+    # The slow catalogue doesn't answer until the test is done with it
+    release = threading.Event()
+    with MockCatalogueServer(num_packages=50) as slow:
+        handle = slow.handle
+        monkeypatch.setattr(
+            slow, "handle", lambda path, query: release.wait() and handle(path, query)
+        )
+        sessions = _sessions(
+            (CkanDataCatalogues.UK_GOV, server.url),
+            (OpenDataSoftDataCatalogues.UK_POWER_NETWORKS_DNO, slow.url),
+        )
+        slow_domain = sessions[1].domain
+        search = FederatedSearch(sessions, timeout=30, timeouts={slow_domain: 0.2})
+
+        try:
+            start = time.perf_counter()
+            results = list(search.iter_search("package"))
+            elapsed = time.perf_counter() - start
+        finally:
+            release.set()
+
+    assert [result.source for result in results] == [sessions[0].domain, slow_domain], (
+        "The fast catalogue should be yielded first"
+    )
+    assert results[0].ok and results[0].hits, "Fast catalogue should return hits"
+    assert isinstance(results[1].error, TimeoutError), (
+        f"Slow catalogue should time out, got {results[1].error!r}"
+    )
+    assert results[1].hits == [], "A timed out catalogue should have no hits"
+    assert elapsed < search.timeout, (
+        f"Search waited {elapsed:.2f}s, past the slow catalogue's own timeout"
+    )
+
+
+def test_unsupported_catalogue_is_rejected():
+    """
+    Check that catalogue types without a search adapter are rejected up front
+    """
+    session = CatSession(ONSNomisAPI.ONS_NOMI, lazy=True)
+    with pytest.raises(ValueError):
+        FederatedSearch([session])
+
+
+def test_failed_catalogue_is_reported_as_error(server, monkeypatch):
+    """
+    Check that a data.gouv.fr outage is reported as an error, not as a search with no hits
+    """
+    monkeypatch.setattr(server, "handle", lambda path, query: (503, "text/plain", b""))
+    sessions = _sessions((FrenchGouvCatalogue.GOUV_FR, server.url))
+
+    (result,) = FederatedSearch(sessions, timeout=5).iter_search('roads & "rail"')
+
+    assert not result.ok and result.error is not None, (
+        f"Expected the outage to be reported, got {result!r}"
+    )
+    assert result.hits == [], "A failed catalogue should have no hits"
@@ -0,0 +1,111 @@
+import json
+import threading
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from HerdingCats.session.session import CatSession
+from HerdingCats.explorer.explore import CkanCatExplorer
+from HerdingCats.explorer.memo import MetadataCache
+from HerdingCats.config.sources import CkanDataCatalogues
+from HerdingCats.testing import MockCatalogueServer
+
+
+class PackageHandler(BaseHTTPRequestHandler):
+    """Serves a package_show response with a single resource."""
+
+    calls = 0
+
+    def do_GET(self):
+        PackageHandler.calls += 1
+        body = {
+            "result": {
+                "name": "roads",
+                "resources": [{"name": "roads.csv", "format": "CSV"}],
+            }
+        }
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(json.dumps(body).encode())
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def explorer():
+    PackageHandler.calls = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), PackageHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    session = CatSession(
+        CkanDataCatalogues.UK_GOV,
+        lazy=True,
+        base_url=f"http://127.0.0.1:{server.server_address[1]}",
+    )
+    yield CkanCatExplorer(session, cache=MetadataCache(max_entries=2, ttl=60))
+    session.close_session()
+    server.shutdown()
+
+
+def test_memoized_calls_skip_the_network(explorer):
+    """
+    Check that repeated metadata calls are served from the cache
+    """
+    first = explorer.show_package_info("roads")
+    first[0]["name"] = "changed"
+    second = explorer.show_package_info("roads")
+
+    assert PackageHandler.calls == 1, (
+        f"Expected 1 network request, but got {PackageHandler.calls}"
+    )
+    assert second[0]["name"] == "roads", "Cached results should not be changed by callers"
+    assert explorer.cache.stats()["hits"] == 1, "Expected one cache hit"
+
+
+def test_invalidate_and_lru_eviction(explorer):
+    """
+    Check that invalidated and least recently used entries are fetched again
+    """
+    explorer.show_package_info("roads")
+    assert explorer.cache.invalidate("show_package_info", "roads") == 1, (
+        "Expected one entry to be invalidated"
+    )
+    explorer.show_package_info("roads")
+    explorer.show_package_info("rail")
+    explorer.show_package_info("buses")
+    explorer.show_package_info("roads")
+
+    assert PackageHandler.calls == 5, (
+        f"Expected 5 network requests, but got {PackageHandler.calls}"
+    )
+    assert len(explorer.cache) == 2, "Cache should be bounded by max_entries"
+
+
+def test_shared_cache_keeps_catalogues_apart():
+    """
+    Check that a cache shared by explorers for two catalogues never mixes up their results
+    """
+    cache = MetadataCache(ttl=60)
+    with MockCatalogueServer(num_packages=5) as first, MockCatalogueServer(num_packages=5) as second:
+        with CatSession(CkanDataCatalogues.UK_GOV, lazy=True, base_url=first.url) as a, \
+             CatSession(CkanDataCatalogues.UK_GOV, lazy=True, base_url=second.url) as b:
+            explore_a = CkanCatExplorer(a, cache=cache)
+            explore_b = CkanCatExplorer(b, cache=cache)
+            info_a = explore_a.show_package_info("package-00001")
+            info_b = explore_b.show_package_info("package-00001")
+            explore_b.show_package_info("package-00001")
+
+    assert first.requests["/api/3/action/package_show"] == 1, "First portal should be asked once"
+    assert second.requests["/api/3/action/package_show"] == 1, (
+        "Second portal should be asked, not served the first portal's result"
+    )
+    assert first.url in str(info_a) and second.url not in str(info_a), (
+        "First explorer should get the first portal's resource links"
+    )
+    assert second.url in str(info_b) and first.url not in str(info_b), (
+        "Second explorer should get the second portal's resource links"
+    )
+    assert cache.stats()["entries"] == 2, f"Expected an entry per catalogue: {cache.stats()}"
+    assert cache.invalidate("show_package_info", "package-00001", catalogue=first.url) == 1, (
+        "Expected only the first portal's entry to be invalidated"
+    )
@@ -0,0 +1,72 @@
+import pytest
+from HerdingCats.session.session import CatSession
+from HerdingCats.explorer.explore import (
+    CkanCatExplorer,
+    DataPressCatExplorer,
+    OpenDataSoftCatExplorer,
+    FrenchGouvCatExplorer,
+    ONSNomisCatExplorer,
+)
+from HerdingCats.config.sources import (
+    CkanDataCatalogues,
+    DataPressCatalogues,
+    OpenDataSoftDataCatalogues,
+    FrenchGouvCatalogue,
+    ONSNomisAPI,
+)
+
+
+pytestmark = pytest.mark.mock_server(num_packages=150, file_rows=10)
+
+
+def test_ckan_explorer_against_mock_server(server):
+    """
+    Check the CKAN routes of the mock server
+    """
+    with CatSession(CkanDataCatalogues.UK_GOV, base_url=server.url) as session:
+        explore = CkanCatExplorer(session)
+        assert explore.get_package_count() == 150, "Expected 150 packages"
+        info = explore.show_package_info("package-00010")
+        assert info[0]["resource_url"].startswith(server.url), (
+            "Resource URLs should point at the mock server"
+        )
+        results = explore.package_search("package-0001", 5)
+        assert results["count"] == 10, f"Expected 10 matches, got {results['count']}"
+
+
+def test_opendatasoft_explorer_against_mock_server(server):
+    """
+    Check the OpenDataSoft routes of the mock server
+    """
+    with CatSession(
+        OpenDataSoftDataCatalogues.UK_POWER_NETWORKS_DNO, base_url=server.url
+    ) as session:
+        explore = OpenDataSoftCatExplorer(session)
+        datasets = explore.fetch_all_datasets()
+        assert len(datasets) == 150, "Expected every dataset across pages"
+        exports = explore.show_dataset_export_options("package-00001")
+        assert {"csv", "json"} <= {e["format"] for e in exports}, (
+            "Expected csv and json exports"
+        )
+
+
+def test_other_explorers_against_mock_server(server):
+    """
+    Check the DataPress, data.gouv.fr and Nomis routes of the mock server
+    """
+    with CatSession(DataPressCatalogues.LONDON_DATA_STORE, base_url=server.url) as session:
+        assert len(DataPressCatExplorer(session).get_all_datasets()) == 150, (
+            "Expected every DataPress dataset"
+        )
+
+    with CatSession(FrenchGouvCatalogue.GOUV_FR, base_url=server.url) as session:
+        meta = FrenchGouvCatExplorer(session).get_dataset_meta("package-00002")
+        assert meta["slug"] == "package-00002", "Expected the dataset to be found by slug"
+
+    with CatSession(ONSNomisAPI.ONS_NOMI, base_url=server.url) as session:
+        explore = ONSNomisCatExplorer(session)
+        assert len(explore.get_all_datasets()) == 150, "Expected every Nomis dataset"
+        codelist = explore.get_codelist_meta_info("CL_1_1_GEOGRAPHY")
+        assert "local authorities" in explore.get_codelist_values(codelist), (
+            "Expected geography types from the codelist"
+        )
@@ -0,0 +1,117 @@
+import pytest
+from HerdingCats.session.session import CatSession
+from HerdingCats.explorer.explore import CkanCatExplorer
+from HerdingCats.explorer.search_index import CatalogueIndex
+from HerdingCats.explorer.snapshot import HarvestSnapshot
+from HerdingCats.config.sources import CkanDataCatalogues
+from HerdingCats.testing import MockCatalogueServer
+
+
+@pytest.fixture
+def index():
+    index = CatalogueIndex()
+    index.add(
+        "road-traffic",
+        title="Road traffic accidents",
+        notes="Accidents reported to the police on public roads",
+        tags=["transport", "roads"],
+        formats=["CSV", "JSON"],
+    )
+    index.add(
+        "air-quality",
+        title="Air quality monitoring",
+        notes="Hourly readings from roadside air quality monitors",
+        tags=["environment"],
+        formats=["CSV"],
+    )
+    index.add(
+        "bus-stops",
+        title="Bus stops",
+        notes="Location of every bus stop, used by transport planners",
+        tags=["transport"],
+        formats=["GeoJSON"],
+    )
+    return index
+
+
+def test_search_ranks_title_matches_first(index):
+    """
+    Check that results are ranked and title matches beat notes matches
+    """
+    results = index.search("transport accidents")
+    assert [r["id"] for r in results][:2] == ["road-traffic", "bus-stops"], (
+        f"Unexpected ranking: {results}"
+    )
+    assert results[0]["score"] > results[1]["score"], "Results should be sorted by score"
+    assert index.search("the of and") == [], "Stopword only queries should match nothing"
+
+
+def test_search_filters_by_format(index):
+    """
+    Check that res_format limits results to packages with that resource format
+    """
+    results = index.search("transport", res_format="geojson")
+    assert [r["id"] for r in results] == ["bus-stops"], f"Unexpected results: {results}"
+
+
+def test_incremental_updates_and_persistence(index, tmp_path):
+    """
+    Check that packages can be replaced and removed, and the index survives a save and load
+    """
+    index.add("bus-stops", title="Bus timetables", formats=["CSV"])
+    index.remove("air-quality")
+    assert len(index) == 2, f"Expected 2 packages, got {len(index)}"
+    assert index.search("stops") == [], "Replaced package should not match its old text"
+
+    loaded = CatalogueIndex.load(index.save(tmp_path / "index.json"))
+    assert loaded.search("timetables") == index.search("timetables"), (
+        "Loaded index should give the same results"
+    )
+    assert index.search("air quality") == [], "Removed package should not match"
+
+
+def test_build_search_index_from_catalogue():
+    """
+    Check that an index built from a harvest answers queries offline
+    """
+    with MockCatalogueServer(num_packages=2000, payload_size=64) as server:
+        with CatSession(CkanDataCatalogues.UK_GOV, lazy=True, base_url=server.url) as session:
+            explore = CkanCatExplorer(session)
+            index = explore.build_search_index(page_size=500)
+
+    assert len(index) == 2000, f"Expected 2000 packages, got {len(index)}"
+    results = index.search("package 1234", limit=3)
+
+    assert len(results) == 3, f"Expected 3 results, got {len(results)}"
+    assert results[0]["id"] == "package-01234", f"Unexpected top result: {results[0]}"
+    assert results[0]["score"] > results[1]["score"], (
+        "The exact match should outscore packages matching only 'package'"
+    )
+    assert results[0]["organisation"] == "org-4", "Stored fields should be returned"
+
+
+def test_apply_harvest_keeps_titles_and_tags():
+    """
+    Check that packages re-indexed from an incremental harvest still match on title and tags
+    """
+    with MockCatalogueServer(num_packages=50, payload_size=32) as server:
+        with CatSession(CkanDataCatalogues.UK_GOV, lazy=True, base_url=server.url) as session:
+            explore = CkanCatExplorer(session)
+            index = explore.build_search_index(page_size=20)
+            snapshot = HarvestSnapshot()
+            explore.harvest_incremental(snapshot, page_size=20)
+
+            server.update_package(
+                "package-00007", title="Substation loading", tags=[{"name": "electricity"}]
+            )
+            index.apply_harvest(*explore.harvest_incremental(snapshot, page_size=20))
+
+    assert [r["id"] for r in index.search("substation")] == ["package-00007"], (
+        "A title only match should be found after apply_harvest"
+    )
+    assert [r["id"] for r in index.search("electricity")] == ["package-00007"], (
+        "A tag only match should be found after apply_harvest"
+    )
+    assert index.search("substation")[0]["title"] == "Substation loading", (
+        "Stored title should be updated"
+    )
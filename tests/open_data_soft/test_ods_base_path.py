@@ -0,0 +1,94 @@
+import json
+
+import pytest
+from HerdingCats.session.session import CatSession
+from HerdingCats.explorer import explore as explore_module
+from HerdingCats.explorer.explore import OpenDataSoftCatExplorer
+from HerdingCats.errors.errors import CatExplorerError
+from HerdingCats.config.source_endpoints import OpenDataSoftApiPaths
+from HerdingCats.config.sources import OpenDataSoftDataCatalogues
+
+
+# A portal that only serves the /api/explore/v2.0 base path
+pytestmark = pytest.mark.mock_server(
+    num_packages=250, payload_size=16, ods_base_paths=("explore",)
+)
+
+
+def _v2_requests(server):
+    return sum(n for path, n in server.requests.items() if path.startswith("/api/v2/"))
+
+
+def test_base_path_is_detected_once(server):
+    """
+    Check that the failed request on the unsupported base path is only made once per portal
+    """
+    with CatSession(
+        OpenDataSoftDataCatalogues.UK_POWER_NETWORKS_DNO, lazy=True, base_url=server.url
+    ) as session:
+        explore = OpenDataSoftCatExplorer(session)
+        assert len(explore.fetch_all_datasets()) == 250, "Expected every dataset"
+        explore.show_dataset_info("package-00001")
+        explore.show_dataset_export_options("package-00002")
+        explore.search_datasets("package 1")
+
+        # A second explorer for the same portal reuses what the first one found
+        OpenDataSoftCatExplorer(session).show_dataset_info("package-00003")
+
+    assert _v2_requests(server) == 1, f"Unexpected requests: {server.requests}"
+    assert explore.detect_base_path() == OpenDataSoftApiPaths.BASE_PATH_2, (
+        "Expected the explore base path to be remembered"
+    )
+
+
+def test_missing_dataset_does_not_fall_back(server):
+    """
+    Check that a 404 on the known base path is reported without trying the other path
+    """
+    with CatSession(
+        OpenDataSoftDataCatalogues.UK_POWER_NETWORKS_DNO, lazy=True, base_url=server.url
+    ) as session:
+        explore = OpenDataSoftCatExplorer(session)
+        explore.detect_base_path()
+        with pytest.raises(CatExplorerError):
+            explore.show_dataset_info("no-such-dataset")
+
+    assert _v2_requests(server) == 1, f"Unexpected requests: {server.requests}"
+
+
+def test_base_path_saved_to_disk(server, tmp_path):
+    """
+    Check that the base path file lets a new process skip detection
+    """
+    path_file = tmp_path / "ods_base_paths.json"
+    with CatSession(
+        OpenDataSoftDataCatalogues.UK_POWER_NETWORKS_DNO, lazy=True, base_url=server.url
+    ) as session:
+        OpenDataSoftCatExplorer(session, base_path_file=path_file).detect_base_path()
+        assert json.loads(path_file.read_text()) == {
+            server.url: OpenDataSoftApiPaths.BASE_PATH_2
+        }, "Expected the base path to be saved"
+
+        # Forget it in memory, as a new process would
+        explore_module._ODS_BASE_PATHS.pop(server.url)
+        server.requests.clear()
+        explore = OpenDataSoftCatExplorer(session, base_path_file=path_file)
+        explore.show_dataset_info("package-00001")
+
+    assert _v2_requests(server) == 0, f"Unexpected requests: {server.requests}"
+
+
+def test_unwritable_base_path_file_does_not_fail_requests(server, tmp_path):
+    """
+    Check that a base path file that can't be written is skipped rather than failing the request
+    """
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("")
+    with CatSession(
+        OpenDataSoftDataCatalogues.UK_POWER_NETWORKS_DNO, lazy=True, base_url=server.url
+    ) as session:
+        explore = OpenDataSoftCatExplorer(session, base_path_file=blocker / "paths.json")
+        info = explore.show_dataset_info("package-00001")
+
+    assert info, "The request should succeed even though the base path wasn't saved"
+    assert list(tmp_path.iterdir()) == [blocker], "No temporary files should be left behind"
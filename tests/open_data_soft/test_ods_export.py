@@ -0,0 +1,76 @@
+import pytest
+from HerdingCats.session.session import CatSession
+from HerdingCats.session.replay import ReplayStore
+from HerdingCats.explorer.explore import OpenDataSoftCatExplorer
+from HerdingCats.config.sources import OpenDataSoftDataCatalogues
+
+
+pytestmark = pytest.mark.mock_server(num_packages=320, payload_size=64)
+
+
+@pytest.mark.parametrize("export_format", ["csv", "parquet", "json"])
+def test_export_catalogue_in_one_request(server, export_format):
+    """
+    Check that every dataset and its metadata comes back from a single export request
+    """
+    with CatSession(
+        OpenDataSoftDataCatalogues.UK_POWER_NETWORKS_DNO, lazy=True, base_url=server.url
+    ) as session:
+        explore = OpenDataSoftCatExplorer(session)
+        table = explore.export_catalogue(export_format)
+
+    assert table.num_rows == 320, f"Expected 320 datasets, got {table.num_rows}"
+    assert {"dataset_id", "title", "description", "publisher", "modified"} <= set(
+        table.column_names
+    ), f"Expected every metadata column, got {table.column_names}"
+    assert table.column("dataset_id").to_pylist() == sorted(server.packages), (
+        "Expected one row per dataset"
+    )
+    assert server.requests[f"/api/v2/catalog/exports/{export_format}"] == 1, (
+        f"Expected a single request, got {server.requests}"
+    )
+    assert server.requests["/api/v2/catalog/datasets"] == 0, "Datasets should not be paged"
+
+
+def test_export_catalogue_as_dataframe(server):
+    """
+    Check that the export can be returned as a polars or pandas DataFrame
+    """
+    with CatSession(
+        OpenDataSoftDataCatalogues.UK_POWER_NETWORKS_DNO, lazy=True, base_url=server.url
+    ) as session:
+        explore = OpenDataSoftCatExplorer(session)
+        polars_df = explore.export_catalogue("parquet", df_type="polars")
+        pandas_df = explore.export_catalogue("parquet", df_type="pandas")
+
+    assert polars_df.height == 320, f"Expected 320 rows, got {polars_df.height}"
+    assert pandas_df["title"].tolist() == polars_df["title"].to_list(), (
+        "pandas and polars should hold the same rows"
+    )
+    with pytest.raises(ValueError):
+        explore.export_catalogue("xlsx")
+
+
+@pytest.mark.parametrize("export_format", ["csv", "parquet"])
+def test_export_catalogue_records_and_replays(server, export_format, tmp_path):
+    """
+    Check that a streamed export works while being recorded and when replayed offline
+    """
+    url = server.url
+    with CatSession(
+        OpenDataSoftDataCatalogues.UK_POWER_NETWORKS_DNO,
+        lazy=True,
+        base_url=url,
+        replay=ReplayStore(tmp_path, mode="record"),
+    ) as session:
+        recorded = OpenDataSoftCatExplorer(session).export_catalogue(export_format)
+
+    replay = ReplayStore(tmp_path, mode="replay")
+    with CatSession(
+        OpenDataSoftDataCatalogues.UK_POWER_NETWORKS_DNO, lazy=True, base_url=url, replay=replay
+    ) as session:
+        replayed = OpenDataSoftCatExplorer(session).export_catalogue(export_format)
+
+    assert recorded.num_rows == 320, f"Expected 320 recorded datasets, got {recorded.num_rows}"
+    assert replayed.equals(recorded), "Replayed export should match the recording"
+    assert replay.replayed == 1, f"Expected the export to be replayed, got {replay.replayed}"
@@ -0,0 +1,50 @@
+import pytest
+from HerdingCats.session.session import CatSession
+from HerdingCats.explorer.explore import OpenDataSoftCatExplorer
+from HerdingCats.config.sources import OpenDataSoftDataCatalogues
+
+
+pytestmark = pytest.mark.mock_server(num_packages=1050, payload_size=16, latency=0.05)
+
+
+def test_fetch_all_datasets_in_parallel(server):
+    """
+    Check that pages are requested concurrently and return the same datasets as a serial fetch
+    """
+    with CatSession(
+        OpenDataSoftDataCatalogues.UK_POWER_NETWORKS_DNO, lazy=True, base_url=server.url
+    ) as session:
+        explore = OpenDataSoftCatExplorer(session)
+        serial = explore.fetch_all_datasets(max_workers=1)
+        assert server.max_in_flight == 1, "A serial fetch should make one request at a time"
+
+        server.requests.clear()
+        parallel = explore.fetch_all_datasets(max_workers=8)
+
+    assert server.max_in_flight > 1, "Pages should be requested concurrently"
+    assert server.requests["/api/v2/catalog/datasets"] == 11, (
+        f"Expected every one of the 11 pages to be fetched once, got {server.requests}"
+    )
+    assert len(parallel) == 1050, f"Expected 1050 datasets, got {len(parallel)}"
+    assert list(parallel) == [p["title"] for p in server.packages.values()], (
+        "Datasets should be in catalogue order"
+    )
+    assert list(parallel.items()) == list(serial.items()), (
+        "Parallel fetch should return the same datasets in the same order"
+    )
+
+
+def test_iter_datasets_keeps_catalogue_order(server):
+    """
+    Check that pages fetched out of order are yielded in offset order
+    """
+    with CatSession(
+        OpenDataSoftDataCatalogues.UK_POWER_NETWORKS_DNO, lazy=True, base_url=server.url
+    ) as session:
+        explore = OpenDataSoftCatExplorer(session)
+        ids = [dataset["dataset_id"] for dataset in explore.iter_datasets(max_workers=4)]
+
+    assert ids == sorted(server.packages), "Datasets should be yielded in catalogue order"
+    assert server.requests["/api/v2/catalog/datasets"] == 11, (
+        f"Expected 11 page requests, got {server.requests}"
+    )
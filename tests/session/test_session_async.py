@@ -0,0 +1,155 @@
+import asyncio
+import json
+import threading
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from HerdingCats.session.async_session import AsyncCatSession
+from HerdingCats.session.retry import RetryPolicy
+from HerdingCats.explorer.async_explore import AsyncCkanCatExplorer
+from HerdingCats.config.sources import CkanDataCatalogues
+from HerdingCats.errors.errors import CatExplorerError
+from HerdingCats.testing import MockCatalogueServer
+
+pytest.importorskip("aiohttp")
+
+
+class CkanHandler(BaseHTTPRequestHandler):
+    """Serves package_show for any id, throttling the first request."""
+
+    calls = 0
+
+    def do_GET(self):
+        CkanHandler.calls += 1
+        if CkanHandler.calls == 1:
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+            self.end_headers()
+            return
+        package_id = parse_qs(urlparse(self.path).query)["id"][0]
+        body = {
+            "result": {
+                "name": package_id,
+                "resources": [
+                    {"name": package_id, "format": "CSV", "url": "http://x/a.csv"}
+                ],
+            }
+        }
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(json.dumps(body).encode())
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def ckan_url():
+    CkanHandler.calls = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CkanHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def test_async_show_package_info_many(ckan_url):
+    """
+    Check that many packages are fetched concurrently and throttled requests are retried
+    """
+    names = [f"package-{i}" for i in range(20)]
+
+    async def run():
+        retry = RetryPolicy(max_attempts=3, backoff_factor=0, jitter=0)
+        async with AsyncCatSession(
+            CkanDataCatalogues.UK_GOV,
+            max_concurrency=5,
+            retry=retry,
+            base_url=ckan_url,
+        ) as session:
+            explore = AsyncCkanCatExplorer(session)
+            return await explore.show_package_info_many(names)
+
+    try:
+        packages = asyncio.run(run())
+        assert sorted(packages) == sorted(names), "Every package should be returned"
+        assert packages["package-3"][0]["resource_format"] == "CSV", (
+            "Resources should match the sync explorer output"
+        )
+        assert CkanHandler.calls == 21, (
+            f"Expected 21 requests including one retry, but got {CkanHandler.calls}"
+        )
+    except Exception as e:
+        pytest.fail(f"Async package fetch failed: {str(e)}")
+
+
+class SlowRetryHandler(BaseHTTPRequestHandler):
+    """Throttles the first request for package-0 with a one second Retry-After."""
+
+    throttled = False
+
+    def do_GET(self):
+        package_id = parse_qs(urlparse(self.path).query)["id"][0]
+        if package_id == "package-0" and not SlowRetryHandler.throttled:
+            SlowRetryHandler.throttled = True
+            self.send_response(429)
+            self.send_header("Retry-After", "1")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(json.dumps({"result": {"name": package_id}}).encode())
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_async_backoff_releases_concurrency_slot():
+    """
+    Check that a request backing off does not hold its slot while it waits
+    """
+    SlowRetryHandler.throttled = False
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowRetryHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    async def run():
+        retry = RetryPolicy(max_attempts=2, backoff_factor=0, jitter=0)
+        async with AsyncCatSession(
+            CkanDataCatalogues.UK_GOV, max_concurrency=1, retry=retry, base_url=url
+        ) as session:
+            finished = []
+
+            async def fetch(name):
+                await session.get_json("/api/3/action/package_show", params={"id": name})
+                finished.append(name)
+
+            first = asyncio.create_task(fetch("package-0"))
+            await asyncio.sleep(0.2)
+            await asyncio.gather(first, fetch("package-1"))
+            return finished
+
+    try:
+        assert asyncio.run(run()) == ["package-1", "package-0"], (
+            "package-1 should finish while package-0 is backing off"
+        )
+    finally:
+        server.shutdown()
+
+
+def test_async_timeout_raises_explorer_error():
+    """
+    Check that a request timing out is reported as a CatExplorerError
+    """
+
+    async def run():
+        with MockCatalogueServer(num_packages=5, latency=1.0) as server:
+            async with AsyncCatSession(
+                CkanDataCatalogues.UK_GOV, timeout=0.2, base_url=server.url
+            ) as session:
+                await AsyncCkanCatExplorer(session).get_package_list()
+
+    with pytest.raises(CatExplorerError):
+        asyncio.run(run())
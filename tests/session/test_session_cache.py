@@ -0,0 +1,92 @@
+import threading
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from HerdingCats.session.session import CatSession
+from HerdingCats.session.cache import HttpCache
+from HerdingCats.config.sources import CkanDataCatalogues
+
+
+class ETagHandler(BaseHTTPRequestHandler):
+    """Serves a fixed body with an ETag and answers matching conditional requests with 304."""
+
+    full_responses = 0
+    not_modified = 0
+
+    def do_GET(self):
+        if self.headers.get("If-None-Match") == '"v1"':
+            ETagHandler.not_modified += 1
+            self.send_response(304)
+            self.send_header("ETag", '"v1"')
+            self.end_headers()
+            return
+        ETagHandler.full_responses += 1
+        body = b'{"result": ["a", "b"]}' + b" " * 100
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def etag_url():
+    ETagHandler.full_responses = 0
+    ETagHandler.not_modified = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ETagHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def test_cache_serves_fresh_responses_from_disk(etag_url, tmp_path):
+    """
+    Check that a fresh cached response is served without a network request
+    """
+    cache = HttpCache(tmp_path / "cache.sqlite", ttl=3600)
+    with CatSession(CkanDataCatalogues.UK_GOV, lazy=True, cache=cache) as session:
+        first = session.session.get(f"{etag_url}/package_list")
+        second = session.session.get(f"{etag_url}/package_list")
+
+    assert first.json() == second.json(), "Cached body should match the original"
+    assert getattr(second, "from_cache", False), "Second response should come from the cache"
+    assert ETagHandler.full_responses == 1, (
+        f"Expected 1 network request, but got {ETagHandler.full_responses}"
+    )
+    assert cache.stats()["hits"] == 1, "Expected one cache hit"
+
+
+def test_cache_revalidates_stale_responses(etag_url, tmp_path):
+    """
+    Check that stale entries are revalidated with If-None-Match and a 304 reuses the cached body
+    """
+    cache = HttpCache(tmp_path / "cache.sqlite", ttl=0)
+    with CatSession(CkanDataCatalogues.UK_GOV, lazy=True, cache=cache) as session:
+        session.session.get(f"{etag_url}/package_list")
+        response = session.session.get(f"{etag_url}/package_list")
+
+    assert response.status_code == 200, (
+        f"Expected a 200 rebuilt from the cache, but got {response.status_code}"
+    )
+    assert response.json()["result"] == ["a", "b"], "Cached body should be returned"
+    assert ETagHandler.not_modified == 1, "Second request should have been a 304"
+    assert cache.stats()["revalidated"] == 1, "Expected one revalidation"
+
+
+def test_cache_evicts_least_recently_used(etag_url, tmp_path):
+    """
+    Check that the oldest entries are evicted once the cache is over its size limit
+    """
+    cache = HttpCache(tmp_path / "cache.sqlite", ttl=3600, max_size=250)
+    with CatSession(CkanDataCatalogues.UK_GOV, lazy=True, cache=cache) as session:
+        for name in ("a", "b", "c"):
+            session.session.get(f"{etag_url}/{name}")
+
+    stats = cache.stats()
+    assert stats["entries"] == 2, f"Expected 2 entries, but got {stats['entries']}"
+    assert stats["size"] <= 250, "Cache should fit within max_size"
+    assert cache.get(f"GET {etag_url}/a") is None, "Least recently used entry should be evicted"
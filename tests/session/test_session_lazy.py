@@ -0,0 +1,37 @@
+import time
+import pytest
+from HerdingCats.session import session as session_module
+from HerdingCats.session.session import CatSession
+from HerdingCats.config.sources import CkanDataCatalogues
+
+
+def test_lazy_session_creation():
+    """
+    Check that a lazy session can be created and started without any network I/O
+    """
+    try:
+        with CatSession(CkanDataCatalogues.UK_GOV, lazy=True) as session:
+            assert session.session is not None, "Session object should be created"
+            assert session.base_url == "https://data.gov.uk", (
+                "Lazy session should have the correct base URL"
+            )
+            assert not session._probed, "Lazy session should not probe on creation"
+    except Exception as e:
+        pytest.fail(f"Failed to create lazy CatSession: {str(e)}")
+
+
+def test_cached_probe_is_reused():
+    """
+    Check that a recent successful probe of a catalogue is reused by new sessions
+    """
+    base_url = "https://data.humdata.org"
+    session_module._PROBE_CACHE[base_url] = time.monotonic()
+    try:
+        with CatSession(
+            CkanDataCatalogues.HUMANITARIAN_DATA_STORE, probe_ttl=60
+        ) as session:
+            assert session._probed, "Session should reuse the cached probe"
+    except Exception as e:
+        pytest.fail(f"Cached probe was not reused: {str(e)}")
+    finally:
+        session_module._PROBE_CACHE.pop(base_url, None)
@@ -0,0 +1,120 @@
+import time
+import pytest
+from HerdingCats.session.session import CatSession
+from HerdingCats.session.rate_limit import RateLimit, RateLimiter
+from HerdingCats.session.retry import RetryPolicy
+from HerdingCats.config.sources import CkanDataCatalogues
+from HerdingCats.testing import MockCatalogueServer
+
+
+def test_token_bucket_throttles_after_burst():
+    """
+    Check that requests beyond the burst are spaced out at the configured rate
+    """
+    limiter = RateLimiter()
+    limiter.configure("example.org", RateLimit(requests_per_second=20, burst=2))
+
+    start = time.monotonic()
+    waits = [limiter.acquire("example.org") for _ in range(4)]
+    elapsed = time.monotonic() - start
+
+    assert waits[:2] == [0.0, 0.0], "Burst requests should not wait"
+    assert elapsed >= 0.09, f"Expected throttling of ~0.1s, only took {elapsed:.3f}s"
+
+    stats = limiter.stats("example.org")["example.org"]
+    assert stats["requests"] == 4, "Every request should be counted"
+    assert stats["throttled_requests"] == 2, "Two requests should have been throttled"
+    assert stats["total_wait"] > 0, "Time spent waiting should be recorded"
+
+
+def test_unlimited_host_is_not_throttled():
+    """
+    Check that hosts without a configured limit never wait
+    """
+    limiter = RateLimiter()
+    assert limiter.acquire("example.org") == 0.0
+    assert limiter.stats() == {}, "No metrics should be kept for unlimited hosts"
+
+
+def test_sessions_share_host_budget():
+    """
+    Check that sessions to the same host share a single rate limiter bucket
+    """
+    limiter = RateLimiter()
+    rate_limit = RateLimit(requests_per_second=5, burst=1)
+    try:
+        first = CatSession(
+            CkanDataCatalogues.UK_GOV,
+            lazy=True,
+            rate_limit=rate_limit,
+            rate_limiter=limiter,
+        )
+        second = CatSession(
+            CkanDataCatalogues.UK_GOV,
+            lazy=True,
+            rate_limit=rate_limit,
+            rate_limiter=limiter,
+        )
+        limiter.acquire(first.host)
+        limiter.acquire(second.host)
+        assert second.rate_limit_stats()["throttled_requests"] == 1, (
+            "Second request to the same host should be throttled"
+        )
+    except Exception as e:
+        pytest.fail(f"Sessions did not share the host budget: {str(e)}")
+
+
+def test_retries_take_a_token_each(monkeypatch):
+    """
+    Check that retries made after a 429 go through the host's token bucket too
+    """
+    limiter = RateLimiter()
+    retry = RetryPolicy(max_attempts=3, backoff_factor=0, jitter=0)
+    with MockCatalogueServer(num_packages=5) as server:
+        handle = server.handle
+        calls = []
+
+        def throttled(path, query):
+            calls.append(path)
+            if len(calls) <= 2:
+                return 429, "text/plain", b""
+            return handle(path, query)
+
+        monkeypatch.setattr(server, "handle", throttled)
+        with CatSession(
+            CkanDataCatalogues.UK_GOV,
+            lazy=True,
+            base_url=server.url,
+            retry=retry,
+            rate_limit=RateLimit(requests_per_second=1000, burst=10),
+            rate_limiter=limiter,
+        ) as session:
+            response = session.session.get(server.url + "/api/3/action/package_list")
+            stats = session.rate_limit_stats()
+
+    assert response.status_code == 200, f"Expected the retries to succeed, got {response}"
+    assert stats["requests"] == 3, f"Every attempt should take a token, got {stats}"
+
+
+def test_rate_limit_only_applies_to_catalogue_host():
+    """
+    Check that requests to other hosts, e.g. file downloads, are not throttled by the portal's limit
+    """
+    limiter = RateLimiter()
+    with MockCatalogueServer(num_packages=5) as server:
+        with CatSession(
+            CkanDataCatalogues.UK_GOV,
+            lazy=True,
+            base_url=server.url,
+            rate_limit=RateLimit(requests_per_second=1, burst=1),
+            rate_limiter=limiter,
+        ) as session:
+            for _ in range(3):
+                response = session.session.get(
+                    f"http://localhost:{server.port}/files/package-00000.csv"
+                )
+
+    assert set(limiter.stats()) == {"127.0.0.1"}, (
+        f"Only the catalogue's host should be limited, got {limiter.stats()}"
+    )
+    assert response.status_code == 200, "Downloads from another host should succeed"
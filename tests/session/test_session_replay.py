@@ -0,0 +1,33 @@
+import pytest
+import requests
+from HerdingCats.session.session import CatSession
+from HerdingCats.session.replay import ReplayStore
+from HerdingCats.explorer.explore import CkanCatExplorer
+from HerdingCats.config.sources import CkanDataCatalogues
+from HerdingCats.testing import MockCatalogueServer
+
+
+def test_recorded_responses_replay_offline(tmp_path):
+    """
+    Check that responses recorded against a server are served back once it is gone
+    """
+    with MockCatalogueServer(num_packages=25) as server:
+        url = server.url
+        with CatSession(
+            CkanDataCatalogues.UK_GOV,
+            base_url=url,
+            replay=ReplayStore(tmp_path, mode="record"),
+        ) as session:
+            recorded = CkanCatExplorer(session).show_package_info("package-00003")
+
+    replay = ReplayStore(tmp_path, mode="replay")
+    with CatSession(CkanDataCatalogues.UK_GOV, base_url=url, replay=replay) as session:
+        replayed = CkanCatExplorer(session).show_package_info("package-00003")
+
+        with pytest.raises(requests.ConnectionError):
+            session.session.get(url + "/api/3/action/package_list")
+
+    assert replayed == recorded, "Replayed metadata should match the recording"
+    assert replay.replayed == 2, (
+        f"Expected the health probe and package_show to be replayed, got {replay.replayed}"
+    )
@@ -0,0 +1,66 @@
+import threading
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from HerdingCats.session.session import CatSession
+from HerdingCats.session.retry import RetryPolicy
+from HerdingCats.config.sources import OpenDataSoftDataCatalogues
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """Returns a 429 with Retry-After for the first two requests, then a 200."""
+
+    calls = 0
+
+    def do_GET(self):
+        FlakyHandler.calls += 1
+        if FlakyHandler.calls <= 2:
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(b'{"total_count": 0, "datasets": []}')
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def flaky_url():
+    FlakyHandler.calls = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+
+
+def test_retry_recovers_from_throttling(flaky_url):
+    """
+    Check that throttled requests are retried until they succeed
+    """
+    retry = RetryPolicy(max_attempts=3, backoff_factor=0, jitter=0)
+    with CatSession(
+        OpenDataSoftDataCatalogues.UK_POWER_NETWORKS_DNO, lazy=True, retry=retry
+    ) as session:
+        response = session.session.get(flaky_url)
+        assert response.status_code == 200, (
+            f"Expected status code 200 after retries, but got {response.status_code}"
+        )
+        assert FlakyHandler.calls == 3, "Request should have been attempted 3 times"
+
+
+def test_retry_returns_last_response_when_exhausted(flaky_url):
+    """
+    Check that the final error response is returned once attempts run out
+    """
+    retry = RetryPolicy(max_attempts=2, backoff_factor=0, jitter=0)
+    with CatSession(
+        OpenDataSoftDataCatalogues.UK_POWER_NETWORKS_DNO, lazy=True, retry=retry
+    ) as session:
+        response = session.session.get(flaky_url)
+        assert response.status_code == 429, (
+            f"Expected final status code 429, but got {response.status_code}"
+        )
@@ -0,0 +1,39 @@
+import socket
+import pytest
+from HerdingCats.session.session import CatSession
+from HerdingCats.session.transport import CatHTTPAdapter, TransportConfig
+from HerdingCats.config.sources import CkanDataCatalogues
+
+
+def test_transport_config_applied():
+    """
+    Check that the transport settings are applied to the session's adapter
+    """
+    transport = TransportConfig(pool_connections=4, pool_maxsize=32, timeout=(3, 20))
+    try:
+        with CatSession(
+            CkanDataCatalogues.UK_GOV, lazy=True, transport=transport
+        ) as session:
+            adapter = session.session.get_adapter(session.base_url)
+            assert isinstance(adapter, CatHTTPAdapter), (
+                "CatSession should mount a CatHTTPAdapter"
+            )
+            assert adapter._pool_maxsize == 32, "Pool size per host should be applied"
+            assert adapter._pool_connections == 4, "Max pools should be applied"
+
+            socket_options = adapter.poolmanager.connection_pool_kw["socket_options"]
+            assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options, (
+                "TCP keep-alive should be enabled by default"
+            )
+            assert adapter.transport.timeout == (3, 20), "Default timeout should be kept"
+    except Exception as e:
+        pytest.fail(f"Transport config was not applied: {str(e)}")
+
+
+def test_transport_without_keep_alive():
+    """
+    Check that disabling keep-alive closes connections after each request
+    """
+    transport = TransportConfig(keep_alive=False)
+    with CatSession(CkanDataCatalogues.UK_GOV, lazy=True, transport=transport) as session:
+        assert session.session.headers["Connection"] == "close"
@@ -0,0 +1,84 @@
+import pytest
+import requests
+
+from HerdingCats.session.session import CatSession
+from HerdingCats.explorer.explore import CkanCatExplorer
+from HerdingCats.config.sources import CkanDataCatalogues
+from HerdingCats.utils.json_decoder import JsonDecoder, set_json_backend
+from HerdingCats.utils.lazy_imports import LazyModule
+
+BACKENDS = [
+    pytest.param(
+        backend,
+        marks=pytest.mark.skipif(
+            backend != "json" and not LazyModule(backend).is_available(),
+            reason=f"{backend} is not installed",
+        ),
+    )
+    for backend in ("json", "orjson", "msgspec")
+]
+
+
+pytestmark = pytest.mark.mock_server(num_packages=25, payload_size=32)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backends_give_the_same_results(server, backend):
+    """
+    Check that every backend produces the same explorer output as the standard library
+    """
+    try:
+        set_json_backend("json")
+        with CatSession(CkanDataCatalogues.UK_GOV, lazy=True, base_url=server.url) as session:
+            explore = CkanCatExplorer(session)
+            expected_list = explore.get_package_list()
+            expected_rows = list(explore.harvest_package_resources(page_size=10))
+
+            set_json_backend(backend)
+            assert explore.get_package_list() == expected_list, (
+                f"{backend} package_list differs from json"
+            )
+            assert list(explore.harvest_package_resources(page_size=10)) == expected_rows, (
+                f"{backend} harvest rows differ from json"
+            )
+    finally:
+        set_json_backend("auto")
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_invalid_json_raises_requests_error(backend):
+    """
+    Check that invalid JSON raises the same exception type as response.json()
+    """
+    response = requests.Response()
+    response._content = b"{not json"
+    response.encoding = "utf-8"
+
+    with pytest.raises(requests.RequestException):
+        JsonDecoder(backend).decode_response(response)
+
+
+def test_schema_mismatch_falls_back_to_full_decode():
+    """
+    Check that a payload not matching its schema is still decoded
+    """
+    if not LazyModule("msgspec").is_available():
+        pytest.skip("msgspec is not installed")
+
+    from HerdingCats.explorer.schemas import CkanPackageList
+
+    decoder = JsonDecoder("msgspec")
+    assert decoder.decode(b'{"help": "x", "result": ["a"]}', CkanPackageList) == {
+        "result": ["a"]
+    }, "Schema should keep only the listed fields"
+    assert decoder.decode(b'{"result": [1, 2]}', CkanPackageList) == {
+        "result": [1, 2]
+    }, "Mismatched payloads should be decoded in full"
+
+
+def test_unknown_backend_is_rejected():
+    """
+    Check that an unknown backend name raises ValueError
+    """
+    with pytest.raises(ValueError):
+        JsonDecoder("simdjson")
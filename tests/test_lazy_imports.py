@@ -0,0 +1,19 @@
+import subprocess
+import sys
+
+
+def test_import_does_not_load_heavy_dependencies():
+    """
+    Check that importing HerdingCats does not import the DataFrame, DuckDB, S3 or async libraries
+    """
+    heavy = ("pandas", "polars", "duckdb", "boto3", "botocore", "pyarrow", "aiohttp")
+    code = (
+        "import sys, HerdingCats; "
+        f"print(','.join(m for m in {heavy!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "", (
+        f"Heavy modules imported eagerly: {result.stdout.strip()}"
+    )